@@ -55,6 +55,7 @@ ADDING NEW TOOLS (3 Steps)
    setting = "value"
 """
 
+import asyncio
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, Optional
 import time
@@ -217,6 +218,7 @@ class AIAssistant:
 
         # MCP session manager (initialized in async initialize())
         self._mcp_session_manager: Optional[MCPSessionManager] = None
+        self._mcp_session_warm_task: Optional[asyncio.Task] = None
         self._mcp_session_config = parse_mcp_session_config(self.config._config)
 
         # Load local tools (sync)
@@ -314,6 +316,8 @@ class AIAssistant:
 
         # Start background persist if configured
         await self._history_manager.start_background_persist()
+        if self._history_manager.config.summarization.enabled:
+            await self._history_manager.load_tokenizer()
 
         # Initialize MCP session manager with cache/persistence from history manager
         if self._mcp_session_config.enabled:
@@ -324,6 +328,9 @@ class AIAssistant:
             )
             # Attach session manager to MCP manager for stateful tool wrapping
             self._mcp_manager.set_session_manager(self._mcp_session_manager)
+            if self._mcp_session_config.warm_sessions > 0:
+                # Load recently active sessions without delaying startup
+                self._mcp_session_warm_task = asyncio.create_task(self._warm_mcp_sessions())
             logger.info("MCP session manager initialized")
 
         # Register health checks
@@ -877,8 +884,29 @@ class AIAssistant:
             ]
         )
 
+    async def _warm_mcp_sessions(self) -> None:
+        """Background startup task loading recently active MCP sessions."""
+        try:
+            await self._mcp_session_manager.warm(self._mcp_session_config.warm_sessions)
+        except Exception as e:
+            logger.warning("Failed to warm MCP sessions", error=str(e))
+
     async def close(self) -> None:
         """Close resources and cleanup."""
+        # Stop warming so it cannot repopulate the session manager after close
+        if self._mcp_session_warm_task:
+            self._mcp_session_warm_task.cancel()
+            try:
+                await self._mcp_session_warm_task
+            except asyncio.CancelledError:
+                pass
+            self._mcp_session_warm_task = None
+
+        # Close MCP session manager (persists sessions) while the cache and
+        # persistence it shares with the history manager are still open
+        if self._mcp_session_manager:
+            await self._mcp_session_manager.close()
+
         # Close chat history manager (persists active sessions)
         if self._history_manager:
             await self._history_manager.close()
@@ -27,12 +27,13 @@ except ImportError:
 # Import D365 MCP components
 try:
     from src.mcp.d365_oauth import D365TokenProvider
-    from src.mcp.d365_tool import D365MCPTool
+    from src.mcp.d365_tool import D365MCPTool, close_shared_clients
     D365_MCP_AVAILABLE = True
 except ImportError:
     D365_MCP_AVAILABLE = False
     D365TokenProvider = None
     D365MCPTool = None
+    close_shared_clients = None
 
 # Import D365 config models
 try:
@@ -134,6 +135,10 @@ class MCPManager:
         
         self._exit_stack = AsyncExitStack()
         await self._exit_stack.__aenter__()
+
+        # Registered first so it runs last, after every D365 tool has closed
+        if D365_MCP_AVAILABLE:
+            self._exit_stack.push_async_callback(close_shared_clients)
         
         for config in mcp_configs:
             # Skip disabled MCPs
@@ -370,14 +375,28 @@ class MCPManager:
                         token_refresh_buffer_minutes=oauth_config.get(
                             "token_refresh_buffer_minutes", 5
                         ),
+                        share_credential=oauth_config.get("share_credential", False),
+                        token_cache_path=oauth_config.get("token_cache_path"),
                     ),
                     timeout_connect=config.get("timeout_connect", 10.0),
                     timeout_read=config.get("timeout_read", 60.0),
                     timeout_write=config.get("timeout_write", 10.0),
-                    timeout_pool=config.get("timeout_pool", 5.0),
+                    timeout_pool=config.get("timeout_pool", 1.0),
+                    max_connections=config.get("max_connections", 1000),
+                    max_keepalive_connections=config.get("max_keepalive_connections", 100),
+                    keepalive_expiry=config.get("keepalive_expiry", 60.0),
+                    mcp_pool_size=config.get("mcp_pool_size", 0),
+                    mcp_pool_idle_timeout=config.get("mcp_pool_idle_timeout", 300.0),
+                    response_cache_tools=config.get(
+                        "response_cache_tools", ["find_menu_item"]
+                    ),
+                    response_cache_ttl=config.get("response_cache_ttl", 60.0),
                     max_retries=config.get("max_retries", 3),
                     retry_backoff_base=config.get("retry_backoff_base", 1.0),
                     retry_backoff_max=config.get("retry_backoff_max", 30.0),
+                    retryable_status_codes=config.get(
+                        "retryable_status_codes", [502, 503, 504]
+                    ),
                     health_check_enabled=config.get("health_check_enabled", True),
                     health_check_interval=config.get("health_check_interval", 60),
                     circuit_breaker_failure_threshold=config.get(
@@ -445,6 +464,7 @@ class MCPManager:
             max_retries=config.get("max_retries", 3),
             retry_backoff_base=config.get("retry_backoff_base", 1.0),
             retry_backoff_max=config.get("retry_backoff_max", 30.0),
+            retryable_status_codes=config.get("retryable_status_codes", (502, 503, 504)),
             circuit_breaker_failure_threshold=config.get(
                 "circuit_breaker_failure_threshold", 5
             ),
@@ -456,7 +476,9 @@ class MCPManager:
         # Connect and enter async context
         await d365_tool.connect()
 
-        # Register cleanup with exit stack
+        # Register cleanup with exit stack; the tool doesn't close an injected
+        # token provider, so it is closed after the tool
+        self._exit_stack.push_async_callback(token_provider.close)
         self._exit_stack.push_async_callback(d365_tool.close)
 
         # Note: D365MCPTool handles session management internally via its
@@ -10,6 +10,7 @@ taking precedence on name conflicts.
 """
 import json
 import inspect
+import mmap
 import structlog
 from pathlib import Path
 from typing import Dict, Any, Callable, List, Optional, Set
@@ -21,8 +22,31 @@ from .decorators import (
     load_tool_modules,
 )
 
+# orjson parses raw bytes directly; fall back to the stdlib parser if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
+# Tool configs larger than this are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+def _read_json_file(file_path: Path) -> Any:
+    """Parse a JSON file from raw bytes without decoding it to text first."""
+    with open(file_path, "rb") as f:
+        if file_path.stat().st_size > MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = mm[:]
+        else:
+            data = f.read()
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
 
 def load_tool_configs(config_dir: str = "config/tools") -> Dict[str, Dict[str, Any]]:
     """Load all tool configurations from directory."""
@@ -38,9 +62,8 @@ def load_tool_configs(config_dir: str = "config/tools") -> Dict[str, Dict[str, A
         tool_name = file_path.stem
         
         try:
-            with open(file_path) as f:
-                configs[tool_name] = json.load(f)
-        except json.JSONDecodeError as e:
+            configs[tool_name] = _read_json_file(file_path)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.warning(
                 "Failed to parse tool config file (invalid JSON)",
                 tool_name=tool_name,
@@ -11,9 +11,11 @@ Enhanced features:
 - Expression evaluation for dynamic workflow paths
 """
 
+import json
 import re
 import operator
-from typing import Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
 import structlog
@@ -33,11 +35,113 @@ except ImportError:
         WorkflowBuilder = None
         SequentialBuilder = None
 
+# orjson is faster for multi-KB agent outputs; fall back to the stdlib parser
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 if TYPE_CHECKING:
     from src.models.providers import ModelRegistry
 
 logger = structlog.get_logger(__name__)
 
+# Splitters for compound conditions
+_AND_SPLIT = re.compile(r'\s+and\s+', re.IGNORECASE)
+_OR_SPLIT = re.compile(r'\s+or\s+', re.IGNORECASE)
+
+
+def _always_true(output: Dict[str, Any]) -> bool:
+    """Predicate for edges without a condition."""
+    return True
+
+
+def _in(a: Any, b: Any) -> bool:
+    return a in b
+
+
+def _not_in(a: Any, b: Any) -> bool:
+    return a not in b
+
+
+def _contains(a: Any, b: Any) -> bool:
+    return b in a
+
+
+# Comparison operators, indexed by the op codes below (see OPERATORS)
+_OPS = (
+    operator.eq,
+    operator.ne,
+    operator.gt,
+    operator.ge,
+    operator.lt,
+    operator.le,
+    _in,
+    _not_in,
+    _contains,
+)
+
+_OP_CODES = {
+    '==': 0,
+    '!=': 1,
+    '>': 2,
+    '>=': 3,
+    '<': 4,
+    '<=': 5,
+    'in': 6,
+    'not in': 7,
+    'contains': 8,
+}
+
+
+# Source templates for each op code; {a} is the left operand, {b} the right
+_OP_TEMPLATES = (
+    '({a} == {b})',
+    '({a} != {b})',
+    '({a} > {b})',
+    '({a} >= {b})',
+    '({a} < {b})',
+    '({a} <= {b})',
+    '({a} in {b})',
+    '({a} not in {b})',
+    '({b} in {a})',
+)
+
+
+class _ConditionSource:
+    """Globals and temporary names for one generated condition function."""
+
+    def __init__(self, text_getter: Callable[[Dict[str, Any]], str]):
+        self.namespace: Dict[str, Any] = {
+            "__builtins__": {},
+            "isinstance": isinstance,
+            "dict": dict,
+            "_text": text_getter,
+        }
+        self._count = 0
+
+    def bind(self, value: Any) -> str:
+        """Bind a constant into the function globals and return its name."""
+        name = f"_c{self._count}"
+        self._count += 1
+        self.namespace[name] = value
+        return name
+
+    def temp(self) -> str:
+        """Return a fresh local variable name."""
+        name = f"_v{self._count}"
+        self._count += 1
+        return name
+
+
+# Keyword literals accepted on the right-hand side of a condition
+_KEYWORD_VALUES = {
+    'true': True,
+    'false': False,
+    'none': None,
+    'null': None,
+}
+
 
 class ConditionEvaluator:
     """
@@ -54,17 +158,7 @@ class ConditionEvaluator:
     """
 
     # Supported comparison operators
-    OPERATORS = {
-        '==': operator.eq,
-        '!=': operator.ne,
-        '>': operator.gt,
-        '>=': operator.ge,
-        '<': operator.lt,
-        '<=': operator.le,
-        'in': lambda a, b: a in b,
-        'not in': lambda a, b: a not in b,
-        'contains': lambda a, b: b in a,
-    }
+    OPERATORS = {op: _OPS[code] for op, code in _OP_CODES.items()}
 
     # Pattern to parse condition expressions
     # Matches: output.field op value, value in output.field, etc.
@@ -74,9 +168,44 @@ class ConditionEvaluator:
         re.IGNORECASE
     )
 
+    # Maximum number of compiled conditions kept in the LRU cache
+    CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize the condition evaluator."""
-        self._cache: Dict[str, Callable] = {}
+        self._cache: "OrderedDict[str, Callable[[Dict[str, Any]], bool]]" = OrderedDict()
+        # Lowercased text of the output currently being routed (output, text)
+        self._text_view: Optional[Tuple[Dict[str, Any], str]] = None
+
+    def compile(self, condition: Optional[str]) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile a condition expression into a reusable predicate.
+
+        The expression is parsed once into a generated function (see
+        compile_to_source). Compiled predicates are kept in a bounded LRU
+        cache keyed by condition string, so identical conditions across
+        edges share one function.
+
+        Args:
+            condition: The condition expression to compile
+
+        Returns:
+            Callable taking the output dict and returning True if the condition is met
+        """
+        if not condition:
+            return _always_true
+
+        condition = condition.strip()
+        compiled = self._cache.get(condition)
+        if compiled is not None:
+            self._cache.move_to_end(condition)
+            return compiled
+
+        compiled = self.compile_to_source(condition)
+        self._cache[condition] = compiled
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return compiled
 
     def evaluate(
         self,
@@ -86,31 +215,118 @@ class ConditionEvaluator:
         """
         Evaluate a condition against an agent's output.
 
+        Dispatches to evaluate_str or evaluate_dict; callers that know the
+        output type can call those directly.
+
         Args:
             condition: The condition expression to evaluate
             output: The agent's output (string or dict)
 
+        Returns:
+            True if condition is met, False otherwise
+        """
+        if isinstance(output, str):
+            return self.evaluate_str(condition, output)
+        return self.evaluate_dict(condition, output)
+
+    def evaluate_dict(self, condition: str, output: Dict[str, Any]) -> bool:
+        """
+        Evaluate a condition against a dict output.
+
+        Args:
+            condition: The condition expression to evaluate
+            output: The agent's output as a dict
+
         Returns:
             True if condition is met, False otherwise
         """
         if not condition:
             return True  # No condition = always true
 
-        condition = condition.strip()
+        self._text_view = None
+        return self.run(condition, self.compile(condition), output)
 
-        # Try to parse the output as a dict if it's a string that looks like JSON
+    def evaluate_str(self, condition: str, output: str) -> bool:
+        """
+        Evaluate a condition against a string output.
+
+        Args:
+            condition: The condition expression to evaluate
+            output: The agent's output as a string (JSON or plain text)
+
+        Returns:
+            True if condition is met, False otherwise
+        """
+        if not condition:
+            return True  # No condition = always true
+
+        return self.run(condition, self.compile(condition), self.parse_output(output))
+
+    def prepare_output(self, output: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Prepare an agent output for one routing decision.
+
+        String outputs are parsed once, and the cached text view from any
+        previous decision is discarded. The returned dict can then be passed
+        to every compiled condition evaluated for this output.
+
+        Args:
+            output: The agent's output (string or dict)
+
+        Returns:
+            The output as a dict
+        """
         if isinstance(output, str):
+            return self.parse_output(output)
+
+        self._text_view = None
+        return output
+
+    def parse_output(self, output: str) -> Dict[str, Any]:
+        """
+        Parse a string agent output for one routing decision.
+
+        Args:
+            output: The agent's string output
+
+        Returns:
+            The parsed JSON object, or the text wrapped as {"text": ..., "raw": ...}
+        """
+        self._text_view = None
+
+        # Try to parse the output as a dict if it's a string that looks like JSON
+        if output.lstrip().startswith('{'):
             try:
-                import json
-                output_dict = json.loads(output)
+                output_dict = _json_loads(output)
                 if isinstance(output_dict, dict):
-                    output = output_dict
-            except (json.JSONDecodeError, TypeError):
-                # Wrap string output in a dict for consistent access
-                output = {"text": output, "raw": output}
-
+                    return output_dict
+            except (ValueError, TypeError):
+                pass
+
+        # Wrap string output in a dict for consistent access
+        output_dict = {"text": output, "raw": output}
+        self._text_view = (output_dict, output.lower())
+        return output_dict
+
+    def _output_text(self, output: Dict[str, Any]) -> str:
+        """Get the lowercased text of an output, computed once per routing decision."""
+        view = self._text_view
+        if view is not None and view[0] is output:
+            return view[1]
+
+        text = str(output.get('text', output.get('raw', str(output)))).lower()
+        self._text_view = (output, text)
+        return text
+
+    def run(
+        self,
+        condition: str,
+        compiled: Callable[[Dict[str, Any]], bool],
+        output: Dict[str, Any]
+    ) -> bool:
+        """Run a compiled condition, returning False if evaluation fails."""
         try:
-            return self._evaluate_condition(condition, output)
+            return compiled(output)
         except Exception as e:
             logger.warning(
                 "Condition evaluation failed, returning False",
@@ -119,20 +335,47 @@ class ConditionEvaluator:
             )
             return False
 
-    def _evaluate_condition(
-        self,
-        condition: str,
-        output: Dict[str, Any]
-    ) -> bool:
-        """Internal condition evaluation."""
-        # Handle logical operators (and, or)
-        if ' and ' in condition.lower():
-            parts = re.split(r'\s+and\s+', condition, flags=re.IGNORECASE)
-            return all(self._evaluate_condition(p.strip(), output) for p in parts)
+    def compile_to_source(self, condition: str) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Generate a specialized Python function for a condition expression.
 
-        if ' or ' in condition.lower():
-            parts = re.split(r'\s+or\s+', condition, flags=re.IGNORECASE)
-            return any(self._evaluate_condition(p.strip(), output) for p in parts)
+        The whole expression, including and/or clauses, is emitted as a single
+        function using native comparison operators and inline dict walks, and
+        compiled with exec. Condition values and field names are bound through
+        the function's globals and never interpolated into the generated source.
+
+        Args:
+            condition: The condition expression to compile
+
+        Returns:
+            Callable taking the output dict and returning True if the condition is met
+        """
+        source = _ConditionSource(self._output_text)
+        expr = self._emit_condition(condition.strip(), source)
+
+        code = compile(
+            f"def _condition(out):\n    return {expr}\n",
+            f"<condition {condition!r}>",
+            "exec",
+        )
+        exec(code, source.namespace)
+
+        func = source.namespace["_condition"]
+        func.__doc__ = condition
+        return func
+
+    def _emit_condition(self, condition: str, source: "_ConditionSource") -> str:
+        """Emit the Python expression source for a condition."""
+        cond_lower = condition.lower()
+
+        # Handle logical operators (and, or) with Python's own short-circuiting
+        if ' and ' in cond_lower:
+            parts = [self._emit_condition(p.strip(), source) for p in _AND_SPLIT.split(condition)]
+            return "(" + " and ".join(parts) + ")"
+
+        if ' or ' in cond_lower:
+            parts = [self._emit_condition(p.strip(), source) for p in _OR_SPLIT.split(condition)]
+            return "(" + " or ".join(parts) + ")"
 
         # Parse the condition
         match = self.CONDITION_PATTERN.match(condition)
@@ -142,50 +385,46 @@ class ConditionEvaluator:
 
             # Pattern 1: output.field op value
             if groups[0] is not None:
-                field_path = groups[0]
-                op_str = groups[1].lower()
-                value_str = groups[2].strip()
-
-                field_value = self._get_field_value(output, field_path)
-                compare_value = self._parse_value(value_str)
-
-                op_func = self.OPERATORS.get(op_str)
-                if op_func:
-                    return op_func(field_value, compare_value)
+                op_code = _OP_CODES.get(groups[1].lower())
+                if op_code is not None:
+                    return _OP_TEMPLATES[op_code].format(
+                        a=self._emit_field(groups[0], source),
+                        b=source.bind(self._parse_value(groups[2].strip())),
+                    )
 
             # Pattern 2: value in output.field
             elif groups[3] is not None:
-                value_str = groups[3].strip()
-                op_str = groups[4].lower()
-                field_path = groups[5]
-
-                compare_value = self._parse_value(value_str)
-                field_value = self._get_field_value(output, field_path)
-
-                op_func = self.OPERATORS.get(op_str)
-                if op_func:
-                    return op_func(compare_value, field_value)
+                op_code = _OP_CODES.get(groups[4].lower())
+                if op_code is not None:
+                    return _OP_TEMPLATES[op_code].format(
+                        a=source.bind(self._parse_value(groups[3].strip())),
+                        b=self._emit_field(groups[5], source),
+                    )
 
         # Fallback: check if condition substring exists in output text
-        output_text = str(output.get('text', output.get('raw', str(output))))
-        return condition.lower() in output_text.lower()
+        return f"({source.bind(cond_lower)} in _text(out))"
 
-    def _get_field_value(
-        self,
-        obj: Dict[str, Any],
-        field_path: str
-    ) -> Any:
-        """Get a nested field value using dot notation."""
+    @staticmethod
+    def _emit_field(field_path: str, source: "_ConditionSource") -> str:
+        """
+        Emit an inline walk of a nested field using dot notation.
+
+        Each level after the first is guarded by a dict check, so a missing
+        or non-dict intermediate value yields None. The walk is unrolled into
+        the generated function for any depth, so deep paths such as
+        output.a.b.c.d cost one dict lookup per level with no loop overhead.
+        """
         parts = field_path.split('.')
-        value = obj
+        expr = f"out.get({source.bind(parts[0])})"
 
-        for part in parts:
-            if isinstance(value, dict):
-                value = value.get(part)
-            else:
-                return None
+        for part in parts[1:]:
+            var = source.temp()
+            expr = (
+                f"({var}.get({source.bind(part)}) "
+                f"if isinstance({var} := {expr}, dict) else None)"
+            )
 
-        return value
+        return expr
 
     def _parse_value(self, value_str: str) -> Any:
         """Parse a value string into the appropriate type."""
@@ -199,22 +438,16 @@ class ConditionEvaluator:
         # List literal - use json.loads() for safety (prevents DoS via memory exhaustion)
         if value_str.startswith('[') and value_str.endswith(']'):
             try:
-                import json
                 # Replace single quotes with double quotes for JSON compatibility
                 json_str = value_str.replace("'", '"')
                 return json.loads(json_str)
             except (ValueError, json.JSONDecodeError):
                 return value_str
 
-        # Boolean
-        if value_str.lower() == 'true':
-            return True
-        if value_str.lower() == 'false':
-            return False
-
-        # None
-        if value_str.lower() in ('none', 'null'):
-            return None
+        # Boolean / None keywords (case-insensitive)
+        keyword = value_str.lower()
+        if keyword in _KEYWORD_VALUES:
+            return _KEYWORD_VALUES[keyword]
 
         # Number
         try:
@@ -230,12 +463,15 @@ class ConditionEvaluator:
 class ConditionalEdge:
     """Represents a conditional edge in the workflow graph."""
 
+    __slots__ = ("from_agent", "to_agent", "condition", "priority", "_compiled")
+
     def __init__(
         self,
         from_agent: str,
         to_agent: str,
         condition: Optional[str] = None,
-        priority: int = 0
+        priority: int = 0,
+        compiled: Optional[Callable[[Dict[str, Any]], bool]] = None
     ):
         """
         Initialize a conditional edge.
@@ -245,16 +481,22 @@ class ConditionalEdge:
             to_agent: Name of the target agent
             condition: Optional condition expression
             priority: Edge priority (higher = evaluated first)
+            compiled: Optional pre-compiled predicate for the condition
         """
         self.from_agent = from_agent
         self.to_agent = to_agent
         self.condition = condition
         self.priority = priority
+        self._compiled = compiled
 
     def __repr__(self) -> str:
         return f"ConditionalEdge({self.from_agent} -> {self.to_agent}, condition={self.condition})"
 
 
+# Conditional edges in priority order, and the default edge, for one source agent
+AgentRoutes = Tuple[List[ConditionalEdge], Optional[ConditionalEdge]]
+
+
 class WorkflowManager:
     """
     Manages workflow creation and execution for the AI Assistant.
@@ -266,7 +508,10 @@ class WorkflowManager:
     Supports per-agent model selection via the ModelRegistry, allowing
     different agents in a workflow to use different LLM providers.
     """
-    
+
+    # ModelFactory class, imported lazily on first per-agent model lookup
+    _model_factory: Optional[Any] = None
+
     def __init__(
         self,
         chat_client: Any,
@@ -286,9 +531,24 @@ class WorkflowManager:
         self._workflows: Dict[str, Any] = {}
         self._workflow_agents: Dict[str, Any] = {}
         self._workflow_edges: Dict[str, List[ConditionalEdge]] = {}
+        # Per-workflow routing index, with the edge list it was built from
+        self._outgoing_by_agent: Dict[
+            str, Tuple[List[ConditionalEdge], Dict[str, AgentRoutes], Dict[str, str]]
+        ] = {}
         self._condition_evaluator = ConditionEvaluator()
+        # Agents keyed by (name, instructions, model) and clients keyed by model name
+        self._agent_cache: Dict[Tuple[str, str, str], Any] = {}
+        self._client_cache: Dict[str, Any] = {}
         self._initialized = False
 
+    @classmethod
+    def _get_model_factory(cls) -> Any:
+        """Import ModelFactory on first use and keep the class reference."""
+        if cls._model_factory is None:
+            from src.models.providers import ModelFactory
+            cls._model_factory = ModelFactory
+        return cls._model_factory
+
     def _get_client_for_agent(self, agent_config: Dict[str, Any]) -> Any:
         """
         Get the appropriate chat client for an agent.
@@ -302,10 +562,15 @@ class WorkflowManager:
         agent_model = agent_config.get("model")
         
         if agent_model and self._model_registry:
+            # Agents sharing a model share one client
+            client = self._client_cache.get(agent_model)
+            if client is not None:
+                return client
+
             try:
-                from src.models.providers import ModelFactory
                 model_config = self._model_registry.get_provider(agent_model)
-                client = ModelFactory.create_client(model_config)
+                client = self._get_model_factory().create_client(model_config)
+                self._client_cache[agent_model] = client
                 logger.debug(
                     "Created client for agent with specific model",
                     agent_name=agent_config.get("name"),
@@ -320,7 +585,47 @@ class WorkflowManager:
                 )
         
         return self._chat_client
-        
+
+    def _get_or_create_agent(self, agent_config: Dict[str, Any], agent_name: str) -> Any:
+        """
+        Get the ChatAgent for an agent definition, creating it on first use.
+
+        Agents with the same name, instructions and model are shared across
+        workflows instead of being constructed once per reference.
+
+        Args:
+            agent_config: Agent configuration (instructions, optional model)
+            agent_name: Resolved name for the agent
+
+        Returns:
+            ChatAgent instance
+        """
+        instructions = agent_config.get("instructions", "You are a helpful assistant.")
+        model_used = agent_config.get("model", "default")
+        cache_key = (agent_name, instructions, model_used)
+
+        agent = self._agent_cache.get(cache_key)
+        if agent is not None:
+            logger.debug("Reusing agent for workflow", agent_name=agent_name, model=model_used)
+            return agent
+
+        # Get appropriate client (may be model-specific)
+        client = self._get_client_for_agent(agent_config)
+
+        agent = ChatAgent(
+            name=agent_name,
+            instructions=instructions,
+            chat_client=client,
+        )
+        self._agent_cache[cache_key] = agent
+
+        logger.debug(
+            "Created agent for workflow",
+            agent_name=agent_name,
+            model=model_used
+        )
+        return agent
+
     def load_workflows(self, workflow_configs: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Load and initialize workflows from configuration.
@@ -414,22 +719,10 @@ class WorkflowManager:
         # Create agents with per-agent model support
         agents = []
         for agent_config in agents_config:
-            # Get appropriate client (may be model-specific)
-            client = self._get_client_for_agent(agent_config)
-            
-            agent = ChatAgent(
-                name=agent_config.get("name", f"Agent-{len(agents)}"),
-                instructions=agent_config.get("instructions", "You are a helpful assistant."),
-                chat_client=client,
+            agent = self._get_or_create_agent(
+                agent_config, agent_config.get("name", f"Agent-{len(agents)}")
             )
             agents.append(agent)
-            
-            model_used = agent_config.get("model", "default")
-            logger.debug(
-                "Created agent for workflow",
-                agent_name=agent.name,
-                model=model_used
-            )
         
         # Build sequential workflow
         workflow = (
@@ -499,22 +792,7 @@ class WorkflowManager:
             if not agent_name:
                 raise ValueError("Each agent in workflow must have a 'name'")
 
-            # Get appropriate client (may be model-specific)
-            client = self._get_client_for_agent(agent_config)
-
-            agent = ChatAgent(
-                name=agent_name,
-                instructions=agent_config.get("instructions", "You are a helpful assistant."),
-                chat_client=client,
-            )
-            agents_by_name[agent_name] = agent
-            
-            model_used = agent_config.get("model", "default")
-            logger.debug(
-                "Created agent for workflow",
-                agent_name=agent_name,
-                model=model_used
-            )
+            agents_by_name[agent_name] = self._get_or_create_agent(agent_config, agent_name)
 
         # Validate start agent exists
         if start_agent not in agents_by_name:
@@ -537,7 +815,8 @@ class WorkflowManager:
                 from_agent=from_agent,
                 to_agent=to_agent,
                 condition=condition,
-                priority=priority
+                priority=priority,
+                compiled=self._condition_evaluator.compile(condition)
             )
             conditional_edges.append(conditional_edge)
 
@@ -558,6 +837,7 @@ class WorkflowManager:
             key=lambda e: e.priority,
             reverse=True  # Higher priority first
         )
+        self._get_outgoing_index(workflow_name)
 
         # Build workflow with standard edges
         builder = WorkflowBuilder()
@@ -593,6 +873,57 @@ class WorkflowManager:
 
         return workflow_agent
 
+    def _get_outgoing_index(
+        self, workflow_name: str
+    ) -> Tuple[Dict[str, AgentRoutes], Dict[str, str]]:
+        """
+        Get a workflow's outgoing routes grouped by source agent.
+
+        Each source agent maps to its conditional edges in priority order and
+        its default (unconditional) edge, if any. Agents whose only outgoing
+        edge is unconditional are also mapped directly to their successor.
+        The index is built once from the priority-sorted edge list and rebuilt
+        only if that list is replaced.
+
+        Args:
+            workflow_name: Name of the workflow
+
+        Returns:
+            Tuple of (agent -> (conditional_edges, default_edge),
+            agent -> single successor name)
+        """
+        edges = self._workflow_edges.get(workflow_name)
+        if edges is None:
+            return {}, {}
+
+        cached = self._outgoing_by_agent.get(workflow_name)
+        if cached is not None and cached[0] is edges:
+            return cached[1], cached[2]
+
+        conditional_by_from: Dict[str, List[ConditionalEdge]] = {}
+        default_by_from: Dict[str, ConditionalEdge] = {}
+        edge_counts: Dict[str, int] = {}
+        for edge in edges:
+            conditional = conditional_by_from.setdefault(edge.from_agent, [])
+            edge_counts[edge.from_agent] = edge_counts.get(edge.from_agent, 0) + 1
+            if edge.condition:
+                conditional.append(edge)
+            elif edge.from_agent not in default_by_from:
+                default_by_from[edge.from_agent] = edge
+
+        routes = {
+            agent: (conditional, default_by_from.get(agent))
+            for agent, conditional in conditional_by_from.items()
+        }
+        single_successors = {
+            agent: default_edge.to_agent
+            for agent, default_edge in default_by_from.items()
+            if edge_counts[agent] == 1
+        }
+
+        self._outgoing_by_agent[workflow_name] = (edges, routes, single_successors)
+        return routes, single_successors
+
     def evaluate_next_agent(
         self,
         workflow_name: str,
@@ -602,6 +933,10 @@ class WorkflowManager:
         """
         Evaluate which agent should execute next based on conditions.
 
+        Conditional edges are evaluated in priority order and the first match
+        wins. The unconditional edge from the agent is only taken as a
+        fallback when no condition matches, regardless of its priority.
+
         Args:
             workflow_name: Name of the workflow
             current_agent: Name of the agent that just executed
@@ -610,41 +945,48 @@ class WorkflowManager:
         Returns:
             Name of the next agent to execute, or None if no matching edge
         """
-        edges = self._workflow_edges.get(workflow_name, [])
+        routes_by_agent, single_successors = self._get_outgoing_index(workflow_name)
+
+        # Fast path: a single unconditional edge needs no evaluation
+        next_agent = single_successors.get(current_agent)
+        if next_agent is not None:
+            logger.debug(
+                "Taking unconditional edge",
+                from_agent=current_agent,
+                to_agent=next_agent
+            )
+            return next_agent
 
-        # Find edges from the current agent
-        outgoing_edges = [e for e in edges if e.from_agent == current_agent]
+        evaluator = self._condition_evaluator
 
-        if not outgoing_edges:
+        # Find routes from the current agent
+        routes = routes_by_agent.get(current_agent)
+
+        if routes is None:
             logger.debug("No outgoing edges from agent", agent=current_agent)
             return None
 
-        # Evaluate conditions in priority order
-        for edge in outgoing_edges:
-            if not edge.condition:
-                # Unconditional edge - use as default/fallback
-                logger.debug(
-                    "Taking unconditional edge",
-                    from_agent=current_agent,
-                    to_agent=edge.to_agent
-                )
-                return edge.to_agent
-
-            # Evaluate condition
-            if self._condition_evaluator.evaluate(edge.condition, agent_output):
-                logger.info(
-                    "Condition matched, routing to agent",
-                    from_agent=current_agent,
-                    to_agent=edge.to_agent,
-                    condition=edge.condition
-                )
-                return edge.to_agent
+        conditional_edges, default_edge = routes
 
-        # No condition matched - check for default edge (no condition)
-        default_edge = next(
-            (e for e in outgoing_edges if not e.condition),
-            None
-        )
+        if conditional_edges:
+            # Parse the output once for all outgoing edges
+            agent_output = evaluator.prepare_output(agent_output)
+
+            # Evaluate conditions in priority order
+            for edge in conditional_edges:
+                # Evaluate the compiled condition (compiled lazily for edges added directly)
+                if edge._compiled is None:
+                    edge._compiled = evaluator.compile(edge.condition)
+                if evaluator.run(edge.condition, edge._compiled, agent_output):
+                    logger.info(
+                        "Condition matched, routing to agent",
+                        from_agent=current_agent,
+                        to_agent=edge.to_agent,
+                        condition=edge.condition
+                    )
+                    return edge.to_agent
+
+        # No condition matched - use the default edge (no condition)
         if default_edge:
             logger.debug(
                 "Using default edge",
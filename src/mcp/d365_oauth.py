@@ -6,15 +6,30 @@ Supports both DefaultAzureCredential (for flexibility) and ClientSecretCredentia
 (for service accounts).
 
 Production features:
-- Retry logic with exponential backoff for transient failures
-- Thread-safe token refresh with async lock
+- azure-core retry settings for transient failures (exponential backoff,
+  no retries on auth errors), plus Retry-After handling for throttled
+  token requests, which azure-core does not retry
+- Concurrent refreshes coalesced into a single in-flight acquisition
+- Background refresh of tokens nearing expiry (stale-while-refresh)
+- Optional encrypted on-disk token cache shared by sibling processes
 - Pydantic config model support
 """
 
 import asyncio
-import logging
-from datetime import datetime, timedelta
-from typing import Optional, Union
+import base64
+import concurrent.futures
+import hashlib
+import json
+import os
+import sys
+import threading
+import tempfile
+import time
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import structlog
 
@@ -22,6 +37,7 @@ logger = structlog.get_logger(__name__)
 
 # Azure Identity imports - optional dependency
 try:
+    from azure.core.credentials import AccessToken
     from azure.identity.aio import (
         ClientSecretCredential,
         DefaultAzureCredential,
@@ -29,23 +45,38 @@ try:
     AZURE_IDENTITY_AVAILABLE = True
 except ImportError:
     AZURE_IDENTITY_AVAILABLE = False
+    AccessToken = None
     ClientSecretCredential = None
     DefaultAzureCredential = None
 
-# Tenacity for retry logic - optional but recommended
+# Cryptography for the on-disk token cache - optional dependency
 try:
-    from tenacity import (
-        retry,
-        stop_after_attempt,
-        wait_exponential,
-        retry_if_exception_type,
-        before_sleep_log,
-        RetryError,
-    )
-    TENACITY_AVAILABLE = True
+    from cryptography.fernet import Fernet, InvalidToken
+    CRYPTOGRAPHY_AVAILABLE = True
 except ImportError:
-    TENACITY_AVAILABLE = False
-    RetryError = Exception
+    CRYPTOGRAPHY_AVAILABLE = False
+    Fernet = None
+    InvalidToken = Exception
+
+# Retry settings passed as credential kwargs; azure-identity builds its
+# pipeline's AsyncRetryPolicy from them. Connection errors are retried with
+# exponential backoff, but token requests are POSTs, which azure-core only
+# retries on 500/503/504 - throttling (429) is retried by _acquire_token.
+# AAD rejections (bad client secret, invalid scope) raise immediately
+_RETRY_SETTINGS = {
+    "retry_total": 3,
+    "retry_backoff_factor": 1.0,
+    "retry_backoff_max": 10,
+    "retry_on_status_codes": [429, 500, 502, 503, 504],
+}
+
+# Process-wide credentials shared by providers created with share_credential,
+# keyed on (tenant_id, client_id, sha256(client_secret), event loop) since an
+# aio credential's transport is bound to the loop that opened it. Each entry
+# holds the credential and its reference count; the last provider to close it
+# closes it.
+_CRED_CACHE: Dict[Tuple[str, str, str, asyncio.AbstractEventLoop], List] = {}
+_CRED_CACHE_LOCK = threading.Lock()
 
 # Config model import
 try:
@@ -56,6 +87,23 @@ except ImportError:
     D365OAuthConfig = None
 
 
+def _retry_after(response) -> Optional[float]:
+    """Seconds a throttled response asks to wait, if it says."""
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenState(str, Enum):
+    """Freshness of the cached token."""
+
+    FRESH = "fresh"  # Valid and outside the refresh buffer
+    STALE = "stale"  # Still valid, but inside the refresh buffer
+    EXPIRED = "expired"  # Missing or past its expiry time
+
+
 class D365TokenProvider:
     """
     Acquires OAuth tokens for D365 F&O MCP access.
@@ -64,7 +112,10 @@ class D365TokenProvider:
     - DefaultAzureCredential (recommended for flexibility)
     - ClientSecretCredential (for service accounts)
 
-    The token is cached and automatically refreshed when expired.
+    The token is cached and automatically refreshed when expired. Once a
+    token enters the refresh buffer it is still returned immediately while
+    a background task fetches its replacement; callers only wait for AAD
+    when the token has actually expired.
     Production features include retry logic and thread-safe refresh.
 
     Usage:
@@ -89,8 +140,17 @@ class D365TokenProvider:
 
         token = await provider.get_token()
         # Use token in Authorization header
+
+        # From synchronous code (WSGI handlers, worker threads)
+        token = provider.get_token_sync()
     """
 
+    # Background event loop shared by all providers for get_token_sync(), so
+    # sync callers reuse the cached token and in-flight acquisition instead
+    # of building a new loop per call
+    _sync_loop: Optional[asyncio.AbstractEventLoop] = None
+    _sync_loop_lock = threading.Lock()
+
     def __init__(
         self,
         config: Optional["D365OAuthConfig"] = None,
@@ -101,6 +161,8 @@ class D365TokenProvider:
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         token_refresh_buffer_minutes: int = 5,
+        share_credential: bool = False,
+        cache_path: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize the D365 token provider.
@@ -112,6 +174,10 @@ class D365TokenProvider:
             client_id: App registration client ID (optional if using DefaultAzureCredential)
             client_secret: App registration client secret (optional if using DefaultAzureCredential)
             token_refresh_buffer_minutes: Minutes before expiry to refresh token (default: 5)
+            share_credential: Share one ClientSecretCredential (and its MSAL cache and
+                connection pool) with other providers using the same service account
+            cache_path: File to persist the token to, encrypted with a key derived
+                from the client secret, so other processes can reuse it (optional)
         """
         if not AZURE_IDENTITY_AVAILABLE:
             raise ImportError(
@@ -125,7 +191,9 @@ class D365TokenProvider:
             self._tenant_id = config.tenant_id
             self._client_id = config.client_id
             self._client_secret = config.client_secret
-            self._token_refresh_buffer = timedelta(minutes=config.token_refresh_buffer_minutes)
+            self._token_refresh_buffer_s = config.token_refresh_buffer_minutes * 60.0
+            share_credential = config.share_credential
+            cache_path = config.token_cache_path
         else:
             if not environment_url:
                 raise ValueError("environment_url is required")
@@ -133,17 +201,56 @@ class D365TokenProvider:
             self._tenant_id = tenant_id
             self._client_id = client_id
             self._client_secret = client_secret
-            self._token_refresh_buffer = timedelta(minutes=token_refresh_buffer_minutes)
+            self._token_refresh_buffer_s = token_refresh_buffer_minutes * 60.0
 
         # D365 F&O uses environment URL as the resource/scope
-        self._scope = f"{self._environment_url}/.default"
-
+        self._scope = sys.intern(f"{self._environment_url}/.default")
+        # Prebuilt *scopes argument for credential.get_token, passed through
+        # without repacking on every acquisition
+        self._scope_args = (self._scope,)
+
+        self._share_credential = share_credential
+
+        # On-disk token cache, read once before the first AAD request
+        self._cache_path = Path(cache_path) if cache_path else None
+        self._cache_fernet = None
+        self._cache_loaded = self._cache_path is None
+        if self._cache_path is not None:
+            if not CRYPTOGRAPHY_AVAILABLE:
+                raise ImportError(
+                    "cryptography is required for the D365 token cache. "
+                    "Install with: pip install cryptography"
+                )
+            if not self._client_secret:
+                raise ValueError("cache_path requires client credentials")
+            key = hashlib.sha256(b"d365-token-cache:" + self._client_secret.encode()).digest()
+            self._cache_fernet = Fernet(base64.urlsafe_b64encode(key))
+        self._credential_key: Optional[Tuple[str, str, str, asyncio.AbstractEventLoop]] = None
         self._credential = None
+        # The loop self._credential was created on; its transport is bound to
+        # it, so acquisitions on other loops use a credential of their own
+        self._credential_loop: Optional[asyncio.AbstractEventLoop] = None
         self._cached_token: Optional[str] = None
-        self._token_expires_at: Optional[datetime] = None
-
-        # Thread-safe token refresh lock (Phase 4)
-        self._refresh_lock = asyncio.Lock()
+        # Expiry as the epoch seconds AAD returned; converted to a datetime
+        # only when token_expires_at is read
+        self._expires_on: Optional[float] = None
+        # Monotonic deadlines for the cached token; immune to wall-clock jumps
+        # (NTP adjustments, suspend/resume) and cheap to compare per call
+        self._refresh_at_mono = 0.0
+        self._expires_at_mono = 0.0
+
+        # In-flight token acquisition shared by all concurrent callers on an
+        # event loop, including background refreshes of stale tokens. Tasks
+        # are bound to the loop that created them, so a provider shared
+        # across loops (separate asyncio.run() calls, worker threads) keeps
+        # one per loop rather than awaiting another loop's task
+        self._inflight: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task[str]]" = (
+            WeakKeyDictionary()
+        )
+        self._last_refresh_ok = True
+        # Set by close(); the credential (and its MSAL cache) is kept for the
+        # provider's whole life, so a closed provider refuses to recreate it
+        self._closed = False
 
         logger.debug(
             "D365TokenProvider initialized",
@@ -156,8 +263,10 @@ class D365TokenProvider:
         """
         Get access token for D365, with thread-safe caching.
 
-        Returns a cached token if still valid, otherwise acquires a new one.
-        Uses double-checked locking for thread safety.
+        Returns a cached token if still valid. A stale token (inside the
+        refresh buffer) is returned immediately while a background refresh
+        runs; only an expired token makes the caller wait for a new one.
+        Concurrent callers share one in-flight acquisition.
 
         Returns:
             OAuth access token string
@@ -165,141 +274,368 @@ class D365TokenProvider:
         Raises:
             Exception: If token acquisition fails
         """
-        # Quick check without lock
-        if self._is_token_valid():
-            logger.debug("Using cached D365 token")
-            return self._cached_token
-
-        # Acquire lock for refresh (Phase 4: thread-safe)
-        async with self._refresh_lock:
-            # Double-check after acquiring lock
-            if self._is_token_valid():
-                logger.debug("Token validated after lock acquisition")
-                return self._cached_token
-
-            # Acquire new token with retry logic
-            return await self._acquire_token_with_retry()
-
-    async def _acquire_token_with_retry(self) -> str:
+        # Fast path: a fresh cached token costs one clock read and a float
+        # compare - no method call, no datetime, no log record
+        token = self._cached_token
+        if token is not None:
+            now = time.monotonic()
+            if now < self._refresh_at_mono:
+                return token
+
+            # Stale: serve the cached token and refresh in the background,
+            # unless the last refresh failed, in which case refresh
+            # synchronously. Reuses the clock read above rather than
+            # re-classifying the token
+            if now < self._expires_at_mono and self._last_refresh_ok:
+                self._start_refresh()
+                return token
+
+        # Expired: wait for the shared in-flight acquisition. The task itself
+        # serializes callers, so there is no re-validation once it completes
+        return await self._await_refresh(self._start_refresh())
+
+    def get_token_sync(self, timeout: float = 30.0) -> str:
         """
-        Acquire token with retry logic for transient failures.
+        Get access token for D365 from synchronous code.
 
-        Uses tenacity for exponential backoff retries on ConnectionError
-        and TimeoutError.
+        A fresh cached token is returned directly; otherwise get_token() runs
+        on a persistent background event loop, with a credential of its own
+        rather than the one used on the caller's loop. Must not be called
+        from a thread that is running an event loop - await get_token() there.
+
+        Args:
+            timeout: Seconds to wait for a token to be acquired
 
         Returns:
             OAuth access token string
+
+        Raises:
+            TimeoutError: If no token is acquired within the timeout
+            Exception: If token acquisition fails
         """
-        if self._credential is None:
-            self._credential = self._create_credential()
+        token = self._cached_token
+        if token is not None and time.monotonic() < self._refresh_at_mono:
+            return token
 
-        if TENACITY_AVAILABLE:
-            return await self._acquire_token_tenacity()
-        else:
-            return await self._acquire_token_simple()
+        future = asyncio.run_coroutine_threadsafe(self.get_token(), self._get_sync_loop())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # Not the builtin TimeoutError before Python 3.11; also stop the
+            # wait on the background loop
+            future.cancel()
+            raise TimeoutError(f"No D365 token acquired within {timeout}s") from None
+
+    @classmethod
+    def _get_sync_loop(cls) -> asyncio.AbstractEventLoop:
+        """Get the background loop for sync callers, starting it on first use."""
+        with cls._sync_loop_lock:
+            if cls._sync_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="d365-token-sync",
+                    daemon=True,
+                ).start()
+                cls._sync_loop = loop
+        return cls._sync_loop
+
+    def _start_refresh(self) -> "asyncio.Task[str]":
+        """
+        Get the in-flight token acquisition, starting one if none is running.
 
-    async def _acquire_token_tenacity(self) -> str:
-        """Acquire token using tenacity retry decorator."""
+        Concurrent callers on the same event loop share one task, so only one
+        AAD request is made no matter how many callers need a new token.
 
-        @retry(
-            stop=stop_after_attempt(3),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
-            retry=retry_if_exception_type((ConnectionError, TimeoutError, OSError)),
-            before_sleep=before_sleep_log(logging.getLogger(__name__), logging.WARNING),
-            reraise=True,
-        )
-        async def _acquire():
-            token = await self._credential.get_token(self._scope)
-            return token
+        Raises:
+            RuntimeError: If the provider has been closed
+        """
+        if self._closed:
+            raise RuntimeError("D365TokenProvider is closed")
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(loop)
+        if task is None or task.done():
+            task = loop.create_task(self._acquire_token())
+            task.add_done_callback(self._on_refresh_done)
+            self._inflight[loop] = task
+        return task
+
+    @staticmethod
+    async def _await_refresh(task: "asyncio.Task[str]") -> str:
+        """Wait for a shared acquisition without cancelling it for other waiters."""
+        return await asyncio.shield(task)
+
+    def _on_refresh_done(self, task: "asyncio.Task[str]") -> None:
+        """Clear the finished acquisition and consume its exception, if any."""
+        loop = task.get_loop()
+        if self._inflight.get(loop) is task:
+            del self._inflight[loop]
+        if not task.cancelled():
+            # Failures are logged during acquisition; retrieving the exception
+            # avoids "never retrieved" warnings for unawaited background refreshes
+            task.exception()
+
+    async def _acquire_token(self) -> str:
+        """
+        Acquire a token, from the disk cache on first use or else from AAD.
 
-        try:
-            token = await _acquire()
-            self._cached_token = token.token
-            self._token_expires_at = datetime.fromtimestamp(token.expires_on)
+        Transient failures are retried inside the credential's pipeline
+        (see _RETRY_SETTINGS) and throttled requests are retried here after
+        their Retry-After, so a failure here is final.
 
-            logger.info(
-                "Acquired D365 OAuth token",
-                scope=self._scope,
-                expires_at=self._token_expires_at.isoformat(),
-            )
-            return self._cached_token
+        Returns:
+            OAuth access token string
+        """
+        if not self._cache_loaded:
+            self._cache_loaded = True
+            token = await self._load_cached_token()
+            if token is not None:
+                self._last_refresh_ok = True
+                return token
+
+        loop = asyncio.get_running_loop()
+        if self._credential is None and loop is not self._sync_loop:
+            self._credential = self._create_credential()
+            self._credential_loop = loop
+        # Other loops (the get_token_sync() loop, separate asyncio.run() calls)
+        # can't use the credential's transport, so get a token with one
+        # created and closed on this loop
+        transient = loop is not self._credential_loop
+        credential = self._create_credential(share=False) if transient else self._credential
 
-        except RetryError as e:
-            logger.error(
-                "Failed to acquire D365 token after retries",
-                scope=self._scope,
-                error=str(e),
-            )
-            raise
+        try:
+            self._store_token(await self._get_token_with_throttle_retry(credential))
         except Exception as e:
+            self._last_refresh_ok = False
             logger.error(
                 "Failed to acquire D365 token",
                 scope=self._scope,
                 error=str(e),
             )
             raise
+        finally:
+            if transient:
+                try:
+                    await credential.close()
+                except Exception as e:
+                    logger.warning("Error closing D365 credential", error=str(e))
+
+        self._last_refresh_ok = True
+        logger.info(
+            "Acquired D365 OAuth token",
+            scope=self._scope,
+            expires_on=self._expires_on,
+        )
+        if self._cache_path is not None:
+            await self._save_cached_token()
+        return self._cached_token
 
-    async def _acquire_token_simple(self) -> str:
-        """Acquire token with simple manual retry (fallback if tenacity not available)."""
-        max_attempts = 3
-        last_error = None
+    async def _get_token_with_throttle_retry(self, credential):
+        """
+        Request a token, retrying throttled (429) responses.
+
+        azure-core never retries a throttled POST, so these are retried here,
+        waiting for the response's Retry-After or else exponential backoff,
+        capped at retry_backoff_max.
 
-        for attempt in range(max_attempts):
+        Args:
+            credential: Azure credential created on the running loop
+
+        Returns:
+            AccessToken from the credential
+        """
+        for attempt in range(_RETRY_SETTINGS["retry_total"] + 1):
             try:
-                token = await self._credential.get_token(self._scope)
-                self._cached_token = token.token
-                self._token_expires_at = datetime.fromtimestamp(token.expires_on)
-
-                logger.info(
-                    "Acquired D365 OAuth token",
-                    scope=self._scope,
-                    expires_at=self._token_expires_at.isoformat(),
-                )
-                return self._cached_token
-
-            except (ConnectionError, TimeoutError, OSError) as e:
-                last_error = e
-                if attempt < max_attempts - 1:
-                    backoff = min(2 ** attempt, 10)
-                    logger.warning(
-                        "Token acquisition failed, retrying",
-                        attempt=attempt + 1,
-                        backoff=backoff,
-                        error=str(e),
-                    )
-                    await asyncio.sleep(backoff)
-                    continue
-                raise
+                return await credential.get_token(*self._scope_args)
             except Exception as e:
-                logger.error(
-                    "Failed to acquire D365 token",
-                    scope=self._scope,
-                    error=str(e),
+                response = getattr(e, "response", None)
+                if (
+                    attempt == _RETRY_SETTINGS["retry_total"]
+                    or getattr(response, "status_code", None) != 429
+                ):
+                    raise
+                delay = _retry_after(response)
+                if delay is None:
+                    delay = _RETRY_SETTINGS["retry_backoff_factor"] * 2 ** attempt
+                delay = min(delay, _RETRY_SETTINGS["retry_backoff_max"])
+                logger.warning(
+                    "D365 token request throttled, retrying",
+                    attempt=attempt + 1,
+                    delay=delay,
                 )
-                raise
+                await asyncio.sleep(delay)
 
-        raise last_error or RuntimeError("Token acquisition failed")
+    async def _load_cached_token(self) -> Optional[str]:
+        """
+        Load a token another process persisted to the on-disk cache.
+
+        Returns:
+            The cached token if it is for this scope and outside the refresh
+            buffer, otherwise None
+        """
+        try:
+            data = await asyncio.to_thread(self._cache_path.read_bytes)
+            payload = json.loads(self._cache_fernet.decrypt(data))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, InvalidToken) as e:
+            logger.warning("Ignoring unreadable D365 token cache", path=str(self._cache_path), error=str(e))
+            return None
+
+        # Another version may have written a different format
+        if (
+            not isinstance(payload, dict)
+            or not isinstance(payload.get("token"), str)
+            or not isinstance(payload.get("expires_on"), (int, float))
+        ):
+            logger.warning("Ignoring unrecognized D365 token cache", path=str(self._cache_path))
+            return None
+
+        if payload.get("scope") != self._scope:
+            return None
+        remaining = payload["expires_on"] - time.time()
+        if remaining <= self._token_refresh_buffer_s:
+            return None
+
+        self._store_token(AccessToken(payload["token"], payload["expires_on"]))
+        logger.info("Loaded D365 OAuth token from disk cache", scope=self._scope, expires_on=self._expires_on)
+        return self._cached_token
+
+    async def _save_cached_token(self) -> None:
+        """Persist the current token to the on-disk cache, encrypted."""
+        payload = json.dumps(
+            {"scope": self._scope, "token": self._cached_token, "expires_on": self._expires_on}
+        ).encode()
+        try:
+            await asyncio.to_thread(self._write_cache_file, self._cache_fernet.encrypt(payload))
+        except OSError as e:
+            # The cache is an optimization; the token itself was acquired fine
+            logger.warning("Failed to write D365 token cache", path=str(self._cache_path), error=str(e))
+
+    def _write_cache_file(self, data: bytes) -> None:
+        """Atomically replace the cache file so readers never see a partial write."""
+        directory = self._cache_path.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{self._cache_path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
 
-    def _create_credential(self):
+    def _store_token(self, token) -> None:
+        """
+        Cache an acquired access token and its expiry deadlines.
+
+        The wall-clock expiry is kept as epoch seconds for reporting;
+        freshness checks use deadlines on the monotonic clock, converted
+        once here.
+        """
+        self._cached_token = token.token
+        self._expires_on = token.expires_on
+
+        expires_at = time.monotonic() + (token.expires_on - time.time())
+        self._expires_at_mono = expires_at
+        self._refresh_at_mono = expires_at - self._token_refresh_buffer_s
+
+    def _create_credential(self, share: bool = True):
         """
         Create appropriate Azure credential based on configuration.
 
         If client_secret, tenant_id, and client_id are all provided,
         uses ClientSecretCredential. Otherwise, uses DefaultAzureCredential.
 
+        Args:
+            share: Use the process-wide credential if share_credential is set
+
         Returns:
             Azure credential instance
         """
         if self._client_secret and self._tenant_id and self._client_id:
+            if share and self._share_credential:
+                return self._acquire_shared_credential()
             logger.debug("Using ClientSecretCredential for D365 auth")
             return ClientSecretCredential(
                 tenant_id=self._tenant_id,
                 client_id=self._client_id,
                 client_secret=self._client_secret,
+                **_RETRY_SETTINGS,
             )
 
         logger.debug("Using DefaultAzureCredential for D365 auth")
-        return DefaultAzureCredential()
+        return DefaultAzureCredential(**_RETRY_SETTINGS)
+
+    def _acquire_shared_credential(self):
+        """
+        Get the process-wide ClientSecretCredential for this service account.
+
+        Returns:
+            Shared Azure credential instance, with its reference count taken
+        """
+        key = (
+            self._tenant_id,
+            self._client_id,
+            hashlib.sha256(self._client_secret.encode()).hexdigest(),
+            asyncio.get_running_loop(),
+        )
+        with _CRED_CACHE_LOCK:
+            entry = _CRED_CACHE.get(key)
+            if entry is None:
+                logger.debug("Using shared ClientSecretCredential for D365 auth")
+                entry = _CRED_CACHE[key] = [
+                    ClientSecretCredential(
+                        tenant_id=self._tenant_id,
+                        client_id=self._client_id,
+                        client_secret=self._client_secret,
+                        **_RETRY_SETTINGS,
+                    ),
+                    0,
+                ]
+            entry[1] += 1
+
+        self._credential_key = key
+        return entry[0]
+
+    def _release_shared_credential(self) -> bool:
+        """
+        Drop this provider's reference to its shared credential.
+
+        Returns:
+            True if this was the last reference and the credential should be closed
+        """
+        key, self._credential_key = self._credential_key, None
+        with _CRED_CACHE_LOCK:
+            entry = _CRED_CACHE.get(key)
+            if entry is None or entry[0] is not self._credential:
+                return False
+            entry[1] -= 1
+            if entry[1] > 0:
+                return False
+            del _CRED_CACHE[key]
+            return True
+
+    def _token_state(self) -> TokenState:
+        """
+        Classify the cached token as fresh, stale or expired.
+
+        Returns:
+            FRESH if the token won't expire within the buffer period,
+            STALE if it is within the buffer but not yet expired,
+            EXPIRED if there is no token or it has expired
+        """
+        if not self._cached_token:
+            return TokenState.EXPIRED
+
+        now = time.monotonic()
+        if now < self._refresh_at_mono:
+            return TokenState.FRESH
+
+        # Refresh token before it expires (with buffer)
+        if now < self._expires_at_mono:
+            return TokenState.STALE
+        return TokenState.EXPIRED
 
     def _is_token_valid(self) -> bool:
         """
@@ -308,27 +644,30 @@ class D365TokenProvider:
         Returns:
             True if token exists and won't expire within the buffer period
         """
-        if not self._cached_token or not self._token_expires_at:
-            return False
-
-        # Refresh token before it expires (with buffer)
-        expiry_threshold = self._token_expires_at - self._token_refresh_buffer
-        return datetime.now() < expiry_threshold
+        return self._token_state() is TokenState.FRESH
 
     async def refresh_token(self) -> str:
         """
         Force refresh the OAuth token.
 
-        Clears the cached token and acquires a new one.
-        Thread-safe using async lock.
+        Clears the cached token and acquires a new one. If an acquisition
+        is already in flight its token is new enough, so that is awaited
+        instead of making a second AAD request. Concurrent callers share
+        the resulting acquisition. The credential is kept open, so its
+        in-memory MSAL cache and connection pool survive the refresh.
 
         Returns:
             New OAuth access token string
         """
-        async with self._refresh_lock:
-            self._cached_token = None
-            self._token_expires_at = None
-            return await self._acquire_token_with_retry()
+        inflight = self._inflight.get(asyncio.get_running_loop())
+        if inflight is not None and not inflight.done():
+            return await self._await_refresh(inflight)
+
+        self._cached_token = None
+        self._expires_on = None
+        self._refresh_at_mono = self._expires_at_mono = 0.0
+        self._cache_loaded = True
+        return await self._await_refresh(self._start_refresh())
 
     @property
     def environment_url(self) -> str:
@@ -340,10 +679,27 @@ class D365TokenProvider:
         """Get the OAuth scope."""
         return self._scope
 
+    @property
+    def tenant_id(self) -> Optional[str]:
+        """Get the Azure AD tenant ID, if configured."""
+        return self._tenant_id
+
+    @property
+    def client_id(self) -> Optional[str]:
+        """Get the app registration client ID, if configured."""
+        return self._client_id
+
     @property
     def token_expires_at(self) -> Optional[datetime]:
         """Get the token expiration time."""
-        return self._token_expires_at
+        if self._expires_on is None:
+            return None
+        return datetime.fromtimestamp(self._expires_on)
+
+    @property
+    def token_expires_on(self) -> Optional[float]:
+        """Get the token expiration time as absolute epoch seconds."""
+        return self._expires_on
 
     @property
     def is_token_cached(self) -> bool:
@@ -354,18 +710,46 @@ class D365TokenProvider:
         """
         Close the credential and release resources.
 
-        Should be called when the token provider is no longer needed.
+        Should be called when the token provider is no longer needed; it
+        cannot acquire tokens afterwards. Calling it again is a no-op.
         """
+        if self._closed:
+            return
+        self._closed = True
+
+        running = asyncio.get_running_loop()
+        for loop, task in list(self._inflight.items()):
+            if task.done():
+                continue
+            if loop is running:
+                task.cancel()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(task.cancel)
+        self._inflight.clear()
+
         if self._credential:
+            # A shared credential is only closed by the last provider using it
+            owned = self._credential_key is None or self._release_shared_credential()
             try:
-                await self._credential.close()
-                logger.debug("D365TokenProvider credential closed")
+                if owned and self._credential_loop is running:
+                    await self._credential.close()
+                    logger.debug("D365TokenProvider credential closed")
+                elif owned and self._credential_loop.is_running():
+                    # Its transport must be closed on the loop that opened it
+                    await asyncio.wrap_future(
+                        asyncio.run_coroutine_threadsafe(
+                            self._credential.close(), self._credential_loop
+                        )
+                    )
+                    logger.debug("D365TokenProvider credential closed")
             except Exception as e:
                 logger.warning("Error closing D365 credential", error=str(e))
             finally:
                 self._credential = None
+                self._credential_loop = None
                 self._cached_token = None
-                self._token_expires_at = None
+                self._expires_on = None
+                self._refresh_at_mono = self._expires_at_mono = 0.0
 
     async def __aenter__(self):
         """Async context manager entry."""
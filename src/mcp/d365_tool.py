@@ -9,6 +9,9 @@ Production hardening features:
 - Circuit breaker for fault tolerance
 - OpenTelemetry tracing and metrics
 - Proper httpx timeout configuration
+- HTTP connection pool shared across tool instances
+- Opt-in pooling of connected MCP sessions across connect/close cycles
+- TTL response cache and in-flight call sharing for read-only tools
 
 Key D365 MCP Behaviors:
 - 25 Row Limit: D365 MCP returns max 25 rows - results indicate if limit was hit
@@ -18,9 +21,27 @@ Key D365 MCP Behaviors:
 """
 
 import asyncio
+import functools
+import hashlib
+import json
+import random
 import time
 from contextlib import asynccontextmanager
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+from weakref import WeakKeyDictionary, WeakSet
 
 import structlog
 
@@ -35,13 +56,24 @@ except ImportError:
 # Import httpx for custom HTTP client
 try:
     import httpx
-    from httpx import AsyncClient, HTTPStatusError
+    from httpx import AsyncClient, Auth, HTTPStatusError
     HTTPX_AVAILABLE = True
+    # httpx transport errors don't all subclass the stdlib network errors
+    _TRANSIENT_ERRORS: Tuple[type, ...] = (
+        httpx.TimeoutException,
+        httpx.NetworkError,
+        httpx.RemoteProtocolError,
+        ConnectionError,
+        TimeoutError,
+        OSError,
+    )
 except ImportError:
     HTTPX_AVAILABLE = False
     httpx = None
     AsyncClient = None
+    Auth = object
     HTTPStatusError = Exception
+    _TRANSIENT_ERRORS = (ConnectionError, TimeoutError, OSError)
 
 # Import observability
 try:
@@ -63,10 +95,160 @@ except ImportError:
 
 if TYPE_CHECKING:
     from src.mcp.d365_oauth import D365TokenProvider
-    from src.mcp.session import MCPSessionManager
+    from src.mcp.session import MCPSessionManager, MCPSessionState
 
 logger = structlog.get_logger(__name__)
 
+# Process-wide bearer tokens shared by D365MCPTool instances, keyed on
+# (tenant_id, client_id, environment_url) and holding (token, expires_on) with
+# expires_on as absolute epoch seconds. Lets connects and reconnects from many
+# tools skip their token provider while a token is still good
+_TOKEN_CACHE: Dict[Tuple[Optional[str], Optional[str], str], Tuple[str, float]] = {}
+# Tokens are reused only while this far from expiry
+_TOKEN_CACHE_BUFFER_SECONDS = 300.0
+# Refresh requests within this long of a completed refresh are satisfied by
+# it, so a burst of 401s from in-flight calls triggers one refresh
+_REFRESH_COALESCE_SECONDS = 2.0
+# Read-only tools whose responses are cached by default
+DEFAULT_RESPONSE_CACHE_TOOLS: Tuple[str, ...] = ("find_menu_item",)
+# Chats with cached responses per tool; the oldest is dropped beyond this
+_RESPONSE_CACHE_MAX_CHATS = 1024
+# Cached responses per chat; the oldest is dropped beyond this
+_RESPONSE_CACHE_MAX_ENTRIES = 256
+# Guards cache fills so concurrent connects don't stampede the token
+# endpoint; asyncio locks are loop-bound, so there is one per event loop
+_TOKEN_CACHE_LOCKS: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    WeakKeyDictionary()
+)
+
+
+def _cached_token(key: Tuple[Optional[str], Optional[str], str]) -> Optional[str]:
+    """Get a shared token that is still outside the expiry buffer."""
+    entry = _TOKEN_CACHE.get(key)
+    if entry is not None and time.time() < entry[1] - _TOKEN_CACHE_BUFFER_SECONDS:
+        return entry[0]
+    return None
+
+
+def _arguments_digest(arguments: Dict[str, Any]) -> str:
+    """Stable digest of tool arguments for response cache keys."""
+    encoded = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def _token_cache_lock() -> asyncio.Lock:
+    """Get the token cache lock for the running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _TOKEN_CACHE_LOCKS.get(loop)
+    if lock is None:
+        lock = _TOKEN_CACHE_LOCKS[loop] = asyncio.Lock()
+    return lock
+
+
+def _parse_retry_after(value: Optional[str], default: float, maximum: float) -> float:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Accepts both forms allowed by RFC 7231, delay-seconds and an HTTP-date.
+
+    Args:
+        value: Retry-After header value, if any
+        default: Seconds to use when the header is missing or malformed
+        maximum: Upper bound, so a misbehaving server can't stall retries
+
+    Returns:
+        Seconds to wait, clamped to [0, maximum]
+    """
+    if not value:
+        seconds = default
+    elif value.isdigit():
+        seconds = int(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+            seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            seconds = default
+    return min(max(seconds, 0.0), maximum)
+
+
+class _BearerAuth(Auth):
+    """
+    httpx auth for a shared D365 HTTP client.
+
+    Attaches the current bearer token to every request. On a 401 one of the
+    connected tools using the client refreshes the token, and the request
+    is retried once, so tool calls don't see an expired token.
+    """
+
+    def __init__(self, token: str):
+        self.token = token
+        # Connected tools using the client; any of them can refresh the token
+        self.tools: "WeakSet[D365MCPTool]" = WeakSet()
+
+    async def async_auth_flow(self, request: "httpx.Request"):
+        """Send the request with the current token, refreshing once on 401."""
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        response = yield request
+        if response.status_code != 401:
+            return
+
+        tool = next(iter(self.tools), None)
+        if tool is None:
+            return
+        logger.warning("Got 401, refreshing token", url=str(request.url))
+        await tool.refresh_token()
+        request.headers["Authorization"] = f"Bearer {self.token}"
+        yield request
+
+
+# HTTP clients shared by D365MCPTool instances so tools for the same service
+# account and environment share one keep-alive pool. Keyed like _TOKEN_CACHE;
+# connections are bound to the event loop that opened them, so clients are
+# kept per loop. Clients are created without awaiting, so no lock is needed
+_SHARED_CLIENTS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Optional[str], Optional[str], str], Tuple[AsyncClient, _BearerAuth]]]" = (
+    WeakKeyDictionary()
+)
+
+
+# Connected MCP tools kept after D365MCPTool.close() so a later connect() for
+# the same account, environment and tool name skips the MCP handshake. D365
+# form state lives in the server session and comes along with it, so pooling
+# is off unless mcp_pool_size is set. MCP
+# sessions are bound to the event loop that opened them, so pools are kept per
+# loop. Entries are (tool, monotonic time it was returned), oldest first
+_MCP_POOLS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Optional[str], Optional[str], str, str], List[Tuple[MCPStreamableHTTPTool, float]]]]" = (
+    WeakKeyDictionary()
+)
+
+
+async def _discard_mcp_tool(mcp_tool: "MCPStreamableHTTPTool") -> None:
+    """Close an MCP tool, logging rather than raising on failure."""
+    try:
+        await mcp_tool.__aexit__(None, None, None)
+    except Exception as e:
+        logger.warning("Error closing MCP tool", error=str(e))
+
+
+async def close_shared_clients() -> None:
+    """
+    Close the pooled MCP tools and shared D365 HTTP clients of the running event loop.
+
+    D365MCPTool.close() leaves pooled tools and shared clients open for
+    other tools; call this once at application shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    for pool in _MCP_POOLS.pop(loop, {}).values():
+        for mcp_tool, _ in pool:
+            await _discard_mcp_tool(mcp_tool)
+
+    clients = _SHARED_CLIENTS.pop(loop, {})
+    for client, _ in clients.values():
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("Error closing HTTP client", error=str(e))
+
 
 class CircuitBreakerOpen(Exception):
     """Exception raised when circuit breaker is open."""
@@ -112,8 +294,10 @@ class CircuitBreaker:
         self._recovery_timeout = recovery_timeout
         self._name = name
         self._state = "closed"  # closed, open, half-open
+        # Monotonic clock, so wall-clock jumps can't end recovery early or late
         self._last_failure_time: Optional[float] = None
-        self._lock = asyncio.Lock()
+        # No lock: the checks and transitions never await, so they run
+        # atomically on the event loop
 
         logger.debug(
             "CircuitBreaker initialized",
@@ -138,44 +322,64 @@ class CircuitBreaker:
             CircuitBreakerOpen: If circuit is open and recovery timeout not elapsed
             Exception: Any exception from func (also triggers circuit breaker)
         """
-        async with self._lock:
-            if self._state == "open":
-                if time.time() - self._last_failure_time > self._recovery_timeout:
-                    logger.info(
-                        "Circuit breaker transitioning to half-open",
-                        name=self._name,
-                    )
-                    self._state = "half-open"
-                else:
-                    raise CircuitBreakerOpen(
-                        f"Circuit breaker '{self._name}' is open. "
-                        f"Retry after {self._recovery_timeout - (time.time() - self._last_failure_time):.1f}s"
-                    )
-
+        self.before_call()
         try:
             result = await func(*args, **kwargs)
-            async with self._lock:
-                self._failure_count = 0
-                if self._state == "half-open":
-                    logger.info(
-                        "Circuit breaker transitioning to closed",
-                        name=self._name,
-                    )
-                self._state = "closed"
-            return result
         except Exception as e:
-            async with self._lock:
-                self._failure_count += 1
-                self._last_failure_time = time.time()
-                if self._failure_count >= self._failure_threshold:
-                    self._state = "open"
-                    logger.error(
-                        "Circuit breaker opened",
-                        name=self._name,
-                        failures=self._failure_count,
-                        error=str(e),
-                    )
+            self.record_failure(e)
             raise
+        self.record_success()
+        return result
+
+    def before_call(self) -> None:
+        """
+        Check that a call may proceed, moving open to half-open after the timeout.
+
+        Raises:
+            CircuitBreakerOpen: If circuit is open and recovery timeout not elapsed
+        """
+        if self._state == "open":
+            elapsed = time.monotonic() - self._last_failure_time
+            if elapsed > self._recovery_timeout:
+                logger.info(
+                    "Circuit breaker transitioning to half-open",
+                    name=self._name,
+                )
+                self._state = "half-open"
+            else:
+                raise CircuitBreakerOpen(
+                    f"Circuit breaker '{self._name}' is open. "
+                    f"Retry after {self._recovery_timeout - elapsed:.1f}s"
+                )
+
+    def record_success(self) -> None:
+        """Record a successful call, closing a half-open circuit."""
+        self._failure_count = 0
+        if self._state != "closed":
+            if self._state == "half-open":
+                logger.info(
+                    "Circuit breaker transitioning to closed",
+                    name=self._name,
+                )
+            self._state = "closed"
+
+    def record_failure(self, error: Exception) -> None:
+        """
+        Record a failed call, opening the circuit at the failure threshold.
+
+        Args:
+            error: Exception raised by the call
+        """
+        self._failure_count += 1
+        self._last_failure_time = time.monotonic()
+        if self._failure_count >= self._failure_threshold:
+            self._state = "open"
+            logger.error(
+                "Circuit breaker opened",
+                name=self._name,
+                failures=self._failure_count,
+                error=str(error),
+            )
 
     @property
     def state(self) -> str:
@@ -240,10 +444,21 @@ class D365MCPTool:
         session_manager: Optional["MCPSessionManager"] = None,
         description: str = "D365 Finance & Operations MCP tools",
         timeout: float = 60.0,
+        # Connection pool configuration
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        keepalive_expiry: float = 60.0,
+        # MCP session pool configuration
+        mcp_pool_size: int = 0,
+        mcp_pool_idle_timeout: float = 300.0,
+        # Response cache configuration
+        response_cache_tools: Optional[Iterable[str]] = None,
+        response_cache_ttl: float = 60.0,
         # Retry configuration
         max_retries: int = 3,
         retry_backoff_base: float = 1.0,
         retry_backoff_max: float = 30.0,
+        retryable_status_codes: Iterable[int] = (502, 503, 504),
         # Circuit breaker configuration
         circuit_breaker_failure_threshold: int = 5,
         circuit_breaker_recovery_timeout: float = 30.0,
@@ -259,9 +474,21 @@ class D365MCPTool:
             session_manager: Optional MCPSessionManager for form state tracking
             description: Tool description for agent introspection
             timeout: HTTP timeout in seconds (default: 60)
+            max_connections: Max concurrent HTTP connections (default: 1000)
+            max_keepalive_connections: Max idle keep-alive connections (default: 100)
+            keepalive_expiry: Seconds an idle connection is kept alive (default: 60.0)
+            mcp_pool_size: Connected MCP sessions kept for reuse, 0 disables (default: 0).
+                D365 keeps open forms per MCP session, so a pooled session
+                carries its previous user's form state; enable only when
+                tools are not shared between users or chats
+            mcp_pool_idle_timeout: Seconds a pooled MCP session may sit idle (default: 300.0)
+            response_cache_tools: Read-only tools whose responses are cached and
+                whose identical concurrent calls are shared (default: DEFAULT_RESPONSE_CACHE_TOOLS)
+            response_cache_ttl: Seconds a cached response is reused, 0 disables (default: 60.0)
             max_retries: Maximum retry attempts (default: 3)
             retry_backoff_base: Exponential backoff base (default: 1.0)
             retry_backoff_max: Maximum backoff seconds (default: 30.0)
+            retryable_status_codes: HTTP statuses retried with backoff (default: 502, 503, 504)
             circuit_breaker_failure_threshold: Failures before opening circuit (default: 5)
             circuit_breaker_recovery_timeout: Seconds before recovery attempt (default: 30.0)
         """
@@ -286,10 +513,12 @@ class D365MCPTool:
             self._max_retries = config.max_retries
             self._retry_backoff_base = config.retry_backoff_base
             self._retry_backoff_max = config.retry_backoff_max
+            self._retryable_status_codes = frozenset(config.retryable_status_codes)
 
             # Create token provider from config
             from src.mcp.d365_oauth import D365TokenProvider
             self._token_provider = D365TokenProvider(config=config.oauth)
+            self._owns_token_provider = True
 
             # Timeout configuration from config
             self._timeout_config = httpx.Timeout(
@@ -299,6 +528,17 @@ class D365MCPTool:
                 pool=config.timeout_pool,
             )
 
+            # Connection pool sized for concurrent tool calls from many chats
+            self._limits = httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            )
+            self._mcp_pool_size = config.mcp_pool_size
+            self._mcp_pool_idle_timeout = config.mcp_pool_idle_timeout
+            self._cacheable_tools = frozenset(config.response_cache_tools)
+            self._response_cache_ttl = config.response_cache_ttl
+
             # Circuit breaker from config
             self._circuit_breaker = CircuitBreaker(
                 failure_threshold=config.circuit_breaker_failure_threshold,
@@ -315,14 +555,31 @@ class D365MCPTool:
             self._max_retries = max_retries
             self._retry_backoff_base = retry_backoff_base
             self._retry_backoff_max = retry_backoff_max
+            self._retryable_status_codes = frozenset(retryable_status_codes)
 
             # Token provider must be provided when not using config
             if not token_provider:
                 raise ValueError("token_provider is required when not using config")
             self._token_provider = token_provider
+            # An injected provider may be shared, so its owner closes it
+            self._owns_token_provider = False
+
+            # Simple timeout (legacy mode); pool exhaustion fails fast
+            self._timeout_config = httpx.Timeout(timeout, pool=1.0)
 
-            # Simple timeout (legacy mode)
-            self._timeout_config = httpx.Timeout(timeout)
+            self._limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+            self._mcp_pool_size = mcp_pool_size
+            self._mcp_pool_idle_timeout = mcp_pool_idle_timeout
+            self._cacheable_tools = frozenset(
+                DEFAULT_RESPONSE_CACHE_TOOLS
+                if response_cache_tools is None
+                else response_cache_tools
+            )
+            self._response_cache_ttl = response_cache_ttl
 
             # Circuit breaker
             self._circuit_breaker = CircuitBreaker(
@@ -331,17 +588,57 @@ class D365MCPTool:
                 name=name,
             )
 
+        # Backoff per retry attempt, fixed by the retry settings
+        self._backoff_schedule = tuple(
+            min(self._retry_backoff_base * (2**attempt), self._retry_backoff_max)
+            for attempt in range(self._max_retries + 1)
+        )
+
         self._mcp_endpoint = f"{self._environment_url}/mcp"
+        self._token_cache_key = (
+            self._token_provider.tenant_id,
+            self._token_provider.client_id,
+            self._environment_url,
+        )
+        self._mcp_pool_key = (*self._token_cache_key, self.name)
         self._session_manager = session_manager
 
         self._mcp_tool: Optional[MCPStreamableHTTPTool] = None
+        # Whether the connected SDK tool exposes a tools list, probed on connect
+        self._mcp_has_tools = False
         self._http_client: Optional[AsyncClient] = None
+        self._bearer: Optional[_BearerAuth] = None
+        self._refresh_lock = asyncio.Lock()
+        self._last_token_refresh = 0.0
+        # Form context updates run in the background after a tool call returns;
+        # held per chat so they aren't garbage collected, a chat's next call
+        # waits only for its own, and all can be drained on close
+        self._pending_form_updates: Dict[str, Set[asyncio.Task]] = {}
+        # Cached read-only tool responses per chat, keyed on
+        # (tool_name, arguments digest) and holding (result, monotonic time)
+        self._response_cache: Dict[
+            Optional[str], Dict[Tuple[str, str], Tuple[Any, float]]
+        ] = {}
+        # When expired responses were last swept out of the cache
+        self._response_cache_swept = time.monotonic()
+        # Read-only calls in flight, keyed on (chat_id, cache generation,
+        # tool_name, arguments digest), so identical concurrent calls share
+        # one execution
+        self._inflight: Dict[Tuple[Optional[str], int, str, str], asyncio.Task] = {}
+        # Bumped by mutating calls for chats with read-only calls in flight, so
+        # reads started before a write are neither joined nor cached after it.
+        # Dropped once the chat has nothing in flight
+        self._cache_generations: Dict[Optional[str], int] = {}
         self._connected = False
 
         # Observability (Phase 3)
         self._tracer = get_tracer() if OBSERVABILITY_AVAILABLE and get_tracer else None
         self._metrics = get_metrics() if OBSERVABILITY_AVAILABLE and get_metrics else None
 
+        # Without tracing or metrics, call_tool skips all instrumentation
+        if not (self._tracer or self._metrics):
+            self.call_tool = self._call_tool_fast
+
         logger.debug(
             "D365MCPTool initialized",
             name=self.name,
@@ -368,34 +665,33 @@ class D365MCPTool:
 
         try:
             # Acquire OAuth token
-            token = await self._token_provider.get_token()
-
-            # Create HTTP client with Bearer token and proper timeout (Phase 3.2)
-            self._http_client = AsyncClient(
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
-                },
-                timeout=self._timeout_config,
-            )
-
-            # Create MCPStreamableHTTPTool with custom HTTP client
-            self._mcp_tool = MCPStreamableHTTPTool(
-                name=self.name,
-                url=self._mcp_endpoint,
-                description=self._description,
-                http_client=self._http_client,
-            )
+            token = await self._get_token()
+
+            # Shared HTTP client with Bearer token and proper timeout (Phase 3.2)
+            self._http_client, self._bearer = self._get_shared_client(token)
+            self._bearer.tools.add(self)
+
+            # Reuse a live pooled MCP session, else do the full handshake
+            self._mcp_tool = await self._checkout_pooled_tool()
+            if self._mcp_tool is None:
+                # Create MCPStreamableHTTPTool with custom HTTP client
+                self._mcp_tool = MCPStreamableHTTPTool(
+                    name=self.name,
+                    url=self._mcp_endpoint,
+                    description=self._description,
+                    http_client=self._http_client,
+                )
 
-            # Enter the async context to initialize the tool
-            await self._mcp_tool.__aenter__()
+                # Enter the async context to initialize the tool
+                await self._mcp_tool.__aenter__()
+            self._mcp_has_tools = hasattr(self._mcp_tool, "tools")
             self._connected = True
 
             logger.info(
                 "Connected to D365 MCP",
                 name=self.name,
                 endpoint=self._mcp_endpoint,
-                tool_count=len(self.tools) if hasattr(self._mcp_tool, "tools") else 0,
+                tool_count=len(self.tools),
             )
 
             return self._mcp_tool
@@ -410,24 +706,140 @@ class D365MCPTool:
             await self._cleanup()
             raise
 
+    def _get_shared_client(self, token: str) -> Tuple[AsyncClient, _BearerAuth]:
+        """
+        Get the shared HTTP client for this tool's account and environment.
+
+        The first tool to connect creates the client, so its timeout and
+        pool limits apply to every tool sharing it.
+
+        Args:
+            token: Current bearer token, applied to the shared client
+
+        Returns:
+            Tuple of the HTTP client and its bearer token holder
+        """
+        clients = _SHARED_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+        entry = clients.get(self._token_cache_key)
+        if entry is None:
+            bearer = _BearerAuth(token)
+            client = AsyncClient(
+                headers={"Content-Type": "application/json"},
+                timeout=self._timeout_config,
+                limits=self._limits,
+                auth=bearer,
+            )
+            entry = clients[self._token_cache_key] = (client, bearer)
+        else:
+            entry[1].token = token
+        return entry
+
+    async def _checkout_pooled_tool(self) -> Optional["MCPStreamableHTTPTool"]:
+        """
+        Take a live MCP tool from the pool, if there is one.
+
+        Pooled tools idle past the idle timeout or failing a ping are closed
+        and skipped.
+
+        Returns:
+            Connected MCPStreamableHTTPTool, or None if none is available
+        """
+        if not self._mcp_pool_size:
+            return None
+        pool = _MCP_POOLS.get(asyncio.get_running_loop(), {}).get(self._mcp_pool_key)
+        while pool:
+            # Most recently returned first; it is the least likely to be stale
+            mcp_tool, returned_at = pool.pop()
+            if time.monotonic() - returned_at > self._mcp_pool_idle_timeout:
+                await _discard_mcp_tool(mcp_tool)
+                continue
+            try:
+                await mcp_tool.session.send_ping()
+            except Exception as e:
+                logger.debug("Discarding stale pooled MCP session", name=self.name, error=str(e))
+                await _discard_mcp_tool(mcp_tool)
+                continue
+            return mcp_tool
+        return None
+
+    async def _release_mcp_tool(self, mcp_tool: "MCPStreamableHTTPTool") -> None:
+        """Return a connected MCP tool to the pool, closing it if the pool is full."""
+        pool = _MCP_POOLS.setdefault(asyncio.get_running_loop(), {}).setdefault(
+            self._mcp_pool_key, []
+        )
+        now = time.monotonic()
+        # Oldest entries are at the front; evict those idle past the timeout
+        while pool and now - pool[0][1] > self._mcp_pool_idle_timeout:
+            await _discard_mcp_tool(pool.pop(0)[0])
+        if len(pool) < self._mcp_pool_size:
+            pool.append((mcp_tool, now))
+        else:
+            await _discard_mcp_tool(mcp_tool)
+
+    async def _get_token(self) -> str:
+        """
+        Get a bearer token, preferring the process-wide token cache.
+
+        Returns:
+            OAuth access token string
+        """
+        token = _cached_token(self._token_cache_key)
+        if token is not None:
+            return token
+
+        async with _token_cache_lock():
+            # Another connect may have filled the cache while we waited
+            token = _cached_token(self._token_cache_key)
+            if token is None:
+                token = await self._token_provider.get_token()
+                self._store_shared_token(token)
+        return token
+
+    def _store_shared_token(self, token: str) -> None:
+        """Publish a token from our provider to the process-wide cache."""
+        expires_on = self._token_provider.token_expires_on
+        if isinstance(expires_on, (int, float)):
+            _TOKEN_CACHE[self._token_cache_key] = (token, expires_on)
+
     async def refresh_token(self) -> None:
         """
         Refresh the OAuth token in the HTTP client.
 
         Call this periodically (before token expires) to maintain
-        authenticated access to the D365 MCP server.
+        authenticated access to the D365 MCP server. If another tool has
+        already refreshed the shared token, that token is used instead of
+        requesting a new one. Concurrent callers share a single refresh, and
+        calls right after a refresh completes reuse its token.
         """
-        if not self._http_client:
+        if not self._bearer:
             logger.warning("Cannot refresh token - no HTTP client")
             return
 
-        try:
-            token = await self._token_provider.refresh_token()
-            self._http_client.headers["Authorization"] = f"Bearer {token}"
-            logger.debug("Refreshed D365 OAuth token in HTTP client")
-        except Exception as e:
-            logger.error("Failed to refresh D365 token", error=str(e))
-            raise
+        # Fast path: a refresh just completed, so this caller's 401 was
+        # against the token it replaced
+        if time.monotonic() - self._last_token_refresh < _REFRESH_COALESCE_SECONDS:
+            return
+
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if time.monotonic() - self._last_token_refresh < _REFRESH_COALESCE_SECONDS:
+                return
+
+            try:
+                shared = _cached_token(self._token_cache_key)
+                if shared is not None and shared != self._bearer.token:
+                    self._bearer.token = shared
+                    logger.debug("Using refreshed D365 OAuth token from shared cache")
+                else:
+                    token = await self._token_provider.refresh_token()
+                    self._store_shared_token(token)
+                    self._bearer.token = token
+                    logger.debug("Refreshed D365 OAuth token in HTTP client")
+            except Exception as e:
+                logger.error("Failed to refresh D365 token", error=str(e))
+                raise
+
+            self._last_token_refresh = time.monotonic()
 
     async def call_tool(
         self,
@@ -444,6 +856,7 @@ class D365MCPTool:
         - Token refresh on 401 Unauthorized
         - Rate limit handling (429)
         - Circuit breaker for fault tolerance
+        - Response caching for read-only tools
         - OpenTelemetry tracing
 
         Args:
@@ -470,68 +883,153 @@ class D365MCPTool:
             span.set_attribute("d365.environment", self._environment_url)
 
         start = time.perf_counter()
+        success = False
+        error: Optional[Exception] = None
 
         try:
-            # Execute with circuit breaker
-            result = await self._circuit_breaker.call(
-                self._execute_with_retry,
+            # Execute with retry; the circuit breaker is checked inside
+            result = await self._dispatch(
                 tool_name,
                 arguments,
                 chat_id,
                 user_id,
             )
-
-            latency_ms = (time.perf_counter() - start) * 1000
-
-            # Record metrics (Phase 3.1)
-            if self._metrics:
-                self._metrics.record_tool_call(
-                    tool_name=f"d365.{tool_name}",
-                    latency_ms=latency_ms,
-                    success=True,
-                )
-
-            if span:
-                span.set_attribute("success", True)
-                span.set_attribute("latency_ms", latency_ms)
-
+            success = True
             return result
 
-        except CircuitBreakerOpen:
-            latency_ms = (time.perf_counter() - start) * 1000
-            if self._metrics:
-                self._metrics.record_tool_call(
-                    tool_name=f"d365.{tool_name}",
-                    latency_ms=latency_ms,
-                    success=False,
-                )
-                self._metrics.record_error("CircuitBreakerOpen", "d365_mcp")
+        except CircuitBreakerOpen as e:
+            error = e
             if span:
-                span.set_attribute("success", False)
                 span.set_attribute("circuit_breaker", "open")
             raise
 
         except Exception as e:
-            latency_ms = (time.perf_counter() - start) * 1000
-
-            if self._metrics:
-                self._metrics.record_tool_call(
-                    tool_name=f"d365.{tool_name}",
-                    latency_ms=latency_ms,
-                    success=False,
-                )
-                self._metrics.record_error(type(e).__name__, "d365_mcp")
-
+            error = e
             if span:
                 span.record_exception(e)
-                span.set_attribute("success", False)
-
             raise
 
         finally:
+            # One latency measurement serves metrics and tracing on every path
+            if success or error is not None:
+                latency_ms = (time.perf_counter() - start) * 1000
+
+                # Record metrics (Phase 3.1)
+                if self._metrics:
+                    self._metrics.record_tool_call(
+                        tool_name=f"d365.{tool_name}",
+                        latency_ms=latency_ms,
+                        success=success,
+                    )
+                    if error is not None:
+                        self._metrics.record_error(type(error).__name__, "d365_mcp")
+
+                if span:
+                    span.set_attribute("success", success)
+                    if success:
+                        span.set_attribute("latency_ms", latency_ms)
+
             if span:
                 span.end()
 
+    async def _call_tool_fast(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        chat_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> Any:
+        """
+        call_tool() without tracing or metrics.
+
+        Bound in place of call_tool() when observability is disabled, so the
+        per-call span and metrics checks are skipped entirely.
+        """
+        if not self._connected or not self._mcp_tool:
+            raise RuntimeError("Not connected to D365 MCP. Call connect() first.")
+
+        return await self._dispatch(tool_name, arguments, chat_id, user_id)
+
+    async def _dispatch(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        chat_id: Optional[str],
+        user_id: Optional[str],
+    ) -> Any:
+        """
+        Run a tool call, answering read-only tools from the response cache or
+        from an identical call already in flight.
+
+        Args:
+            tool_name: Name of the MCP tool to call
+            arguments: Tool arguments
+            chat_id: Optional chat ID for session management
+            user_id: Optional user ID for session management
+
+        Returns:
+            Tool execution result
+        """
+        if tool_name not in self._cacheable_tools:
+            # Any other tool may change D365 state, so it drops the chat's
+            # cached responses
+            if self._response_cache:
+                self._response_cache.pop(chat_id, None)
+            if chat_id in self._cache_generations:
+                self._cache_generations[chat_id] += 1
+            return await self._execute_with_retry(tool_name, arguments, chat_id, user_id)
+
+        cache_key = (tool_name, _arguments_digest(arguments))
+        if self._response_cache_ttl:
+            entry = self._response_cache.get(chat_id, {}).get(cache_key)
+            if entry is not None and time.monotonic() - entry[1] < self._response_cache_ttl:
+                return entry[0]
+
+        # Identical concurrent calls share one execution. It runs as its own
+        # task so one caller being cancelled doesn't cancel it for the others
+        generation = self._cache_generations.setdefault(chat_id, 0)
+        inflight_key = (chat_id, generation, *cache_key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._execute_read_only(
+                    tool_name, arguments, chat_id, user_id, cache_key, generation
+                )
+            )
+            self._inflight[inflight_key] = task
+            task.add_done_callback(functools.partial(self._inflight_done, inflight_key))
+        return await asyncio.shield(task)
+
+    async def _execute_read_only(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        chat_id: Optional[str],
+        user_id: Optional[str],
+        cache_key: Tuple[str, str],
+        generation: int,
+    ) -> Any:
+        """Execute a read-only tool call and cache its response."""
+        result = await self._execute_with_retry(tool_name, arguments, chat_id, user_id)
+        # A mutating call made while this one ran may have outdated the result
+        if self._response_cache_ttl and self._cache_generations.get(chat_id) == generation:
+            self._cache_response(chat_id, cache_key, result)
+        return result
+
+    def _inflight_done(
+        self, inflight_key: Tuple[Optional[str], int, str, str], task: asyncio.Task
+    ) -> None:
+        """Forget a finished in-flight read-only call."""
+        if self._inflight.get(inflight_key) is task:
+            del self._inflight[inflight_key]
+        chat_id = inflight_key[0]
+        if not any(key[0] == chat_id for key in self._inflight):
+            self._cache_generations.pop(chat_id, None)
+        # Retrieve the error so it isn't reported as never retrieved when
+        # every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
     async def _execute_with_retry(
         self,
         tool_name: str,
@@ -540,7 +1038,9 @@ class D365MCPTool:
         user_id: Optional[str],
     ) -> Any:
         """
-        Execute tool call with automatic retry and token refresh on 401.
+        Execute tool call with circuit breaker and automatic retry.
+
+        Token refresh on 401 happens in the HTTP client's auth flow.
 
         Args:
             tool_name: Name of the MCP tool to call
@@ -550,61 +1050,127 @@ class D365MCPTool:
 
         Returns:
             Tool execution result
+
+        Raises:
+            CircuitBreakerOpen: If circuit breaker is open
         """
-        last_error = None
+        # The breaker counts whole-call outcomes, not individual attempts
+        breaker = self._circuit_breaker
+        breaker.before_call()
 
-        for attempt in range(self._max_retries + 1):
-            try:
-                return await self._execute_tool_call(
-                    tool_name, arguments, chat_id, user_id
-                )
+        try:
+            last_error = None
 
-            except HTTPStatusError as e:
-                if e.response.status_code == 401 and attempt < self._max_retries:
-                    # Token expired - refresh and retry
-                    logger.warning(
-                        "Got 401, refreshing token",
-                        attempt=attempt,
-                        tool_name=tool_name,
-                    )
-                    await self.refresh_token()
-                    continue
-
-                elif e.response.status_code == 429:
-                    # Rate limited - backoff
-                    retry_after = int(e.response.headers.get("Retry-After", 5))
-                    logger.warning(
-                        "Rate limited, backing off",
-                        attempt=attempt,
-                        retry_after=retry_after,
-                        tool_name=tool_name,
+            for attempt in range(self._max_retries + 1):
+                try:
+                    result = await self._execute_tool_call(
+                        tool_name, arguments, chat_id, user_id
                     )
+
+                except HTTPStatusError as e:
+                    # 401s are refreshed and retried by the client's auth flow
+                    if e.response.status_code == 429:
+                        # Rate limited - backoff
+                        retry_after = _parse_retry_after(
+                            e.response.headers.get("Retry-After"),
+                            default=5.0,
+                            maximum=self._retry_backoff_max,
+                        )
+                        logger.warning(
+                            "Rate limited, backing off",
+                            attempt=attempt,
+                            retry_after=retry_after,
+                            tool_name=tool_name,
+                        )
+                        if attempt < self._max_retries:
+                            # Up to 20% extra so calls throttled together don't
+                            # all retry at the same instant; never less than
+                            # the server asked for
+                            await asyncio.sleep(retry_after * (1 + random.random() * 0.2))
+                            continue
+
+                    elif (
+                        e.response.status_code in self._retryable_status_codes
+                        and attempt < self._max_retries
+                    ):
+                        # Gateway errors - usually transient, backoff and retry
+                        backoff = self._jittered_backoff(attempt)
+                        logger.warning(
+                            "Retryable HTTP status, retrying",
+                            attempt=attempt,
+                            status_code=e.response.status_code,
+                            backoff=backoff,
+                            tool_name=tool_name,
+                        )
+                        await asyncio.sleep(backoff)
+                        continue
+
+                    # Other HTTP errors - don't retry
+                    raise
+
+                except _TRANSIENT_ERRORS as e:
+                    last_error = e
                     if attempt < self._max_retries:
-                        await asyncio.sleep(retry_after)
+                        backoff = self._jittered_backoff(attempt)
+                        logger.warning(
+                            "Transient error, retrying",
+                            attempt=attempt,
+                            backoff=backoff,
+                            tool_name=tool_name,
+                            error=str(e),
+                        )
+                        await asyncio.sleep(backoff)
                         continue
+                    raise
 
-                # Other HTTP errors - don't retry
-                raise
+                else:
+                    breaker.record_success()
+                    return result
 
-            except (ConnectionError, TimeoutError, OSError) as e:
-                last_error = e
-                if attempt < self._max_retries:
-                    backoff = min(
-                        self._retry_backoff_base * (2**attempt),
-                        self._retry_backoff_max,
-                    )
-                    logger.warning(
-                        "Transient error, retrying",
-                        attempt=attempt,
-                        backoff=backoff,
-                        tool_name=tool_name,
-                        error=str(e),
-                    )
-                    await asyncio.sleep(backoff)
-                    continue
-                raise
+            raise last_error or RuntimeError("Max retries exceeded")
+
+        except Exception as e:
+            breaker.record_failure(e)
+            raise
 
-        raise last_error or RuntimeError("Max retries exceeded")
+    def _jittered_backoff(self, attempt: int) -> float:
+        """Backoff before retrying after the given attempt, with up to 50% jitter."""
+        # Jitter spreads out retries from concurrent calls
+        return self._backoff_schedule[attempt] * (1 + random.random() * 0.5)
+
+    def _cache_response(
+        self, chat_id: Optional[str], cache_key: Tuple[str, str], result: Any
+    ) -> None:
+        """Store a read-only tool response in the chat's response cache."""
+        now = time.monotonic()
+        if now - self._response_cache_swept >= self._response_cache_ttl:
+            self._sweep_response_cache(now)
+        responses = self._response_cache.get(chat_id)
+        if responses is None:
+            if len(self._response_cache) >= _RESPONSE_CACHE_MAX_CHATS:
+                # Dicts keep insertion order, so this drops the oldest chat
+                del self._response_cache[next(iter(self._response_cache))]
+            responses = self._response_cache[chat_id] = {}
+        else:
+            # Re-inserted so the chat's entries stay in age order
+            responses.pop(cache_key, None)
+            if len(responses) >= _RESPONSE_CACHE_MAX_ENTRIES:
+                del responses[next(iter(responses))]
+        responses[cache_key] = (result, now)
+
+    def _sweep_response_cache(self, now: float) -> None:
+        """Drop expired responses, and chats left with none, from the response cache."""
+        self._response_cache_swept = now
+        for chat_id in list(self._response_cache):
+            responses = self._response_cache[chat_id]
+            for cache_key in [
+                key
+                for key, (_, cached_at) in responses.items()
+                if now - cached_at >= self._response_cache_ttl
+            ]:
+                del responses[cache_key]
+            if not responses:
+                del self._response_cache[chat_id]
 
     async def _execute_tool_call(
         self,
@@ -626,7 +1192,11 @@ class D365MCPTool:
             Tool execution result
         """
         # Inject session context if session manager available
+        session = None
         if self._session_manager and chat_id:
+            # Form context from the chat's previous call must land before it is read
+            if chat_id in self._pending_form_updates:
+                await self._drain_form_updates(chat_id)
             session = await self._session_manager.get_or_create_session(
                 chat_id=chat_id,
                 mcp_server_name=self.name,
@@ -638,19 +1208,50 @@ class D365MCPTool:
         # Call the MCP tool
         result = await self._mcp_tool.call_tool(tool_name, arguments)
 
-        # Process result for form context updates
+        # Process result for form context updates without holding up the result
         if self._session_manager and chat_id:
-            await self._process_form_context(result, chat_id)
+            task = asyncio.create_task(
+                self._process_form_context(result, chat_id, session)
+            )
+            self._pending_form_updates.setdefault(chat_id, set()).add(task)
+            task.add_done_callback(functools.partial(self._form_update_done, chat_id))
 
         return result
 
-    async def _process_form_context(self, result: Any, chat_id: str) -> None:
+    def _form_update_done(self, chat_id: str, task: asyncio.Task) -> None:
+        """Forget a finished background form context update."""
+        pending = self._pending_form_updates.get(chat_id)
+        if pending is not None:
+            pending.discard(task)
+            if not pending:
+                del self._pending_form_updates[chat_id]
+
+    async def _drain_form_updates(self, chat_id: Optional[str] = None) -> None:
+        """
+        Wait for background form context updates to finish.
+
+        Args:
+            chat_id: Only wait for this chat's updates (default: all chats)
+        """
+        if chat_id is None:
+            tasks = [task for pending in self._pending_form_updates.values() for task in pending]
+        else:
+            tasks = list(self._pending_form_updates.get(chat_id, ()))
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _process_form_context(
+        self,
+        result: Any,
+        chat_id: str,
+        session: Optional["MCPSessionState"] = None,
+    ) -> None:
         """
         Process tool result for D365 form context updates.
 
         Args:
             result: Tool execution result
             chat_id: Chat ID for session lookup
+            session: Session already looked up for this call, if any
         """
         if not self._session_manager:
             return
@@ -666,15 +1267,26 @@ class D365MCPTool:
             form_name = getattr(result, "form_name", None)
 
         if form_context and form_name:
-            session = await self._session_manager.get_or_create_session(
-                chat_id=chat_id,
-                mcp_server_name=self.name,
-            )
-            await self._session_manager.update_form_context(
-                session_id=session.session_id,
-                form_name=form_name,
-                field_data=form_context if isinstance(form_context, dict) else {},
-            )
+            # Runs as a background task, so failures are logged, not raised
+            try:
+                if session is None:
+                    session = await self._session_manager.get_or_create_session(
+                        chat_id=chat_id,
+                        mcp_server_name=self.name,
+                    )
+                await self._session_manager.update_form_context(
+                    session_id=session.session_id,
+                    form_name=form_name,
+                    field_data=form_context if isinstance(form_context, dict) else {},
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to update D365 form context",
+                    form_name=form_name,
+                    chat_id=chat_id,
+                    error=str(e),
+                )
+                return
             logger.debug(
                 "Updated D365 form context",
                 form_name=form_name,
@@ -683,21 +1295,25 @@ class D365MCPTool:
 
     async def _cleanup(self) -> None:
         """Clean up resources."""
-        if self._mcp_tool:
-            try:
-                await self._mcp_tool.__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning("Error closing MCP tool", error=str(e))
-            finally:
-                self._mcp_tool = None
+        # Let in-flight form context updates persist before tearing down
+        if self._pending_form_updates:
+            await self._drain_form_updates()
 
-        if self._http_client:
-            try:
-                await self._http_client.aclose()
-            except Exception as e:
-                logger.warning("Error closing HTTP client", error=str(e))
-            finally:
-                self._http_client = None
+        if self._mcp_tool:
+            mcp_tool, self._mcp_tool = self._mcp_tool, None
+            self._mcp_has_tools = False
+            # Only fully connected tools are fit for reuse
+            if self._connected and self._mcp_pool_size:
+                await self._release_mcp_tool(mcp_tool)
+            else:
+                await _discard_mcp_tool(mcp_tool)
+
+        # The HTTP client is shared with other tools and stays open; see
+        # close_shared_clients()
+        if self._bearer:
+            self._bearer.tools.discard(self)
+        self._http_client = None
+        self._bearer = None
 
         self._connected = False
 
@@ -705,10 +1321,12 @@ class D365MCPTool:
         """
         Close all connections and release resources.
 
-        Should be called when the tool is no longer needed.
+        Should be called when the tool is no longer needed. A token provider
+        built from config is closed too; an injected one is left to its owner.
         """
         await self._cleanup()
-        await self._token_provider.close()
+        if self._owns_token_provider:
+            await self._token_provider.close()
         logger.info("D365MCPTool closed", name=self.name)
 
     @asynccontextmanager
@@ -729,7 +1347,8 @@ class D365MCPTool:
             mcp_tool = await self.connect()
             yield mcp_tool
         finally:
-            await self.close()
+            # The token provider stays open so the tool can be reconnected
+            await self._cleanup()
 
     @property
     def tools(self) -> List[Any]:
@@ -739,7 +1358,7 @@ class D365MCPTool:
         Returns:
             List of tool definitions from the MCP server
         """
-        if self._mcp_tool and hasattr(self._mcp_tool, "tools"):
+        if self._mcp_has_tools:
             return self._mcp_tool.tools
         return []
 
@@ -11,21 +11,53 @@ Features:
 - Kwargs building for MCP tool invocation
 """
 
+import asyncio
+import os
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, Set, Tuple, TYPE_CHECKING
 
 import structlog
 
+# uuid-utils generates time-ordered ids natively; Python 3.14+ ships uuid7
+try:
+    from uuid_utils import uuid7 as _uuid7
+except ImportError:
+    _uuid7 = getattr(uuid, "uuid7", None)
+
 if TYPE_CHECKING:
     from src.memory.cache import RedisCache, InMemoryCache
     from src.memory.persistence import ADLSPersistence
 
 logger = structlog.get_logger(__name__)
 
+# Concurrent ADLS requests when persisting or warming many sessions at once
+_PERSIST_CONCURRENCY = 16
+
+
+def _new_session_id() -> str:
+    """
+    Generate a time-ordered (UUIDv7) session ID.
+
+    IDs sort by creation time, so sessions can be scanned or expired by
+    key range without a secondary index.
+
+    Returns:
+        Session ID string in canonical UUID form
+    """
+    if _uuid7 is not None:
+        return str(_uuid7())
+    # RFC 9562 layout: 48-bit Unix ms timestamp, version 7, variant, random bits
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return str(uuid.UUID(int=value))
+
 
-@dataclass
+@dataclass(slots=True)
 class MCPSessionConfig:
     """Configuration for MCP session management."""
 
@@ -33,9 +65,19 @@ class MCPSessionConfig:
     session_ttl: int = 3600  # Session TTL in seconds
     persist_sessions: bool = True  # Persist to ADLS
     cache_prefix: str = "mcp_session:"
-
-
-@dataclass
+    # Seconds form context changes are batched before persisting (0 = persist each change)
+    persist_flush_interval: float = 2.0
+    # Sessions kept in process memory; least recently used fall back to Redis/ADLS
+    max_memory_sessions: int = 10000
+    # Seconds Redis keeps sessions past session_ttl when persisting to ADLS;
+    # such stale sessions are served at once while ADLS is checked for newer
+    # state in the background
+    stale_grace: int = 300
+    # Most recently active sessions loaded into memory at startup (0 = off)
+    warm_sessions: int = 0
+
+
+@dataclass(slots=True)
 class MCPSessionState:
     """
     Represents the state of an MCP session.
@@ -49,7 +91,8 @@ class MCPSessionState:
         user_id: Optional user identifier
         form_context: D365 form state and field data
         created_at: When the session was created
-        last_accessed: Last access timestamp
+        last_accessed_ts: Last access time as Unix epoch seconds; also
+            exposed as the ``last_accessed`` datetime
         metadata: Additional session metadata
     """
 
@@ -59,12 +102,44 @@ class MCPSessionState:
     user_id: Optional[str] = None
     form_context: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    last_accessed: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Stored as a float so touching a session on every lookup is a plain store
+    last_accessed_ts: float = field(default_factory=time.time)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Cached MCPSessionManager.build_mcp_kwargs() result; not serialized
+    _mcp_kwargs: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Cached to_dict() result with the last_accessed_ts and form_context
+    # it was built from; not serialized
+    _dict_cache: Optional[Tuple[float, Dict[str, Any], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def last_accessed(self) -> datetime:
+        """Last access time as a UTC datetime."""
+        return datetime.fromtimestamp(self.last_accessed_ts, timezone.utc)
+
+    @last_accessed.setter
+    def last_accessed(self, value: datetime) -> None:
+        self.last_accessed_ts = value.timestamp()
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        """
+        Convert to dictionary for serialization.
+
+        The result is reused until the session is touched or form_context
+        is reassigned. Like form_context itself it is shared, so do not modify it.
+        """
+        cached = self._dict_cache
+        if (
+            cached is not None
+            and cached[0] == self.last_accessed_ts
+            and cached[1] is self.form_context
+        ):
+            return cached[2]
+
+        data = {
             "session_id": self.session_id,
             "chat_id": self.chat_id,
             "mcp_server_name": self.mcp_server_name,
@@ -74,22 +149,30 @@ class MCPSessionState:
             "last_accessed": self.last_accessed.isoformat(),
             "metadata": self.metadata,
         }
+        self._dict_cache = (self.last_accessed_ts, self.form_context, data)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MCPSessionState":
         """Create from dictionary."""
+        created_at = data.get("created_at")
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        last_accessed = data.get("last_accessed")
+        if isinstance(last_accessed, str):
+            last_accessed = datetime.fromisoformat(last_accessed)
+        # One clock read covers whichever timestamps are missing
+        now = time.time() if created_at is None or not last_accessed else 0.0
         return cls(
             session_id=data["session_id"],
             chat_id=data["chat_id"],
             mcp_server_name=data["mcp_server_name"],
             user_id=data.get("user_id"),
             form_context=data.get("form_context", {}),
-            created_at=datetime.fromisoformat(data["created_at"])
-            if isinstance(data.get("created_at"), str)
-            else data.get("created_at", datetime.now(timezone.utc)),
-            last_accessed=datetime.fromisoformat(data["last_accessed"])
-            if isinstance(data.get("last_accessed"), str)
-            else data.get("last_accessed", datetime.now(timezone.utc)),
+            created_at=created_at
+            if created_at is not None
+            else datetime.fromtimestamp(now, timezone.utc),
+            last_accessed_ts=last_accessed.timestamp() if last_accessed else now,
             metadata=data.get("metadata", {}),
         )
 
@@ -142,7 +225,17 @@ class MCPSessionManager:
         self._cache = cache
         self._persistence = persistence
         self._config = config or MCPSessionConfig()
-        self._sessions: Dict[str, MCPSessionState] = {}
+        # In LRU order, least recently used first
+        self._sessions: "OrderedDict[str, MCPSessionState]" = OrderedDict()
+        # Same sessions keyed by session_id, for get_session()
+        self._by_session_id: Dict[str, MCPSessionState] = {}
+        # Sessions with changes not yet persisted, by cache key, and the
+        # pending flush that will persist them. Held here so sessions evicted
+        # from memory before the flush are still persisted
+        self._dirty: Dict[str, MCPSessionState] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Background checks of stale Redis sessions against ADLS
+        self._revalidations: Set[asyncio.Task] = set()
 
         logger.info(
             "MCPSessionManager initialized",
@@ -154,6 +247,28 @@ class MCPSessionManager:
         """Generate cache key for a session."""
         return f"{self._config.cache_prefix}{chat_id}:{mcp_server_name}"
 
+    @property
+    def _cache_ttl(self) -> int:
+        """Redis TTL for sessions, including the stale-while-revalidate grace."""
+        # Without ADLS there is nothing to revalidate a stale session against
+        if self._persistence and self._config.persist_sessions:
+            return self._config.session_ttl + self._config.stale_grace
+        return self._config.session_ttl
+
+    def _remember(self, cache_key: str, session: MCPSessionState) -> None:
+        """Keep a session in memory under its cache key and session_id."""
+        previous = self._sessions.get(cache_key)
+        if previous is not None and previous.session_id != session.session_id:
+            self._by_session_id.pop(previous.session_id, None)
+        self._sessions[cache_key] = session
+        self._sessions.move_to_end(cache_key)
+        self._by_session_id[session.session_id] = session
+
+        # Evict least recently used sessions; they reload from Redis/ADLS
+        while len(self._sessions) > self._config.max_memory_sessions:
+            _, evicted = self._sessions.popitem(last=False)
+            self._by_session_id.pop(evicted.session_id, None)
+
     async def get_or_create_session(
         self,
         chat_id: str,
@@ -166,9 +281,13 @@ class MCPSessionManager:
         Lookup order:
         1. In-memory cache
         2. Redis cache
-        3. ADLS persistence
+        3. ADLS persistence (fetched concurrently with Redis)
         4. Create new session
 
+        A Redis session idle for longer than session_ttl is still returned
+        at once while ADLS is checked for newer state in the background;
+        without persistence it is treated as a miss.
+
         Args:
             chat_id: The chat session ID to link to
             mcp_server_name: Name of the MCP server
@@ -179,51 +298,84 @@ class MCPSessionManager:
         """
         cache_key = self._cache_key(chat_id, mcp_server_name)
 
-        # Check in-memory first
-        if cache_key in self._sessions:
-            session = self._sessions[cache_key]
-            session.last_accessed = datetime.now(timezone.utc)
-            logger.debug("Found session in memory", session_id=session.session_id)
+        # Check in-memory first. This runs on every tool call, so it logs nothing
+        session = self._sessions.get(cache_key)
+        if session is not None:
+            self._sessions.move_to_end(cache_key)
+            session.last_accessed_ts = time.time()
             return session
 
-        # Try cache (Redis)
-        if self._cache:
-            try:
-                cached = await self._cache.get(cache_key)
-                if cached:
-                    session = MCPSessionState.from_dict(cached)
-                    session.last_accessed = datetime.now(timezone.utc)
-                    self._sessions[cache_key] = session
-                    logger.debug("Found session in cache", session_id=session.session_id)
-                    return session
-            except Exception as e:
-                logger.warning("Cache lookup failed", error=str(e))
+        use_persistence = self._persistence and self._config.persist_sessions
+        # Start the ADLS lookup alongside Redis so a Redis miss doesn't pay
+        # both round-trips in turn. Redis may hold newer state than ADLS, so
+        # its answer still takes precedence
+        persisted_task = None
+        if self._cache and use_persistence:
+            persisted_task = asyncio.create_task(self._persistence.get(cache_key))
+
+        try:
+            # Try cache (Redis)
+            if self._cache:
+                try:
+                    cached = await self._cache.get(cache_key)
+                    if cached:
+                        session = MCPSessionState.from_dict(cached)
+                        cached_ts = session.last_accessed_ts
+                        session.last_accessed_ts = time.time()
+                        stale = session.last_accessed_ts - cached_ts > self._config.session_ttl
+                        if stale and persisted_task is None:
+                            # Expired, with nothing to revalidate it against
+                            logger.debug("Ignoring expired cached session", session_id=session.session_id)
+                        else:
+                            self._remember(cache_key, session)
+                            logger.debug("Found session in cache", session_id=session.session_id)
+                            if stale:
+                                task = asyncio.create_task(
+                                    self._revalidate(
+                                        cache_key, session, session.last_accessed_ts, cached_ts, persisted_task
+                                    )
+                                )
+                                self._revalidations.add(task)
+                                task.add_done_callback(self._revalidations.discard)
+                                # Left running for the revalidation
+                                persisted_task = None
+                            return session
+                except Exception as e:
+                    logger.warning("Cache lookup failed", error=str(e))
 
-        # Try persistence (ADLS)
-        if self._persistence and self._config.persist_sessions:
-            try:
-                persisted = await self._persistence.get(cache_key)
-                if persisted:
-                    session = MCPSessionState.from_dict(persisted)
-                    session.last_accessed = datetime.now(timezone.utc)
-                    self._sessions[cache_key] = session
-                    # Warm up cache
-                    if self._cache:
-                        await self._cache.set(cache_key, session.to_dict(), ttl=self._config.session_ttl)
-                    logger.debug("Found session in persistence", session_id=session.session_id)
-                    return session
-            except Exception as e:
-                logger.warning("Persistence lookup failed", error=str(e))
+            # Try persistence (ADLS)
+            if use_persistence:
+                try:
+                    if persisted_task is not None:
+                        persisted = await persisted_task
+                    else:
+                        persisted = await self._persistence.get(cache_key)
+                    if persisted:
+                        session = MCPSessionState.from_dict(persisted)
+                        session.last_accessed_ts = time.time()
+                        self._remember(cache_key, session)
+                        # Warm up cache
+                        if self._cache:
+                            await self._cache.set(cache_key, session.to_dict(), ttl=self._cache_ttl)
+                        logger.debug("Found session in persistence", session_id=session.session_id)
+                        return session
+                except Exception as e:
+                    logger.warning("Persistence lookup failed", error=str(e))
+        finally:
+            # Redis answered, or this lookup was cancelled
+            if persisted_task is not None and not persisted_task.done():
+                persisted_task.cancel()
 
         # Create new session
+        now = time.time()
         session = MCPSessionState(
-            session_id=str(uuid.uuid4()),
+            session_id=_new_session_id(),
             chat_id=chat_id,
             mcp_server_name=mcp_server_name,
             user_id=user_id,
             form_context={},
-            created_at=datetime.now(timezone.utc),
-            last_accessed=datetime.now(timezone.utc),
+            created_at=datetime.fromtimestamp(now, timezone.utc),
+            last_accessed_ts=now,
             metadata={},
         )
 
@@ -239,6 +391,119 @@ class MCPSessionManager:
 
         return session
 
+    async def _revalidate(
+        self,
+        cache_key: str,
+        served: MCPSessionState,
+        served_ts: float,
+        cached_ts: float,
+        persisted_task: "asyncio.Task",
+    ) -> None:
+        """
+        Replace a stale session served from Redis if ADLS holds newer state.
+
+        The served session is only replaced while nothing has used it since,
+        so no caller's changes are lost.
+
+        Args:
+            cache_key: Session cache key
+            served: Session returned from the stale Redis copy
+            served_ts: Access time the session was returned with
+            cached_ts: Access time stored with the Redis copy
+            persisted_task: In-flight ADLS lookup for the session
+        """
+        try:
+            persisted = await persisted_task
+        except Exception as e:
+            logger.warning("Persistence revalidation failed", error=str(e))
+            return
+
+        if not persisted:
+            return
+        session = MCPSessionState.from_dict(persisted)
+        if session.last_accessed_ts <= cached_ts:
+            return
+        if self._sessions.get(cache_key) is not served or served.last_accessed_ts != served_ts:
+            return
+
+        session.last_accessed_ts = served_ts
+        self._remember(cache_key, session)
+        if self._cache:
+            try:
+                await self._cache.set(cache_key, session.to_dict(), ttl=self._cache_ttl)
+            except Exception as e:
+                logger.warning("Failed to cache session", error=str(e))
+        logger.debug("Refreshed stale session from persistence", session_id=session.session_id)
+
+    async def warm(self, limit: int = 100) -> int:
+        """
+        Load the most recently persisted sessions into memory and Redis.
+
+        Lets the first tool call of a resumed chat skip the ADLS round-trip.
+        Redis copies are preferred over ADLS, since they may be newer.
+        Sessions already looked up are left as they are.
+
+        Args:
+            limit: Maximum number of sessions to load
+
+        Returns:
+            Number of sessions loaded
+        """
+        if not (self._persistence and self._config.persist_sessions):
+            return 0
+        limit = min(limit, self._config.max_memory_sessions)
+        if limit <= 0:
+            return 0
+
+        recent = await self._persistence.list_recent_chats(self._config.cache_prefix, limit)
+        # Oldest first, so the most recent end up most recently used
+        cache_keys = [item["chat_id"] for item in reversed(recent)]
+
+        semaphore = asyncio.Semaphore(_PERSIST_CONCURRENCY)
+
+        async def load(cache_key: str) -> Tuple[Optional[MCPSessionState], bool]:
+            async with semaphore:
+                data = None
+                if self._cache:
+                    try:
+                        data = await self._cache.get(cache_key)
+                    except Exception as e:
+                        logger.warning("Cache lookup failed", error=str(e))
+                from_cache = bool(data)
+                try:
+                    if not from_cache:
+                        data = await self._persistence.get(cache_key)
+                    return (MCPSessionState.from_dict(data) if data else None), from_cache
+                except Exception as e:
+                    # Includes malformed blobs, which must not fail the whole warm
+                    logger.warning("Failed to warm session", cache_key=cache_key, error=str(e))
+                    return None, False
+
+        loaded = await asyncio.gather(*(load(k) for k in cache_keys))
+
+        uncached: Dict[str, MCPSessionState] = {}
+        count = 0
+        for cache_key, (session, from_cache) in zip(cache_keys, loaded):
+            if session is None or cache_key in self._sessions:
+                continue
+            self._remember(cache_key, session)
+            count += 1
+            if not from_cache:
+                uncached[cache_key] = session
+
+        if self._cache and uncached:
+
+            async def cache(cache_key: str, session: MCPSessionState) -> None:
+                try:
+                    await self._cache.set(cache_key, session.to_dict(), ttl=self._cache_ttl)
+                except Exception as e:
+                    logger.warning("Failed to cache session", error=str(e))
+
+            await asyncio.gather(*(cache(k, v) for k, v in uncached.items()))
+
+        logger.info("Warmed MCP sessions", count=count)
+        return count
+
     async def get_session(self, session_id: str) -> Optional[MCPSessionState]:
         """
         Get a session by its session_id.
@@ -250,9 +515,9 @@ class MCPSessionManager:
             MCPSessionState or None if not found
         """
         # Search in memory
-        for session in self._sessions.values():
-            if session.session_id == session_id:
-                return session
+        session = self._by_session_id.get(session_id)
+        if session is not None:
+            return session
 
         # Would need to search cache/persistence by session_id
         # This is less efficient, so prefer using chat_id + mcp_server_name
@@ -263,6 +528,7 @@ class MCPSessionManager:
         self,
         session: MCPSessionState,
         persist: bool = False,
+        defer: bool = False,
     ) -> None:
         """
         Save session state to cache and optionally persistence.
@@ -270,29 +536,72 @@ class MCPSessionManager:
         Args:
             session: The session to save
             persist: If True, also save to ADLS
+            defer: If True, batch the ADLS write with other changes made
+                within persist_flush_interval instead of writing now
         """
         cache_key = self._cache_key(session.chat_id, session.mcp_server_name)
-        session.last_accessed = datetime.now(timezone.utc)
+        session.last_accessed_ts = time.time()
         session_dict = session.to_dict()
 
         # Save to memory
-        self._sessions[cache_key] = session
+        self._remember(cache_key, session)
 
         # Save to cache
         if self._cache:
             try:
-                await self._cache.set(cache_key, session_dict, ttl=self._config.session_ttl)
+                await self._cache.set(cache_key, session_dict, ttl=self._cache_ttl)
             except Exception as e:
                 logger.warning("Failed to cache session", error=str(e))
 
         # Save to persistence
         if persist and self._persistence:
+            if defer and self._config.persist_flush_interval > 0:
+                self._dirty[cache_key] = session
+                if self._flush_task is None:
+                    self._flush_task = asyncio.create_task(self._flush_after_interval())
+                return
             try:
                 await self._persistence.save(cache_key, session_dict)
                 logger.debug("Persisted session", session_id=session.session_id)
             except Exception as e:
                 logger.warning("Failed to persist session", error=str(e))
 
+    async def _flush_after_interval(self) -> None:
+        """Persist sessions changed during the flush interval."""
+        try:
+            await asyncio.sleep(self._config.persist_flush_interval)
+        finally:
+            self._flush_task = None
+        await self._flush_dirty()
+
+    async def _flush_dirty(self) -> None:
+        """Persist sessions with changes not yet saved to ADLS."""
+        dirty, self._dirty = self._dirty, {}
+        await self._persist_sessions(dirty)
+
+    async def _persist_sessions(self, sessions: Dict[str, MCPSessionState]) -> None:
+        """
+        Save sessions to ADLS concurrently, logging rather than raising failures.
+
+        Args:
+            sessions: Sessions to save, by cache key
+        """
+        limit = asyncio.Semaphore(_PERSIST_CONCURRENCY)
+
+        async def persist(cache_key: str, session: MCPSessionState) -> None:
+            async with limit:
+                try:
+                    await self._persistence.save(cache_key, session.to_dict())
+                    logger.debug("Persisted session", session_id=session.session_id)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to persist session",
+                        session_id=session.session_id,
+                        error=str(e),
+                    )
+
+        await asyncio.gather(*(persist(k, v) for k, v in sessions.items()))
+
     async def update_form_context(
         self,
         session_id: str,
@@ -310,23 +619,36 @@ class MCPSessionManager:
             field_data: Dictionary of field values
 
         Returns:
-            True if update successful
+            True if update successful, including when nothing changed
         """
         session = await self.get_session(session_id)
         if not session:
             logger.warning("Session not found for form context update", session_id=session_id)
             return False
 
+        form = session.form_context.get(form_name)
+        if (
+            form is not None
+            and session.form_context.get("_active_form") == form_name
+            and all(key in form and form[key] == value for key, value in field_data.items())
+        ):
+            # Tool results often repeat the form state they were given; skip
+            # re-serializing and re-caching a session that hasn't changed
+            return True
+
         # Update form context
-        if form_name not in session.form_context:
-            session.form_context[form_name] = {}
+        if form is None:
+            form = session.form_context[form_name] = {}
 
-        session.form_context[form_name].update(field_data)
+        form.update(field_data)
         session.form_context["_active_form"] = form_name
         session.form_context["_last_update"] = datetime.now(timezone.utc).isoformat()
+        session._mcp_kwargs = None
 
-        # Save updated session
-        await self.save_session(session, persist=self._config.persist_sessions)
+        # Save updated session; multi-field form work is persisted in batches
+        await self.save_session(
+            session, persist=self._config.persist_sessions, defer=True
+        )
 
         logger.debug(
             "Updated form context",
@@ -350,20 +672,29 @@ class MCPSessionManager:
             form_name: Optional specific form to clear (clears all if None)
 
         Returns:
-            True if successful
+            True if successful, including when there was nothing to clear
         """
         session = await self.get_session(session_id)
         if not session:
             return False
 
+        form_context = session.form_context
         if form_name:
-            session.form_context.pop(form_name, None)
-            if session.form_context.get("_active_form") == form_name:
-                session.form_context.pop("_active_form", None)
+            active = form_context.get("_active_form") == form_name
+            if form_name not in form_context and not active:
+                return True
+            form_context.pop(form_name, None)
+            if active:
+                form_context.pop("_active_form", None)
+        elif not form_context:
+            return True
         else:
             session.form_context = {}
+        session._mcp_kwargs = None
 
-        await self.save_session(session, persist=self._config.persist_sessions)
+        await self.save_session(
+            session, persist=self._config.persist_sessions, defer=True
+        )
         return True
 
     def build_mcp_kwargs(self, session: MCPSessionState) -> Dict[str, Any]:
@@ -371,20 +702,24 @@ class MCPSessionManager:
         Build kwargs dictionary for MCP tool invocation.
 
         The SDK passes custom kwargs through to MCP calls, allowing
-        session context to be included in requests.
+        session context to be included in requests. The result is cached on
+        the session until its form context changes.
 
         Args:
             session: The session to build kwargs from
 
         Returns:
-            Dictionary of kwargs to pass to MCP tool
+            Dictionary of kwargs to pass to MCP tool (shared; do not modify)
         """
-        return {
-            "session_id": session.session_id,
-            "user_id": session.user_id,
-            "form_context": session.form_context,
-            "chat_id": session.chat_id,
-        }
+        kwargs = session._mcp_kwargs
+        if kwargs is None:
+            kwargs = session._mcp_kwargs = {
+                "session_id": session.session_id,
+                "user_id": session.user_id,
+                "form_context": session.form_context,
+                "chat_id": session.chat_id,
+            }
+        return kwargs
 
     async def delete_session(
         self,
@@ -404,7 +739,10 @@ class MCPSessionManager:
         cache_key = self._cache_key(chat_id, mcp_server_name)
 
         # Remove from memory
-        self._sessions.pop(cache_key, None)
+        self._dirty.pop(cache_key, None)
+        session = self._sessions.pop(cache_key, None)
+        if session is not None:
+            self._by_session_id.pop(session.session_id, None)
 
         # Remove from cache
         if self._cache:
@@ -447,19 +785,21 @@ class MCPSessionManager:
         """
         Close the session manager and persist all sessions.
         """
+        for task in self._revalidations:
+            task.cancel()
+        # Every session is persisted below, including any awaiting a flush
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        # Dirty sessions may already have been evicted from memory
+        sessions = {**self._dirty, **self._sessions}
+        self._dirty.clear()
+
         if self._persistence and self._config.persist_sessions:
-            for session in self._sessions.values():
-                try:
-                    cache_key = self._cache_key(session.chat_id, session.mcp_server_name)
-                    await self._persistence.save(cache_key, session.to_dict())
-                except Exception as e:
-                    logger.warning(
-                        "Failed to persist session on close",
-                        session_id=session.session_id,
-                        error=str(e),
-                    )
+            await self._persist_sessions(sessions)
 
         self._sessions.clear()
+        self._by_session_id.clear()
         logger.info("MCPSessionManager closed")
 
 
@@ -472,6 +812,10 @@ def parse_mcp_session_config(config_dict: Dict[str, Any]) -> MCPSessionConfig:
         enabled = true
         session_ttl = 3600
         persist_sessions = true
+        persist_flush_interval = 2.0
+        max_memory_sessions = 10000
+        stale_grace = 300
+        warm_sessions = 0
 
     Args:
         config_dict: The agent configuration dictionary
@@ -486,4 +830,8 @@ def parse_mcp_session_config(config_dict: Dict[str, Any]) -> MCPSessionConfig:
         session_ttl=session_config.get("session_ttl", 3600),
         persist_sessions=session_config.get("persist_sessions", True),
         cache_prefix=session_config.get("cache_prefix", "mcp_session:"),
+        persist_flush_interval=session_config.get("persist_flush_interval", 2.0),
+        max_memory_sessions=session_config.get("max_memory_sessions", 10000),
+        stale_grace=session_config.get("stale_grace", 300),
+        warm_sessions=session_config.get("warm_sessions", 0),
     )
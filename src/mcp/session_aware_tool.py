@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger(__name__)
 
+# Framework kwargs that must not be forwarded to the MCP server
+_INTERNAL_KWARGS = frozenset({"chat_options", "tools", "chat_history"})
+
 
 class SessionAwareMCPTool:
     """
@@ -58,18 +61,27 @@ class SessionAwareMCPTool:
             session_manager: MCPSessionManager instance
             server_config: MCP server configuration dictionary containing:
                 - name: Server name
-                - stateful: Whether server requires sessions
+                - stateful: Must be true; non-stateful tools are not wrapped
                 - session_header: Header name for session ID (optional)
                 - form_context_header: Header name for form context (optional)
                 - requires_user_id: Whether user_id is required (optional)
+
+        Raises:
+            ValueError: If the server is not marked as stateful
         """
+        if not server_config.get("stateful", False):
+            raise ValueError(
+                f"MCP server {server_config.get('name', 'unnamed-mcp')} is not stateful; "
+                "use the tool directly instead of wrapping it"
+            )
+
         self._tool = mcp_tool
         self._session_manager = session_manager
         self._server_name = server_config.get("name", "unnamed-mcp")
         self._session_header = server_config.get("session_header", "X-Session-Id")
         self._form_context_header = server_config.get("form_context_header", "X-Form-Context")
-        self._requires_session = server_config.get("stateful", False)
         self._requires_user_id = server_config.get("requires_user_id", False)
+        self._invoke_fn = self._resolve_invoke_fn()
 
         # Copy tool metadata for agent introspection
         self._copy_tool_metadata()
@@ -77,7 +89,6 @@ class SessionAwareMCPTool:
         logger.debug(
             "Created SessionAwareMCPTool",
             server_name=self._server_name,
-            requires_session=self._requires_session,
         )
 
     def _copy_tool_metadata(self) -> None:
@@ -90,13 +101,28 @@ class SessionAwareMCPTool:
                 except AttributeError:
                     pass  # Some attributes may be read-only
 
+    def _resolve_invoke_fn(self) -> Optional[Callable[..., Any]]:
+        """
+        Pick the entry point of the underlying tool.
+
+        Handles both callable tools and tools with invoke/run methods.
+
+        Returns:
+            The coroutine function to invoke, or None if the tool has none
+        """
+        if callable(self._tool):
+            return self._tool
+        for method in ("invoke", "run"):
+            fn = getattr(self._tool, method, None)
+            if fn is not None:
+                return fn
+        return None
+
     async def __call__(self, **kwargs) -> Any:
         """
         Invoke the tool with session context injected.
 
-        Session context is only injected if:
-        1. The server is marked as stateful
-        2. A chat_id is provided in kwargs
+        Session context is only injected if a chat_id is provided in kwargs.
 
         Args:
             **kwargs: Tool invocation arguments, may include:
@@ -107,15 +133,13 @@ class SessionAwareMCPTool:
         Returns:
             Result from the underlying MCP tool
         """
-        if self._requires_session:
-            kwargs = await self._inject_session_context(kwargs)
+        kwargs = await self._inject_session_context(kwargs)
 
         # Call underlying MCP tool
         result = await self._invoke_tool(**kwargs)
 
         # Process result for session updates
-        if self._requires_session:
-            await self._process_result(result, kwargs)
+        await self._process_result(result, kwargs)
 
         return result
 
@@ -150,16 +174,11 @@ class SessionAwareMCPTool:
                 user_id=user_id,
             )
 
-            # Build and inject session kwargs
+            # Build and inject session kwargs. Runs on every call, so no
+            # debug log; the session manager logs cache misses
             session_kwargs = self._session_manager.build_mcp_kwargs(session)
             kwargs.update(session_kwargs)
 
-            logger.debug(
-                "Injected session context",
-                session_id=session.session_id,
-                server_name=self._server_name,
-            )
-
         except Exception as e:
             logger.error(
                 "Failed to inject session context",
@@ -173,30 +192,20 @@ class SessionAwareMCPTool:
         """
         Invoke the underlying tool.
 
-        Handles both callable tools and tools with invoke/run methods.
-
         Args:
             **kwargs: Tool arguments
 
         Returns:
             Tool result
         """
-        # Filter out internal kwargs that shouldn't be passed to MCP
-        internal_kwargs = {"chat_options", "tools", "chat_history"}
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k not in internal_kwargs}
-
-        # Try different invocation patterns
-        if callable(self._tool):
-            return await self._tool(**filtered_kwargs)
-        elif hasattr(self._tool, "invoke"):
-            return await self._tool.invoke(**filtered_kwargs)
-        elif hasattr(self._tool, "run"):
-            return await self._tool.run(**filtered_kwargs)
-        elif hasattr(self._tool, "__call__"):
-            return await self._tool.__call__(**filtered_kwargs)
-        else:
+        if self._invoke_fn is None:
             raise TypeError(f"MCP tool {self._server_name} is not callable")
 
+        # Filter out internal kwargs that shouldn't be passed to MCP
+        if not _INTERNAL_KWARGS.isdisjoint(kwargs):
+            kwargs = {k: v for k, v in kwargs.items() if k not in _INTERNAL_KWARGS}
+        return await self._invoke_fn(**kwargs)
+
     async def _process_result(self, result: Any, kwargs: Dict[str, Any]) -> None:
         """
         Process tool result for session state updates.
@@ -245,7 +254,7 @@ class SessionAwareMCPTool:
 
     def __repr__(self) -> str:
         """String representation."""
-        return f"SessionAwareMCPTool({self._server_name}, stateful={self._requires_session})"
+        return f"SessionAwareMCPTool({self._server_name}, stateful=True)"
 
     # Proxy common tool interface methods
 
@@ -259,7 +268,7 @@ class SessionAwareMCPTool:
     @property
     def is_stateful(self) -> bool:
         """Check if this tool requires session management."""
-        return self._requires_session
+        return True
 
     def get_schema(self) -> Optional[Dict[str, Any]]:
         """Get the tool schema if available."""
@@ -12,9 +12,27 @@ from dataclasses import dataclass
 
 import structlog
 
+# orjson serializes cached threads and sessions faster; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
 
+def _dumps(data: Dict[str, Any]) -> Any:
+    """Serialize cached data as compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"))
+
+
+def _loads(data: Any) -> Dict[str, Any]:
+    """Parse cached JSON data."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 @dataclass
 class CacheConfig:
     """Redis cache configuration."""
@@ -140,7 +158,7 @@ class RedisCache:
             
             if data:
                 logger.debug("Cache hit", chat_id=chat_id)
-                return json.loads(data)
+                return _loads(data)
             
             logger.debug("Cache miss", chat_id=chat_id)
             return None
@@ -171,7 +189,7 @@ class RedisCache:
         
         try:
             key = self._make_key(chat_id)
-            data = json.dumps(thread_data)
+            data = _dumps(thread_data)
             ttl = ttl or self.config.ttl
             
             await self._client.setex(key, ttl, data)
@@ -195,6 +213,19 @@ class RedisCache:
         except Exception as e:
             logger.warning("Cache delete failed", chat_id=chat_id, error=str(e))
             return False
+
+    async def delete_many(self, chat_ids: List[str]) -> bool:
+        """Delete several chats from cache with a single DEL."""
+        if not chat_ids or not await self._ensure_connected():
+            return False
+
+        try:
+            await self._client.delete(*(self._make_key(chat_id) for chat_id in chat_ids))
+            logger.debug("Cache delete", count=len(chat_ids))
+            return True
+        except Exception as e:
+            logger.warning("Cache delete failed", count=len(chat_ids), error=str(e))
+            return False
     
     async def get_ttl(self, chat_id: str) -> Optional[int]:
         """Get remaining TTL for a chat."""
@@ -208,6 +239,56 @@ class RedisCache:
         except Exception:
             return None
     
+    async def get_ttls(self, chat_ids: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Get remaining TTLs for several chats in one round-trip.
+
+        Args:
+            chat_ids: The chat session IDs
+
+        Returns:
+            TTL in seconds by chat ID; None for chats without one
+        """
+        if not chat_ids or not await self._ensure_connected():
+            return {}
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for chat_id in chat_ids:
+                pipe.ttl(self._make_key(chat_id))
+            ttls = await pipe.execute()
+            return {
+                chat_id: ttl if ttl > 0 else None
+                for chat_id, ttl in zip(chat_ids, ttls)
+            }
+        except Exception as e:
+            logger.warning("Cache TTL lookup failed", error=str(e))
+            return {}
+
+    async def get_many(self, chat_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get serialized threads for several chats in one round-trip.
+
+        Args:
+            chat_ids: The chat session IDs
+
+        Returns:
+            Serialized thread data by chat ID; chats not cached are omitted
+        """
+        if not chat_ids or not await self._ensure_connected():
+            return {}
+
+        try:
+            values = await self._client.mget([self._make_key(c) for c in chat_ids])
+            return {
+                chat_id: _loads(data)
+                for chat_id, data in zip(chat_ids, values)
+                if data
+            }
+        except Exception as e:
+            logger.warning("Cache multi-get failed", error=str(e))
+            return {}
+
     async def list_keys(self, pattern: str = "*") -> List[str]:
         """List all chat IDs matching pattern."""
         if not await self._ensure_connected():
@@ -248,6 +329,39 @@ class RedisCache:
             }
         except Exception:
             return None
+
+    async def get_metadata_many(self, chat_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get metadata about several cached threads in one round-trip.
+
+        Args:
+            chat_ids: The chat session IDs
+
+        Returns:
+            Metadata dicts, in chat_ids order, for the chats still cached
+        """
+        if not chat_ids or not await self._ensure_connected():
+            return []
+
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            for chat_id in chat_ids:
+                key = self._make_key(chat_id)
+                pipe.exists(key)
+                pipe.ttl(key)
+            results = await pipe.execute()
+            return [
+                {
+                    "chat_id": chat_id,
+                    "ttl_remaining": ttl if ttl > 0 else None,
+                    "cached": True
+                }
+                for chat_id, exists, ttl in zip(chat_ids, results[::2], results[1::2])
+                if exists
+            ]
+        except Exception as e:
+            logger.warning("Cache metadata lookup failed", error=str(e))
+            return []
     
     async def refresh_ttl(self, chat_id: str, ttl: Optional[int] = None) -> bool:
         """Refresh TTL for a chat without updating data."""
@@ -307,6 +421,12 @@ class InMemoryCache:
         self._store.pop(chat_id, None)
         self._timestamps.pop(chat_id, None)
         return True
+
+    async def delete_many(self, chat_ids: List[str]) -> bool:
+        """Delete several chats from memory."""
+        for chat_id in chat_ids:
+            await self.delete(chat_id)
+        return True
     
     async def list_keys(self, pattern: str = "*") -> List[str]:
         """List all chat IDs."""
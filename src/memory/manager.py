@@ -9,13 +9,21 @@ Orchestrates cache (Redis) and persistence (ADLS) with:
 """
 
 import asyncio
+import functools
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Callable, TYPE_CHECKING
+from typing import Any, Awaitable, Dict, Iterable, Iterator, List, Optional, Set, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 import structlog
 
+# tiktoken counts tokens exactly; fall back to the character heuristic
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 from src.memory.cache import RedisCache, InMemoryCache, CacheConfig
 from src.memory.persistence import ADLSPersistence, PersistenceConfig
 
@@ -30,6 +38,67 @@ AVG_CHARS_PER_TOKEN = 4  # Rough estimate for English text
 DEFAULT_MAX_TOKENS = 8000  # Max tokens before summarization
 SUMMARY_TARGET_TOKENS = 2000  # Target size for summary
 RECENT_MESSAGES_TO_KEEP = 5  # Keep recent messages after summarization
+SUMMARY_START = "[CONVERSATION SUMMARY]\n"  # Wraps the summary message content
+SUMMARY_END = "\n[END SUMMARY]"
+DEFAULT_TOKENIZER_MODEL = "gpt-4o"  # Tokenizer used when no summary_model is set
+DEFAULT_TOKENIZER_ENCODING = "o200k_base"  # For models tiktoken doesn't know
+
+# Thread data accepted by _validate_thread_data
+_VALID_ROLES = frozenset({"system", "user", "assistant", "tool", "function"})
+_METADATA_FIELDS = ("_created_at", "_updated_at", "_persisted_at")
+
+# Locks guarding session creation; chats hash onto one of these
+SESSION_LOCK_STRIPES = 64
+# Concurrent ADLS requests when persisting many chats at once
+PERSIST_CONCURRENCY = 32
+
+
+def _message_key(msg: Dict[str, Any]) -> tuple:
+    """Identify a serialized message by content and timestamp for merging."""
+    content = msg.get("content", "")
+    if not isinstance(content, str):
+        # Content block lists are unhashable
+        content = str(content)
+    return content, msg.get("timestamp", "")
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(encoding: Any, text: str) -> int:
+    """Count tokens with a tiktoken encoding; cached since old messages recur."""
+    return len(encoding.encode_ordinary(text))
+
+
+def _message_texts(messages: Iterable[Any]) -> Iterator[str]:
+    """Yield the text of each message, including its text content blocks."""
+    for msg in messages:
+        if isinstance(msg, dict):
+            content = msg.get('content', '')
+        elif hasattr(msg, 'content'):
+            content = msg.content
+        else:
+            content = str(msg)
+
+        if isinstance(content, str):
+            yield content
+        elif isinstance(content, list):
+            # Handle content blocks (text, images, etc.)
+            for block in content:
+                if isinstance(block, str):
+                    yield block
+                elif isinstance(block, dict) and 'text' in block:
+                    yield block['text']
+
+
+def _format_message(msg: Dict[str, Any]) -> str:
+    """Render one message as a ``ROLE: text`` line for the summary prompt."""
+    # Content blocks are joined with spaces
+    content = ' '.join(_message_texts((msg,)))
+
+    # Truncate very long messages
+    if len(content) > 1000:
+        content = content[:1000] + '...[truncated]'
+
+    return f"{msg.get('role', 'unknown').upper()}: {content}"
 
 
 @dataclass
@@ -48,6 +117,8 @@ class MemoryConfig:
     cache: CacheConfig = field(default_factory=CacheConfig)
     persistence: PersistenceConfig = field(default_factory=PersistenceConfig)
     summarization: SummarizationConfig = field(default_factory=SummarizationConfig)
+    # Sessions kept in process memory; least recently used reload from cache/ADLS
+    max_active_sessions: int = 10000
 
 
 @dataclass
@@ -62,6 +133,15 @@ class ChatSession:
     summarized: bool = False
     summary_count: int = 0  # Number of times this session has been summarized
     estimated_tokens: int = 0
+    # Bumped whenever the thread is saved; estimated_tokens is current while
+    # token_estimate_revision matches it
+    message_revision: int = 0
+    token_estimate_revision: Optional[int] = None
+    summary_in_flight: bool = False  # Queued or running in the summary worker
+    # Thread replaced by the last summarization and how many of its messages
+    # the summarized thread covers; turns later saved to it are carried over
+    superseded_thread: Any = None
+    superseded_count: int = 0
     # MCP session references for stateful MCP servers
     mcp_sessions: Dict[str, str] = field(default_factory=dict)  # server_name -> session_id
     
@@ -106,15 +186,31 @@ class ChatHistoryManager:
         # Initialize persistence
         self._persistence = ADLSPersistence(config.persistence)
         
-        # Track active sessions
-        self._sessions: Dict[str, ChatSession] = {}
+        # Track active sessions, least recently used first
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        # Persists of unsaved sessions evicted from memory, awaited on close()
+        self._eviction_persists: Set[asyncio.Task] = set()
+
+        # Striped locks for thread-safe session creation (prevents TOCTOU race
+        # condition per chat_id without serializing unrelated chats)
+        self._session_locks = [asyncio.Lock() for _ in range(SESSION_LOCK_STRIPES)]
 
-        # Lock for thread-safe session creation (prevents TOCTOU race condition)
-        self._session_lock = asyncio.Lock()
+        # tiktoken encoding for token estimates, set by load_tokenizer();
+        # False when unavailable
+        self._encoding: Any = None
 
         # Background persist task
         self._persist_task: Optional[asyncio.Task] = None
         self._running = False
+
+        # Cache writes from save_thread() run in the background. Each chat
+        # has at most one writer task, which writes the latest pending data
+        self._pending_cache_writes: Dict[str, Dict[str, Any]] = {}
+        self._cache_writers: Dict[str, asyncio.Task] = {}
+
+        # Background summarization, started on first use
+        self._summary_queue: asyncio.Queue = asyncio.Queue()
+        self._summary_task: Optional[asyncio.Task] = None
         
         logger.info(
             "ChatHistoryManager initialized",
@@ -146,28 +242,33 @@ class ChatHistoryManager:
         - chat_id provided, not found -> new thread with provided ID
 
         Thread Safety:
-        - Uses asyncio.Lock to prevent TOCTOU race condition where concurrent
-          requests with the same chat_id could create duplicate sessions.
+        - Uses an asyncio.Lock per chat_id stripe to prevent TOCTOU race
+          condition where concurrent requests with the same chat_id could
+          create duplicate sessions. Different chats load concurrently.
         """
         if self._agent is None:
             raise RuntimeError("Agent not set. Call set_agent() first.")
 
-        # Use lock to prevent race conditions in concurrent session creation
-        async with self._session_lock:
-            # Generate ID if not provided
-            if not chat_id:
-                chat_id = str(uuid.uuid4())
-                logger.info("Generated new chat_id", chat_id=chat_id)
-                return await self._create_new_session(chat_id)
+        # Generate ID if not provided; nothing else can be using it yet
+        if not chat_id:
+            chat_id = str(uuid.uuid4())
+            logger.info("Generated new chat_id", chat_id=chat_id)
+            return await self._create_new_session(chat_id)
 
+        # Use lock to prevent race conditions in concurrent session creation
+        async with self._session_locks[hash(chat_id) % SESSION_LOCK_STRIPES]:
             # Check if session already exists (double-check under lock)
             if chat_id in self._sessions:
                 session = self._sessions[chat_id]
+                self._sessions.move_to_end(chat_id)
                 session.last_accessed = datetime.now(timezone.utc)
                 logger.debug("Returning existing session from memory", chat_id=chat_id)
                 return chat_id, session.thread
 
-            # Try cache first
+            # Try cache first, once any background write for the chat lands
+            writer = self._cache_writers.get(chat_id)
+            if writer:
+                await writer
             cached = await self._cache.get(chat_id)
             if cached:
                 logger.info("Loading thread from cache", chat_id=chat_id)
@@ -196,10 +297,23 @@ class ChatHistoryManager:
             created_at=datetime.now(timezone.utc),
             last_accessed=datetime.now(timezone.utc)
         )
-        self._sessions[chat_id] = session
+        self._remember(chat_id, session)
         
         return chat_id, thread
     
+    def _remember(self, chat_id: str, session: ChatSession) -> None:
+        """Keep a session in memory, evicting the least recently used ones."""
+        self._sessions[chat_id] = session
+        self._sessions.move_to_end(chat_id)
+
+        # Evicted sessions reload from cache/ADLS; persist any unsaved ones
+        while len(self._sessions) > self.config.max_active_sessions:
+            evicted_id, evicted = self._sessions.popitem(last=False)
+            if self.config.persistence.enabled and not evicted.persisted:
+                task = asyncio.create_task(self._persist_session(evicted_id, evicted))
+                self._eviction_persists.add(task)
+                task.add_done_callback(self._eviction_persists.discard)
+
     def _validate_thread_data(self, thread_data: Dict[str, Any]) -> bool:
         """
         Validate thread data schema before deserialization.
@@ -230,7 +344,7 @@ class ChatHistoryManager:
                     return False
 
                 # Validate required message fields
-                if "role" in msg and msg["role"] not in ["system", "user", "assistant", "tool", "function"]:
+                if "role" in msg and msg["role"] not in _VALID_ROLES:
                     logger.warning("Invalid message role", index=i, role=msg.get("role"))
                     return False
 
@@ -242,8 +356,7 @@ class ChatHistoryManager:
                         return False
 
         # Validate metadata fields (should be strings or primitives)
-        metadata_fields = ["_created_at", "_updated_at", "_persisted_at"]
-        for field in metadata_fields:
+        for field in _METADATA_FIELDS:
             if field in thread_data:
                 value = thread_data[field]
                 if value is not None and not isinstance(value, str):
@@ -267,12 +380,9 @@ class ChatHistoryManager:
                 )
                 return await self._create_new_session(chat_id)
 
-            # Make a copy and strip metadata fields before deserializing
+            # Copy without our metadata fields before deserializing
             # The framework's deserialize_thread() doesn't expect our metadata fields
-            clean_data = dict(thread_data)
-            keys_to_strip = [k for k in clean_data.keys() if k.startswith('_')]
-            for key in keys_to_strip:
-                del clean_data[key]
+            clean_data = {k: v for k, v in thread_data.items() if not k.startswith('_')}
 
             logger.debug("Deserializing thread", chat_id=chat_id, keys=list(clean_data.keys()))
             thread = await self._agent.deserialize_thread(clean_data)
@@ -287,7 +397,7 @@ class ChatHistoryManager:
                 message_count=thread_data.get("_message_count", 0),
                 persisted=thread_data.get("_persisted", False)
             )
-            self._sessions[chat_id] = session
+            self._remember(chat_id, session)
 
             return chat_id, thread
 
@@ -307,6 +417,10 @@ class ChatHistoryManager:
     ) -> bool:
         """
         Save thread state to cache (and optionally ADLS).
+
+        The cache write runs in the background; the session in memory
+        already holds the thread. If the cache write fails, the thread is
+        persisted to ADLS instead.
         
         Args:
             chat_id: The chat session ID
@@ -317,26 +431,34 @@ class ChatHistoryManager:
             True if saved successfully
         """
         try:
+            session = self._sessions.get(chat_id)
+            if (
+                session
+                and session.superseded_thread is not None
+                and thread is session.superseded_thread
+            ):
+                # Summarized while this turn ran; carry the turn over
+                thread = await self._rebase_on_summary(chat_id, session, await thread.serialize())
+
             # Serialize thread
             thread_data = await thread.serialize()
             
             # Add metadata
-            session = self._sessions.get(chat_id)
             if session:
                 session.last_accessed = datetime.now(timezone.utc)
                 session.message_count += 1
+                session.message_revision += 1
                 thread_data["_created_at"] = session.created_at.isoformat()
                 thread_data["_message_count"] = session.message_count
             
             thread_data["_updated_at"] = datetime.now(timezone.utc).isoformat()
             
-            # Save to cache
-            cached = await self._cache.set(chat_id, thread_data)
+            # Save to cache without waiting for the round-trip
+            self._write_cache_in_background(chat_id, thread_data)
             
-            # Persist if forced or no cache available
-            if force_persist or not cached:
-                if self.config.persistence.enabled:
-                    await self._persist_with_merge(chat_id, thread_data)
+            # Persist if forced
+            if force_persist and self.config.persistence.enabled:
+                await self._persist_with_merge(chat_id, thread_data)
             
             return True
             
@@ -412,16 +534,12 @@ class ChatHistoryManager:
             if len(new_msgs) >= len(existing_msgs):
                 merged["messages"] = new_msgs
             else:
-                # This shouldn't happen, but preserve all messages
-                seen = set()
-                all_msgs = []
-                for msg in existing_msgs + new_msgs:
-                    # Dedupe by content if possible
-                    key = str(msg.get("content", "")) + str(msg.get("timestamp", ""))
-                    if key not in seen:
-                        seen.add(key)
-                        all_msgs.append(msg)
-                merged["messages"] = all_msgs
+                # This shouldn't happen, but preserve all messages. Dedupe by
+                # content and timestamp; new messages replace matching ones
+                # in place
+                by_key = {_message_key(msg): msg for msg in existing_msgs}
+                by_key.update((_message_key(msg), msg) for msg in new_msgs)
+                merged["messages"] = list(by_key.values())
         
         logger.debug(
             "Merged thread data",
@@ -432,9 +550,77 @@ class ChatHistoryManager:
         
         return merged
     
+    async def _rebase_on_summary(
+        self,
+        chat_id: str,
+        session: ChatSession,
+        thread_data: Dict[str, Any]
+    ) -> Any:
+        """
+        Append turns saved to a superseded thread to the summarized thread.
+
+        Args:
+            chat_id: The chat session ID
+            session: The chat session
+            thread_data: Serialized superseded thread
+
+        Returns:
+            The session's current thread
+        """
+        async with self._session_locks[hash(chat_id) % SESSION_LOCK_STRIPES]:
+            messages = thread_data.get('messages', [])
+            new_turns = messages[session.superseded_count:]
+            if not new_turns:
+                return session.thread
+            session.superseded_count = len(messages)
+
+            current = await session.thread.serialize()
+            merged = {k: v for k, v in current.items() if not k.startswith('_')}
+            merged['messages'] = list(current.get('messages', [])) + new_turns
+            session.thread = await self._agent.deserialize_thread(merged)
+            session.token_estimate_revision = None
+            logger.info("Carried turns over to summarized thread", chat_id=chat_id, count=len(new_turns))
+            return session.thread
+
+    def _write_cache_in_background(self, chat_id: str, thread_data: Dict[str, Any]) -> None:
+        """Queue thread data for the chat's background cache writer."""
+        self._pending_cache_writes[chat_id] = thread_data
+        if chat_id not in self._cache_writers:
+            self._cache_writers[chat_id] = asyncio.create_task(self._cache_writer(chat_id))
+
+    async def _cache_writer(self, chat_id: str) -> None:
+        """Write a chat's pending thread data to cache until none is left."""
+        try:
+            while chat_id in self._pending_cache_writes:
+                thread_data = self._pending_cache_writes.pop(chat_id)
+                try:
+                    # Persist if no cache available
+                    cached = await self._cache.set(chat_id, thread_data)
+                    if not cached and self.config.persistence.enabled:
+                        await self._persist_with_merge(chat_id, thread_data)
+                except Exception as e:
+                    logger.error("Failed to save thread", chat_id=chat_id, error=str(e))
+        finally:
+            del self._cache_writers[chat_id]
+
+    async def _cancel_cache_write(self, chat_id: str) -> None:
+        """Drop a chat's pending cache write and wait out one in progress."""
+        self._pending_cache_writes.pop(chat_id, None)
+        writer = self._cache_writers.get(chat_id)
+        if writer:
+            await writer
+
+    async def _flush_cache_writes(self) -> None:
+        """Wait until all pending cache writes are done."""
+        while self._cache_writers:
+            await asyncio.gather(*self._cache_writers.values())
+
     async def delete_chat(self, chat_id: str) -> bool:
         """Delete chat from all storage layers."""
         success = True
+
+        # A late background write would bring the chat back
+        await self._cancel_cache_write(chat_id)
         
         # Remove from cache
         await self._cache.delete(chat_id)
@@ -448,6 +634,38 @@ class ChatHistoryManager:
         self._sessions.pop(chat_id, None)
         
         return success
+
+    async def delete_chats(self, chat_ids: List[str]) -> Dict[str, bool]:
+        """
+        Delete several chats from all storage layers.
+
+        Uses one cache round-trip and one ADLS batch request per 256 chats,
+        for bulk cleanup such as removing all of a user's chats.
+
+        Args:
+            chat_ids: The chat session IDs
+
+        Returns:
+            Whether each chat was deleted, by chat ID
+        """
+        # A late background write would bring a chat back
+        for chat_id in chat_ids:
+            await self._cancel_cache_write(chat_id)
+
+        # Remove from cache
+        await self._cache.delete_many(chat_ids)
+
+        # Remove from persistence
+        if self.config.persistence.enabled:
+            results = await self._persistence.delete_many(chat_ids)
+        else:
+            results = dict.fromkeys(chat_ids, True)
+
+        # Remove from active sessions
+        for chat_id in chat_ids:
+            self._sessions.pop(chat_id, None)
+
+        return results
     
     async def list_chats(
         self, 
@@ -483,13 +701,13 @@ class ChatHistoryManager:
         
         # Cache (if Redis)
         if source in ("cache", "all") and isinstance(self._cache, RedisCache):
-            cached_ids = await self._cache.list_keys()
-            for chat_id in cached_ids:
-                if chat_id not in seen and len(results) < limit:
-                    meta = await self._cache.get_metadata(chat_id)
-                    if meta:
-                        results.append(meta)
-                        seen.add(chat_id)
+            cached_ids = [c for c in await self._cache.list_keys() if c not in seen]
+            if len(results) < limit:
+                for meta in await self._cache.get_metadata_many(cached_ids):
+                    if len(results) >= limit:
+                        break
+                    results.append(meta)
+                    seen.add(meta["chat_id"])
         
         # Persistence
         if source in ("persistence", "all") and self.config.persistence.enabled:
@@ -526,16 +744,24 @@ class ChatHistoryManager:
                 if not isinstance(self._cache, RedisCache):
                     continue
                 
-                # Check each cached chat's TTL
+                # Check every cached chat's TTL in one pipelined round-trip
                 chat_ids = await self._cache.list_keys()
-                for chat_id in chat_ids:
-                    ttl = await self._cache.get_ttl(chat_id)
-                    if ttl is not None and ttl <= (cache_ttl - persist_at):
-                        # Time to persist
-                        logger.info("Auto-persisting before TTL expiry", chat_id=chat_id, ttl=ttl)
-                        cached = await self._cache.get(chat_id)
-                        if cached:
-                            await self._persist_with_merge(chat_id, cached)
+                ttls = await self._cache.get_ttls(chat_ids)
+                expiring = [
+                    chat_id for chat_id, ttl in ttls.items()
+                    if ttl is not None and ttl <= (cache_ttl - persist_at)
+                ]
+                if not expiring:
+                    continue
+
+                # Time to persist
+                for chat_id in expiring:
+                    logger.info("Auto-persisting before TTL expiry", chat_id=chat_id, ttl=ttls[chat_id])
+                cached_threads = await self._cache.get_many(expiring)
+                await self._gather_bounded(
+                    self._persist_with_merge(chat_id, cached)
+                    for chat_id, cached in cached_threads.items()
+                )
                 
             except asyncio.CancelledError:
                 break
@@ -552,16 +778,26 @@ class ChatHistoryManager:
                 await self._persist_task
             except asyncio.CancelledError:
                 pass
+
+        # Stop summarization; queued chats are re-queued when next checked
+        if self._summary_task:
+            self._summary_task.cancel()
+            try:
+                await self._summary_task
+            except asyncio.CancelledError:
+                pass
+            self._summary_task = None
         
         # Persist all active sessions before closing
+        await self._flush_cache_writes()
+        if self._eviction_persists:
+            await asyncio.gather(*self._eviction_persists)
         if self.config.persistence.enabled:
-            for chat_id, session in self._sessions.items():
-                if not session.persisted:
-                    try:
-                        thread_data = await session.thread.serialize()
-                        await self._persist_with_merge(chat_id, thread_data)
-                    except Exception as e:
-                        logger.warning("Failed to persist on close", chat_id=chat_id, error=str(e))
+            await self._gather_bounded(
+                self._persist_session(chat_id, session)
+                for chat_id, session in list(self._sessions.items())
+                if not session.persisted
+            )
         
         # Close connections
         await self._cache.close()
@@ -570,14 +806,38 @@ class ChatHistoryManager:
         self._sessions.clear()
         logger.info("ChatHistoryManager closed")
 
+    async def _persist_session(self, chat_id: str, session: ChatSession) -> None:
+        """Serialize and persist an unsaved session on eviction or close()."""
+        try:
+            thread_data = await session.thread.serialize()
+            await self._persist_with_merge(chat_id, thread_data)
+        except Exception as e:
+            logger.warning("Failed to persist session", chat_id=chat_id, error=str(e))
+
+    @staticmethod
+    async def _gather_bounded(aws: Iterable[Awaitable[Any]]) -> None:
+        """
+        Await persistence calls concurrently, at most PERSIST_CONCURRENCY at a time.
+
+        Args:
+            aws: Awaitables that handle their own errors
+        """
+        semaphore = asyncio.Semaphore(PERSIST_CONCURRENCY)
+
+        async def bounded(aw: Awaitable[Any]) -> None:
+            async with semaphore:
+                await aw
+
+        await asyncio.gather(*(bounded(aw) for aw in aws))
+
     # ==================== Summarization Methods ====================
 
     def estimate_tokens(self, text: str) -> int:
         """
         Estimate the number of tokens in a text string.
 
-        Uses a simple character-based estimation. For more accurate
-        estimates, consider using tiktoken library.
+        Uses tiktoken once load_tokenizer() has run, otherwise a simple
+        character-based estimation.
 
         Args:
             text: The text to estimate tokens for
@@ -585,18 +845,66 @@ class ChatHistoryManager:
         Returns:
             Estimated token count
         """
+        encoding = self._get_encoding()
+        if encoding is not None:
+            return _count_tokens(encoding, text)
         return len(text) // AVG_CHARS_PER_TOKEN
 
-    def estimate_thread_tokens(self, thread: Any) -> int:
+    async def load_tokenizer(self) -> None:
+        """
+        Load the tiktoken encoding for the summary model, if installed.
+
+        tiktoken downloads the encoding's BPE file on first use unless
+        TIKTOKEN_CACHE_DIR already holds it, so this runs in a worker thread
+        rather than on the event loop. Call it at startup; token estimates
+        use the character heuristic until it has run.
+        """
+        if self._encoding is None:
+            self._encoding = await asyncio.to_thread(self._resolve_encoding)
+
+    def _resolve_encoding(self) -> Any:
+        """Resolve the tiktoken encoding, or False if unavailable."""
+        if tiktoken is None:
+            return False
+        model = self.config.summarization.summary_model or DEFAULT_TOKENIZER_MODEL
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                # Deployment names and non-OpenAI models
+                return tiktoken.get_encoding(DEFAULT_TOKENIZER_ENCODING)
+        except Exception as e:
+            logger.warning(
+                "Tokenizer unavailable, estimating tokens from characters",
+                error=str(e)
+            )
+            return False
+
+    def _get_encoding(self) -> Optional[Any]:
+        """Get the loaded tiktoken encoding, if any."""
+        return self._encoding or None
+
+    def estimate_thread_tokens(self, thread: Any, session: Optional[ChatSession] = None) -> int:
         """
         Estimate total tokens in a thread.
 
         Args:
             thread: The thread object
+            session: Optional session owning the thread. Its estimate is
+                reused until save_thread() records a change.
 
         Returns:
             Estimated total token count
         """
+        if session is not None:
+            if session.token_estimate_revision != session.message_revision:
+                session.estimated_tokens = self._count_thread_tokens(thread)
+                session.token_estimate_revision = session.message_revision
+            return session.estimated_tokens
+        return self._count_thread_tokens(thread)
+
+    def _count_thread_tokens(self, thread: Any) -> int:
+        """Walk a thread's messages to estimate its token count."""
         try:
             # Try to get messages from thread
             if hasattr(thread, 'messages'):
@@ -607,25 +915,11 @@ class ChatHistoryManager:
                 # Try serializing to get messages
                 return 0
 
-            total_chars = 0
-            for msg in messages:
-                if hasattr(msg, 'content'):
-                    content = msg.content
-                elif isinstance(msg, dict):
-                    content = msg.get('content', '')
-                else:
-                    content = str(msg)
-
-                if isinstance(content, str):
-                    total_chars += len(content)
-                elif isinstance(content, list):
-                    # Handle content blocks (text, images, etc.)
-                    for block in content:
-                        if isinstance(block, dict) and 'text' in block:
-                            total_chars += len(block['text'])
-                        elif isinstance(block, str):
-                            total_chars += len(block)
+            encoding = self._get_encoding()
+            if encoding is not None:
+                return sum(_count_tokens(encoding, text) for text in _message_texts(messages))
 
+            total_chars = sum(map(len, _message_texts(messages)))
             return total_chars // AVG_CHARS_PER_TOKEN
 
         except Exception as e:
@@ -649,9 +943,11 @@ class ChatHistoryManager:
         if not session:
             return False
 
+        if self._encoding is None:
+            await self.load_tokenizer()
+
         # Estimate current token count
-        estimated_tokens = self.estimate_thread_tokens(session.thread)
-        session.estimated_tokens = estimated_tokens
+        estimated_tokens = self.estimate_thread_tokens(session.thread, session)
 
         return estimated_tokens > self.config.summarization.max_tokens
 
@@ -661,13 +957,11 @@ class ChatHistoryManager:
         summarizer_agent: Optional["ChatAgent"] = None
     ) -> bool:
         """
-        Summarize the conversation if it exceeds token limits.
+        Queue the conversation for summarization if it exceeds token limits.
 
-        This method:
-        1. Checks if summarization is needed
-        2. Extracts messages to summarize
-        3. Generates a summary using an LLM
-        4. Replaces old messages with summary + recent messages
+        Summarization is an LLM round-trip, so it runs in a background
+        worker instead of delaying the caller's next response. A chat is
+        queued at most once until its summarization finishes.
 
         Args:
             chat_id: The chat session ID
@@ -675,11 +969,54 @@ class ChatHistoryManager:
                             If not provided, uses the main agent.
 
         Returns:
-            True if summarization was performed
+            True if summarization was queued
         """
+        session = self._sessions.get(chat_id)
+        if not session or session.summary_in_flight:
+            return False
+
         if not await self.needs_summarization(chat_id):
             return False
 
+        session.summary_in_flight = True
+        if self._summary_task is None or self._summary_task.done():
+            self._summary_task = asyncio.create_task(self._summary_worker())
+        self._summary_queue.put_nowait((chat_id, summarizer_agent))
+        return True
+
+    async def _summary_worker(self) -> None:
+        """Background loop that summarizes queued chats one at a time."""
+        while True:
+            chat_id, summarizer_agent = await self._summary_queue.get()
+            try:
+                await self._summarize(chat_id, summarizer_agent)
+            finally:
+                session = self._sessions.get(chat_id)
+                if session:
+                    session.summary_in_flight = False
+                self._summary_queue.task_done()
+
+    async def _summarize(
+        self,
+        chat_id: str,
+        summarizer_agent: Optional["ChatAgent"] = None
+    ) -> bool:
+        """
+        Summarize the conversation.
+
+        This method:
+        1. Extracts messages to summarize
+        2. Generates a summary using an LLM
+        3. Replaces old messages with summary + recent messages
+
+        Args:
+            chat_id: The chat session ID
+            summarizer_agent: Optional agent to use for summarization.
+                            If not provided, uses the main agent.
+
+        Returns:
+            True if summarization was performed
+        """
         session = self._sessions.get(chat_id)
         if not session:
             return False
@@ -699,6 +1036,7 @@ class ChatHistoryManager:
             # Get thread messages
             thread_data = await session.thread.serialize()
             messages = thread_data.get('messages', [])
+            message_total = len(messages)
 
             if len(messages) <= self.config.summarization.recent_messages_to_keep:
                 logger.debug("Not enough messages to summarize", count=len(messages))
@@ -709,8 +1047,17 @@ class ChatHistoryManager:
             old_messages = messages[:-keep_count] if keep_count > 0 else messages
             recent_messages = messages[-keep_count:] if keep_count > 0 else []
 
+            # A previous summary is folded forward whole rather than being
+            # re-summarized (and truncated) as an ordinary turn
+            prior_summary = self._extract_summary(old_messages[0])
+            if prior_summary is not None:
+                old_messages = old_messages[1:]
+                if not old_messages:
+                    logger.debug("No new messages to fold into summary")
+                    return False
+
             # Generate summary
-            summary = await self._generate_summary(agent, old_messages)
+            summary = await self._generate_summary(agent, old_messages, prior_summary)
 
             if not summary:
                 logger.warning("Failed to generate summary")
@@ -726,27 +1073,32 @@ class ChatHistoryManager:
             if new_thread:
                 # Update session
                 old_thread = session.thread
+                old_tokens = session.estimated_tokens
                 session.thread = new_thread
+                session.superseded_thread = old_thread
+                session.superseded_count = message_total
+                session.token_estimate_revision = None
                 session.summarized = True
                 session.summary_count += 1
 
-                # Save to cache
-                await self.save_thread(chat_id, new_thread)
+                # Save to cache. Saving the old thread carries over turns added
+                # to it since its messages were read; requests still holding
+                # it are carried over the same way when they save
+                await self.save_thread(chat_id, old_thread)
 
                 # Estimate new token count
-                new_tokens = self.estimate_thread_tokens(new_thread)
+                new_tokens = self.estimate_thread_tokens(session.thread, session)
 
                 logger.info(
                     "Conversation summarized successfully",
                     chat_id=chat_id,
-                    old_message_count=len(messages),
+                    old_message_count=message_total,
                     new_message_count=len(recent_messages) + 1,
-                    old_tokens=session.estimated_tokens,
+                    old_tokens=old_tokens,
                     new_tokens=new_tokens,
                     summary_count=session.summary_count
                 )
 
-                session.estimated_tokens = new_tokens
                 return True
 
             return False
@@ -763,7 +1115,8 @@ class ChatHistoryManager:
     async def _generate_summary(
         self,
         agent: "ChatAgent",
-        messages: List[Dict[str, Any]]
+        messages: List[Dict[str, Any]],
+        prior_summary: Optional[str] = None
     ) -> Optional[str]:
         """
         Generate a summary of conversation messages.
@@ -771,6 +1124,8 @@ class ChatHistoryManager:
         Args:
             agent: The agent to use for summarization
             messages: List of messages to summarize
+            prior_summary: Summary of the conversation before these messages,
+                to be updated with them
 
         Returns:
             Summary text or None if failed
@@ -778,15 +1133,30 @@ class ChatHistoryManager:
         # Format messages for summarization
         conversation_text = self._format_messages_for_summary(messages)
 
-        # Create summarization prompt
-        summary_prompt = f"""Please provide a concise summary of the following conversation.
-Focus on:
+        focus = f"""Focus on:
 1. Key topics discussed
 2. Important decisions or conclusions
 3. Any action items or pending questions
 4. Context that would be needed to continue the conversation
 
-Keep the summary under {self.config.summarization.summary_target_tokens} tokens.
+Keep the summary under {self.config.summarization.summary_target_tokens} tokens."""
+
+        # Create summarization prompt
+        if prior_summary is not None:
+            summary_prompt = f"""Please update the summary of a conversation with the new turns below.
+The updated summary must keep everything still relevant from the prior summary.
+{focus}
+
+PRIOR SUMMARY:
+{prior_summary}
+
+NEW TURNS:
+{conversation_text}
+
+UPDATED SUMMARY:"""
+        else:
+            summary_prompt = f"""Please provide a concise summary of the following conversation.
+{focus}
 
 CONVERSATION:
 {conversation_text}
@@ -811,6 +1181,27 @@ SUMMARY:"""
             logger.error("Summary generation failed", error=str(e))
             return None
 
+    @staticmethod
+    def _extract_summary(message: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the summary text from a summary message.
+
+        Args:
+            message: A serialized thread message
+
+        Returns:
+            The summary, or None if the message is not a summary message
+        """
+        content = message.get('content')
+        if message.get('role') != 'system' or not isinstance(content, str):
+            return None
+        if not content.startswith(SUMMARY_START):
+            return None
+        end = content.find(SUMMARY_END)
+        if end == -1:
+            return None
+        return content[len(SUMMARY_START):end]
+
     def _format_messages_for_summary(
         self,
         messages: List[Dict[str, Any]]
@@ -824,30 +1215,7 @@ SUMMARY:"""
         Returns:
             Formatted conversation text
         """
-        lines = []
-
-        for msg in messages:
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')
-
-            # Handle content blocks
-            if isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict) and 'text' in block:
-                        text_parts.append(block['text'])
-                    elif isinstance(block, str):
-                        text_parts.append(block)
-                content = ' '.join(text_parts)
-
-            # Truncate very long messages
-            if len(content) > 1000:
-                content = content[:1000] + '...[truncated]'
-
-            role_label = role.upper()
-            lines.append(f"{role_label}: {content}")
-
-        return '\n\n'.join(lines)
+        return '\n\n'.join(map(_format_message, messages))
 
     async def _create_summarized_thread(
         self,
@@ -873,7 +1241,7 @@ SUMMARY:"""
             # Create the summary message as a system context
             summary_message = {
                 "role": "system",
-                "content": f"[CONVERSATION SUMMARY]\n{summary}\n[END SUMMARY]\n\nThe conversation continues below:"
+                "content": f"{SUMMARY_START}{summary}{SUMMARY_END}\n\nThe conversation continues below:"
             }
 
             # Construct new thread data
@@ -918,7 +1286,7 @@ SUMMARY:"""
             return None
 
         # Update token estimate
-        session.estimated_tokens = self.estimate_thread_tokens(session.thread)
+        self.estimate_thread_tokens(session.thread, session)
 
         return {
             "chat_id": chat_id,
@@ -941,6 +1309,7 @@ def parse_memory_config(config_dict: Dict[str, Any]) -> MemoryConfig:
     Expected format:
     [agent.memory]
     enabled = true
+    max_active_sessions = 10000
     
     [agent.memory.cache]
     enabled = true
@@ -1000,5 +1369,6 @@ def parse_memory_config(config_dict: Dict[str, Any]) -> MemoryConfig:
     return MemoryConfig(
         cache=cache_config,
         persistence=persist_config,
-        summarization=summary_config
+        summarization=summary_config,
+        max_active_sessions=memory_dict.get("max_active_sessions", 10000)
     )
@@ -5,6 +5,7 @@ Uses Azure Data Lake Storage Gen2 for long-term chat history storage.
 Authentication via DefaultAzureCredential (no API keys).
 """
 
+import heapq
 import json
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -12,8 +13,17 @@ from dataclasses import dataclass
 
 import structlog
 
+# orjson serializes persisted threads and sessions faster; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
+# Most sub-requests Azure accepts in one blob batch request
+BLOB_BATCH_LIMIT = 256
+
 
 @dataclass
 class PersistenceConfig:
@@ -133,7 +143,10 @@ class ADLSPersistence:
             
             download = await blob_client.download_blob()
             content = await download.readall()
-            data = json.loads(content.decode('utf-8'))
+            if orjson is not None:
+                data = orjson.loads(content)
+            else:
+                data = json.loads(content.decode('utf-8'))
             
             logger.debug("ADLS load success", chat_id=chat_id)
             return data
@@ -170,15 +183,25 @@ class ADLSPersistence:
             path = self._make_path(chat_id)
             blob_client = self._container_client.get_blob_client(path)
             
-            # Add timestamp to data
-            thread_data["_persisted_at"] = datetime.now(timezone.utc).isoformat()
-            thread_data["_chat_id"] = chat_id
+            # Add timestamp to a copy; callers may reuse thread_data
+            thread_data = {
+                **thread_data,
+                "_persisted_at": datetime.now(timezone.utc).isoformat(),
+                "_chat_id": chat_id,
+            }
             
-            content = json.dumps(thread_data, indent=2, default=str)
+            if orjson is not None:
+                content = orjson.dumps(
+                    thread_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                )
+            else:
+                content = json.dumps(thread_data, indent=2, default=str).encode('utf-8')
             
             # Create/overwrite blob
             await blob_client.upload_blob(
-                content.encode('utf-8'),
+                content,
                 overwrite=True,
                 metadata=metadata
             )
@@ -205,6 +228,36 @@ class ADLSPersistence:
             logger.warning("ADLS delete failed", chat_id=chat_id, error=str(e))
             return False
     
+    async def delete_many(self, chat_ids: List[str]) -> Dict[str, bool]:
+        """
+        Delete several chats from ADLS using blob batch requests.
+
+        Args:
+            chat_ids: The chat session IDs
+
+        Returns:
+            Whether each chat was deleted, by chat ID
+        """
+        results = dict.fromkeys(chat_ids, False)
+        if not chat_ids or not await self._ensure_connected():
+            return results
+
+        for start in range(0, len(chat_ids), BLOB_BATCH_LIMIT):
+            batch = chat_ids[start:start + BLOB_BATCH_LIMIT]
+            try:
+                responses = await self._container_client.delete_blobs(
+                    *(self._make_path(chat_id) for chat_id in batch),
+                    raise_on_any_failure=False
+                )
+                statuses = [response.status_code async for response in responses]
+                for chat_id, status in zip(batch, statuses):
+                    results[chat_id] = 200 <= status < 300
+            except Exception as e:
+                logger.warning("ADLS batch delete failed", count=len(batch), error=str(e))
+
+        logger.debug("ADLS batch delete", requested=len(chat_ids), deleted=sum(results.values()))
+        return results
+
     async def exists(self, chat_id: str) -> bool:
         """Check if chat exists in ADLS."""
         if not await self._ensure_connected():
@@ -221,14 +274,14 @@ class ADLSPersistence:
     async def list_chats(
         self, 
         prefix: str = "",
-        limit: int = 100
+        limit: Optional[int] = 100
     ) -> List[Dict[str, Any]]:
         """
-        List persisted chats with metadata.
+        List persisted chats with metadata, in blob name order.
         
         Args:
-            prefix: Optional prefix filter
-            limit: Maximum number of results
+            prefix: Optional chat ID prefix filter
+            limit: Maximum number of results, or None for all
             
         Returns:
             List of chat metadata dicts
@@ -237,23 +290,21 @@ class ADLSPersistence:
             return []
         
         try:
-            folder = self.config.folder
-            if prefix:
-                folder = f"{folder}/{prefix}"
-            
             results = []
-            async for path in self._container_client.get_paths(path=folder):
-                if path.name.endswith('.json'):
+            async for blob in self._container_client.list_blobs(
+                name_starts_with=f"{self.config.folder}/{prefix}"
+            ):
+                if blob.name.endswith('.json'):
                     # Extract chat_id from path
-                    chat_id = path.name.rsplit('/', 1)[-1].replace('.json', '')
+                    chat_id = blob.name.rsplit('/', 1)[-1][:-len('.json')]
                     results.append({
                         "chat_id": chat_id,
-                        "path": path.name,
-                        "size": path.content_length,
-                        "last_modified": path.last_modified,
+                        "path": blob.name,
+                        "size": blob.size,
+                        "last_modified": blob.last_modified,
                         "persisted": True
                     })
-                    if len(results) >= limit:
+                    if limit is not None and len(results) >= limit:
                         break
             
             return results
@@ -261,6 +312,23 @@ class ADLSPersistence:
         except Exception as e:
             logger.warning("ADLS list failed", error=str(e))
             return []
+
+    async def list_recent_chats(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        List the most recently modified persisted chats under a prefix.
+
+        Every blob under the prefix is listed, since blob listings are in
+        name order rather than by modification time.
+
+        Args:
+            prefix: Chat ID prefix filter
+            limit: Maximum number of results
+
+        Returns:
+            Chat metadata dicts, most recently modified first
+        """
+        listed = await self.list_chats(prefix=prefix, limit=None)
+        return heapq.nlargest(limit, listed, key=lambda item: item["last_modified"])
     
     async def get_metadata(self, chat_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a chat without loading full data."""
@@ -116,6 +116,12 @@ class D365OAuthConfig(BaseModel):
     token_refresh_buffer_minutes: int = Field(
         5, ge=1, le=30, description="Minutes before expiry to refresh token"
     )
+    share_credential: bool = Field(
+        False, description="Share the client secret credential across providers in this process"
+    )
+    token_cache_path: Optional[str] = Field(
+        None, description="Encrypted on-disk token cache shared across processes"
+    )
 
     @model_validator(mode="after")
     def validate_credentials(self) -> "D365OAuthConfig":
@@ -158,7 +164,39 @@ class D365MCPConfig(BaseModel):
     timeout_connect: float = Field(10.0, ge=1.0, description="Connection timeout seconds")
     timeout_read: float = Field(60.0, ge=10.0, description="Read timeout seconds")
     timeout_write: float = Field(10.0, ge=1.0, description="Write timeout seconds")
-    timeout_pool: float = Field(5.0, ge=1.0, description="Pool timeout seconds")
+    timeout_pool: float = Field(1.0, ge=1.0, description="Pool timeout seconds")
+
+    # Connection pool limits
+    max_connections: int = Field(1000, ge=1, description="Max concurrent connections")
+    max_keepalive_connections: int = Field(
+        100, ge=0, description="Max idle keep-alive connections"
+    )
+    keepalive_expiry: float = Field(
+        60.0, ge=0.0, description="Seconds an idle keep-alive connection is kept"
+    )
+
+    # MCP session pool
+    mcp_pool_size: int = Field(
+        0,
+        ge=0,
+        description=(
+            "Connected MCP sessions kept for reuse (0 disables). Pooled sessions "
+            "keep the server's open form state, so only enable when tools are "
+            "not shared between users or chats"
+        ),
+    )
+    mcp_pool_idle_timeout: float = Field(
+        300.0, ge=0.0, description="Seconds a pooled MCP session may sit idle"
+    )
+
+    # Response cache for read-only tools
+    response_cache_tools: List[str] = Field(
+        default_factory=lambda: ["find_menu_item"],
+        description="Read-only tools whose responses are cached and concurrent calls shared",
+    )
+    response_cache_ttl: float = Field(
+        60.0, ge=0.0, description="Seconds a cached tool response is reused (0 disables)"
+    )
 
     # Retry configuration
     max_retries: int = Field(3, ge=0, le=10, description="Max retry attempts")
@@ -166,6 +204,10 @@ class D365MCPConfig(BaseModel):
         1.0, ge=0.5, description="Exponential backoff base seconds"
     )
     retry_backoff_max: float = Field(30.0, ge=5.0, description="Max backoff seconds")
+    retryable_status_codes: List[int] = Field(
+        default_factory=lambda: [502, 503, 504],
+        description="HTTP statuses retried with backoff",
+    )
 
     # Health check
     health_check_enabled: bool = Field(True, description="Enable health checks")
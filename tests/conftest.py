@@ -108,6 +108,7 @@ def mock_persistence():
     persistence.save = AsyncMock(return_value=True)
     persistence.delete = AsyncMock(return_value=True)
     persistence.list_chats = AsyncMock(return_value=[])
+    persistence.list_recent_chats = AsyncMock(return_value=[])
     persistence.close = AsyncMock()
     return persistence
 
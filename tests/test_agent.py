@@ -66,7 +66,21 @@ class TestToolLoader:
         
         configs = load_tool_configs("config/tools")
         assert "example_tool" in configs
-    
+
+    def test_load_tool_configs_large_and_invalid(self, tmp_path):
+        """Test large configs are parsed and invalid configs are skipped."""
+        import json
+        from src.loaders import load_tool_configs
+        from src.loaders.tools import MMAP_THRESHOLD_BYTES
+
+        large = {"name": "big", "description": "x" * (MMAP_THRESHOLD_BYTES + 1)}
+        (tmp_path / "big_tool.json").write_text(json.dumps(large))
+        (tmp_path / "broken_tool.json").write_text("{not json")
+
+        configs = load_tool_configs(str(tmp_path))
+        assert configs["big_tool"] == large
+        assert "broken_tool" not in configs
+
     def test_service_name_to_class_name(self):
         """Test service name conversion."""
         from src.loaders.tools import service_name_to_class_name
@@ -13,6 +13,8 @@ import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime, timedelta
 import asyncio
+import json
+import time
 
 
 # ==================== Test Fixtures ====================
@@ -139,12 +141,42 @@ class TestD365TokenProvider:
                 # First call
                 await provider.get_token()
                 # Manually expire the token
-                provider._token_expires_at = datetime.now() - timedelta(hours=1)
+                provider._expires_at_mono = time.monotonic() - 1
                 # Second call should refresh
                 token = await provider.get_token()
 
                 assert mock_credential.get_token.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_stale_token_refreshes_in_background(self, d365_config):
+        """Test that a stale token is served while a background refresh runs."""
+        mock_credential = AsyncMock()
+        mock_credential.get_token = AsyncMock(side_effect=[
+            MagicMock(
+                token="stale-token",
+                expires_on=(datetime.now() + timedelta(minutes=2)).timestamp()  # Inside buffer
+            ),
+            MagicMock(
+                token="fresh-token",
+                expires_on=(datetime.now() + timedelta(hours=1)).timestamp()
+            ),
+        ])
+        mock_credential.close = AsyncMock()
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=mock_credential):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                provider = D365TokenProvider(**d365_config)
+
+                assert await provider.get_token() == "stale-token"
+                # Stale token is returned without waiting for the refresh
+                assert await provider.get_token() == "stale-token"
+
+                await provider._inflight[asyncio.get_running_loop()]
+                assert await provider.get_token() == "fresh-token"
+                assert mock_credential.get_token.call_count == 2
+
     @pytest.mark.asyncio
     async def test_force_refresh_token(self, mock_azure_credential, d365_config):
         """Test forced token refresh."""
@@ -172,6 +204,38 @@ class TestD365TokenProvider:
                 assert token2 == "token-2"
                 assert call_count[0] == 2
 
+    @pytest.mark.asyncio
+    async def test_force_refresh_joins_inflight_acquisition(self, d365_config):
+        """Test that refresh_token() reuses an acquisition already in flight."""
+        call_count = [0]
+        release = asyncio.Event()
+
+        async def mock_get_token(scope):
+            call_count[0] += 1
+            await release.wait()
+            return MagicMock(
+                token=f"token-{call_count[0]}",
+                expires_on=(datetime.now() + timedelta(hours=1)).timestamp()
+            )
+
+        mock_credential = AsyncMock()
+        mock_credential.get_token = mock_get_token
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=mock_credential):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                provider = D365TokenProvider(**d365_config)
+
+                pending = asyncio.ensure_future(provider.get_token())
+                await asyncio.sleep(0)
+                forced = asyncio.ensure_future(provider.refresh_token())
+                await asyncio.sleep(0)
+                release.set()
+
+                assert await asyncio.gather(pending, forced) == ["token-1", "token-1"]
+                assert call_count[0] == 1
+
     @pytest.mark.asyncio
     async def test_thread_safe_token_acquisition(self, mock_azure_credential, d365_config):
         """Test that concurrent token acquisitions are thread-safe."""
@@ -202,6 +266,96 @@ class TestD365TokenProvider:
                 # Only one actual acquisition should happen (others wait on lock)
                 assert acquisition_count[0] == 1
 
+    def test_token_acquisition_across_event_loops(self, mock_azure_credential, d365_config):
+        """Test that a provider shared by threads with separate event loops works."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        async def mock_get_token(scope):
+            await asyncio.sleep(0.05)
+            return MagicMock(
+                token="loop-token",
+                expires_on=(datetime.now() + timedelta(hours=1)).timestamp()
+            )
+
+        mock_azure_credential.get_token = mock_get_token
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=mock_azure_credential):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                provider = D365TokenProvider(**d365_config)
+
+                # Each thread's refresh overlaps the other's in-flight task
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    futures = [
+                        pool.submit(asyncio.run, provider.refresh_token())
+                        for _ in range(2)
+                    ]
+                    results = [f.result() for f in futures]
+
+                assert results == ["loop-token", "loop-token"]
+
+    def test_get_token_sync(self, mock_azure_credential, d365_config):
+        """Test the sync wrapper acquires once and then serves the cached token."""
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=mock_azure_credential):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                provider = D365TokenProvider(**d365_config)
+
+                assert provider.get_token_sync() == "test-access-token-12345"
+                assert provider.get_token_sync() == "test-access-token-12345"
+                assert mock_azure_credential.get_token.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_token_sync_uses_own_credential(self, d365_config):
+        """Test that the sync path doesn't use the credential bound to the caller's loop."""
+        def make_credential(token):
+            credential = AsyncMock()
+            credential.get_token = AsyncMock(return_value=MagicMock(
+                token=token,
+                expires_on=(datetime.now() + timedelta(hours=1)).timestamp()
+            ))
+            credential.close = AsyncMock()
+            return credential
+
+        app_credential = make_credential("app-token")
+        sync_credential = make_credential("sync-token")
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch(
+                "src.mcp.d365_oauth.ClientSecretCredential",
+                side_effect=[app_credential, sync_credential],
+            ):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                provider = D365TokenProvider(**d365_config)
+                assert await provider.get_token() == "app-token"
+
+                provider._refresh_at_mono = provider._expires_at_mono = 0.0
+                assert await asyncio.to_thread(provider.get_token_sync) == "sync-token"
+
+                sync_credential.close.assert_awaited_once()
+                app_credential.close.assert_not_awaited()
+                assert provider._credential is app_credential
+
+    def test_get_token_sync_timeout(self, d365_config):
+        """Test that a sync caller timing out gets the builtin TimeoutError."""
+        async def slow_token(*args, **kwargs):
+            await asyncio.sleep(60)
+
+        credential = AsyncMock()
+        credential.get_token = AsyncMock(side_effect=slow_token)
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=credential):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                provider = D365TokenProvider(**d365_config)
+
+                with pytest.raises(TimeoutError):
+                    provider.get_token_sync(timeout=0.05)
+
     @pytest.mark.asyncio
     async def test_close_releases_resources(self, mock_azure_credential, d365_config):
         """Test that close() properly releases resources."""
@@ -217,6 +371,13 @@ class TestD365TokenProvider:
                 assert not provider.is_token_cached
                 mock_azure_credential.close.assert_called_once()
 
+                # Closing again is a no-op, and a closed provider won't
+                # silently recreate its credential
+                await provider.close()
+                mock_azure_credential.close.assert_called_once()
+                with pytest.raises(RuntimeError, match="closed"):
+                    await provider.get_token()
+
     @pytest.mark.asyncio
     async def test_context_manager(self, mock_azure_credential, d365_config):
         """Test async context manager usage."""
@@ -232,6 +393,48 @@ class TestD365TokenProvider:
                 mock_azure_credential.close.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_disk_cache_shared_between_providers(self, mock_azure_credential, d365_config, tmp_path):
+        """Test that a token persisted to disk is reused by a new provider."""
+        pytest.importorskip("cryptography")
+        cache_path = tmp_path / "d365-token.bin"
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=mock_azure_credential):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                first = D365TokenProvider(**d365_config, cache_path=cache_path)
+                assert await first.get_token() == "test-access-token-12345"
+                assert cache_path.exists()
+                assert b"test-access-token-12345" not in cache_path.read_bytes()
+
+                second = D365TokenProvider(**d365_config, cache_path=cache_path)
+                assert await second.get_token() == "test-access-token-12345"
+
+                assert mock_azure_credential.get_token.call_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "payload",
+        [[], {"scope": "x"}, {"token": "t", "expires_on": "soon"}],
+    )
+    async def test_unrecognized_disk_cache_is_ignored(
+        self, mock_azure_credential, d365_config, tmp_path, payload
+    ):
+        """Test that a cache file in another format falls back to AAD."""
+        pytest.importorskip("cryptography")
+        cache_path = tmp_path / "d365-token.bin"
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=mock_azure_credential):
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                provider = D365TokenProvider(**d365_config, cache_path=cache_path)
+                cache_path.write_bytes(provider._cache_fernet.encrypt(json.dumps(payload).encode()))
+
+                assert await provider.get_token() == "test-access-token-12345"
+                assert mock_azure_credential.get_token.call_count == 1
+
 # ==================== Error Handling Tests ====================
 
 class TestD365TokenProviderErrors:
@@ -286,7 +489,7 @@ class TestCredentialSelection:
                         ))
                     )
 
-                    from src.mcp.d365_oauth import D365TokenProvider
+                    from src.mcp.d365_oauth import D365TokenProvider, _RETRY_SETTINGS
 
                     provider = D365TokenProvider(**d365_config)
                     await provider.get_token()
@@ -295,6 +498,7 @@ class TestCredentialSelection:
                         tenant_id="test-tenant-id",
                         client_id="test-client-id",
                         client_secret="test-client-secret",
+                        **_RETRY_SETTINGS,
                     )
                     mock_dac.assert_not_called()
 
@@ -320,3 +524,85 @@ class TestCredentialSelection:
 
                     mock_dac.assert_called_once()
                     mock_csc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shared_credential_reused_and_closed_once(self, mock_azure_credential, d365_config):
+        """Test that providers sharing a service account share one credential."""
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=mock_azure_credential) as mock_csc:
+                from src.mcp.d365_oauth import D365TokenProvider
+
+                first = D365TokenProvider(**d365_config, share_credential=True)
+                second = D365TokenProvider(**d365_config, share_credential=True)
+                await first.get_token()
+                await second.get_token()
+
+                mock_csc.assert_called_once()
+
+                await first.close()
+                mock_azure_credential.close.assert_not_called()
+
+                await second.close()
+                mock_azure_credential.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_credential_uses_configured_retry_policy(self, d365_config):
+        """Test that the credential's own pipeline is built with the retry settings."""
+        pytest.importorskip("azure.identity")
+        from azure.core.pipeline.policies import AsyncRetryPolicy
+        from src.mcp.d365_oauth import D365TokenProvider, _RETRY_SETTINGS
+
+        provider = D365TokenProvider(**d365_config)
+        credential = provider._create_credential()
+        try:
+            policies = credential._client._pipeline._impl_policies
+            retry = next(p for p in policies if isinstance(p, AsyncRetryPolicy))
+
+            assert retry.total_retries == _RETRY_SETTINGS["retry_total"]
+            assert retry.backoff_factor == _RETRY_SETTINGS["retry_backoff_factor"]
+            assert retry.backoff_max == _RETRY_SETTINGS["retry_backoff_max"]
+        finally:
+            await credential.close()
+
+    @pytest.mark.asyncio
+    async def test_throttled_token_request_honours_retry_after(self, d365_config):
+        """Test that a 429 token response is retried after its Retry-After."""
+        throttled = Exception("Too many requests")
+        throttled.response = MagicMock(status_code=429, headers={"Retry-After": "2"})
+        credential = AsyncMock()
+        credential.get_token = AsyncMock(side_effect=[
+            throttled,
+            MagicMock(
+                token="retried-token",
+                expires_on=(datetime.now() + timedelta(hours=1)).timestamp()
+            ),
+        ])
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=credential):
+                with patch("src.mcp.d365_oauth.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+                    from src.mcp.d365_oauth import D365TokenProvider
+
+                    provider = D365TokenProvider(**d365_config)
+
+                    assert await provider.get_token() == "retried-token"
+                    mock_sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_throttling_gives_up_after_retry_total(self, d365_config):
+        """Test that persistent throttling raises once retries run out."""
+        throttled = Exception("Too many requests")
+        throttled.response = MagicMock(status_code=429, headers={})
+        credential = AsyncMock()
+        credential.get_token = AsyncMock(side_effect=throttled)
+
+        with patch("src.mcp.d365_oauth.AZURE_IDENTITY_AVAILABLE", True):
+            with patch("src.mcp.d365_oauth.ClientSecretCredential", return_value=credential):
+                with patch("src.mcp.d365_oauth.asyncio.sleep", new=AsyncMock()):
+                    from src.mcp.d365_oauth import D365TokenProvider, _RETRY_SETTINGS
+
+                    provider = D365TokenProvider(**d365_config)
+
+                    with pytest.raises(Exception, match="Too many requests"):
+                        await provider.get_token()
+                    assert credential.get_token.await_count == _RETRY_SETTINGS["retry_total"] + 1
@@ -139,7 +139,7 @@ class TestCircuitBreaker:
 
         breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
         breaker._state = "open"
-        breaker._last_failure_time = time.time() - 1  # 1 second ago
+        breaker._last_failure_time = time.monotonic() - 1  # 1 second ago
 
         async def success():
             return "success"
@@ -156,7 +156,7 @@ class TestCircuitBreaker:
 
         breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
         breaker._state = "open"
-        breaker._last_failure_time = time.time() - 1  # Allow recovery
+        breaker._last_failure_time = time.monotonic() - 1  # Allow recovery
 
         async def fail():
             raise Exception("Still failing")
@@ -265,6 +265,377 @@ class TestD365MCPTool:
 
                         await tool.close()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_coalesced(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that a burst of refresh_token() calls makes one provider refresh."""
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                        )
+
+                        await tool.connect()
+                        await asyncio.gather(*(tool.refresh_token() for _ in range(5)))
+
+                        mock_token_provider.refresh_token.assert_called_once()
+
+                        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_reuses_shared_token(self, mock_mcp_tool, mock_http_client):
+        """Test that tools for the same service account share a cached token."""
+        providers = []
+        for _ in range(2):
+            provider = AsyncMock()
+            provider.get_token = AsyncMock(return_value="shared-access-token")
+            provider.tenant_id = "test-tenant-id"
+            provider.client_id = "test-client-id"
+            provider.token_expires_on = time.time() + 3600
+            providers.append(provider)
+
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        with patch.dict("src.mcp.d365_tool._TOKEN_CACHE", clear=True):
+                            from src.mcp.d365_tool import D365MCPTool
+
+                            for provider in providers:
+                                tool = D365MCPTool(
+                                    environment_url="https://test.operations.dynamics.com",
+                                    token_provider=provider,
+                                )
+                                await tool.connect()
+                                await tool.close()
+
+                            providers[0].get_token.assert_called_once()
+                            providers[1].get_token.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tools_share_http_client(self, mock_token_provider, mock_mcp_tool, mock_http_client):
+        """Test that tools for one account share an HTTP client that outlives them."""
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client) as MockClient:
+                        from src.mcp.d365_tool import D365MCPTool, close_shared_clients
+
+                        tools = [
+                            D365MCPTool(
+                                environment_url="https://test.operations.dynamics.com",
+                                token_provider=mock_token_provider,
+                            )
+                            for _ in range(2)
+                        ]
+                        for tool in tools:
+                            await tool.connect()
+
+                        MockClient.assert_called_once()
+
+                        for tool in tools:
+                            await tool.close()
+                        mock_http_client.aclose.assert_not_called()
+
+                        await close_shared_clients()
+                        mock_http_client.aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_pooled_mcp_session(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that a closed tool's MCP session is reused by the next connect."""
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool) as MockTool:
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool, close_shared_clients
+
+                        for _ in range(2):
+                            tool = D365MCPTool(
+                                environment_url="https://test.operations.dynamics.com",
+                                token_provider=mock_token_provider,
+                                mcp_pool_size=2,
+                            )
+                            await tool.connect()
+                            await tool.close()
+
+                        MockTool.assert_called_once()
+                        mock_mcp_tool.__aenter__.assert_called_once()
+                        mock_mcp_tool.session.send_ping.assert_awaited_once()
+                        mock_mcp_tool.__aexit__.assert_not_called()
+
+                        await close_shared_clients()
+                        mock_mcp_tool.__aexit__.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mcp_sessions_not_pooled_by_default(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that MCP sessions, which carry D365 form state, are not reused unless opted in."""
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool) as MockTool:
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool, close_shared_clients
+
+                        for _ in range(2):
+                            tool = D365MCPTool(
+                                environment_url="https://test.operations.dynamics.com",
+                                token_provider=mock_token_provider,
+                            )
+                            await tool.connect()
+                            await tool.close()
+
+                        assert MockTool.call_count == 2
+                        assert mock_mcp_tool.__aexit__.call_count == 2
+                        await close_shared_clients()
+
+    @pytest.mark.asyncio
+    async def test_read_only_responses_are_cached(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that read-only tool responses are cached until a mutating call."""
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                        )
+                        await tool.connect()
+
+                        args = {"search_string": "All customers"}
+                        await tool.call_tool("find_menu_item", args)
+                        await tool.call_tool("find_menu_item", dict(args))
+                        assert mock_mcp_tool.call_tool.await_count == 1
+
+                        await tool.call_tool("open_form", {"name": "CustTable"})
+                        await tool.call_tool("find_menu_item", args)
+                        assert mock_mcp_tool.call_tool.await_count == 3
+
+                        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_response_cache_is_bounded(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that expired responses are swept and each chat's entries are capped."""
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        with patch("src.mcp.d365_tool._RESPONSE_CACHE_MAX_ENTRIES", 2):
+                            from src.mcp.d365_tool import D365MCPTool
+
+                            tool = D365MCPTool(
+                                environment_url="https://test.operations.dynamics.com",
+                                token_provider=mock_token_provider,
+                            )
+                            await tool.connect()
+
+                            for name in ("a", "b", "c"):
+                                await tool.call_tool(
+                                    "find_menu_item", {"search_string": name}, chat_id="chat-1"
+                                )
+                            assert len(tool._response_cache["chat-1"]) == 2
+
+                            # Age chat-1's entries past the TTL; the next fill sweeps them
+                            tool._response_cache["chat-1"] = {
+                                key: (result, cached_at - 120)
+                                for key, (result, cached_at) in tool._response_cache["chat-1"].items()
+                            }
+                            tool._response_cache_swept -= 120
+                            await tool.call_tool(
+                                "find_menu_item", {"search_string": "a"}, chat_id="chat-2"
+                            )
+                            assert list(tool._response_cache) == ["chat-2"]
+
+                            await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_read_only_calls_are_shared(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that identical concurrent read-only calls share one MCP call."""
+        release = asyncio.Event()
+
+        async def slow_call(name, args):
+            await release.wait()
+            return {"success": True}
+
+        mock_mcp_tool.call_tool = AsyncMock(side_effect=slow_call)
+
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                            response_cache_ttl=0,
+                        )
+                        await tool.connect()
+
+                        args = {"search_string": "All customers"}
+                        calls = [
+                            asyncio.create_task(tool.call_tool("find_menu_item", dict(args)))
+                            for _ in range(3)
+                        ]
+                        await asyncio.sleep(0)
+                        release.set()
+                        results = await asyncio.gather(*calls)
+
+                        assert all(r["success"] for r in results)
+                        assert mock_mcp_tool.call_tool.await_count == 1
+                        assert not tool._inflight
+
+                        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_read_in_flight_during_mutation_is_not_reused(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that a read-only call started before a mutating call isn't cached or joined."""
+        release = asyncio.Event()
+
+        async def call(name, args):
+            if name == "find_menu_item" and not release.is_set():
+                await release.wait()
+                return {"success": True, "data": "before"}
+            return {"success": True, "data": "after"}
+
+        mock_mcp_tool.call_tool = AsyncMock(side_effect=call)
+
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                        )
+                        await tool.connect()
+
+                        args = {"search_string": "All customers"}
+                        stale = asyncio.create_task(tool.call_tool("find_menu_item", dict(args)))
+                        await asyncio.sleep(0)
+                        await tool.call_tool("open_form", {"name": "CustTable"})
+
+                        fresh = asyncio.create_task(tool.call_tool("find_menu_item", dict(args)))
+                        await asyncio.sleep(0)
+                        release.set()
+                        assert (await stale)["data"] == "before"
+                        assert (await fresh)["data"] == "after"
+
+                        assert (await tool.call_tool("find_menu_item", args))["data"] == "after"
+                        assert mock_mcp_tool.call_tool.await_count == 3
+                        assert not tool._inflight
+                        assert not tool._cache_generations
+
+                        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_form_context_update_runs_in_background(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that call_tool returns before form context is persisted, and close drains it."""
+        mock_mcp_tool.call_tool = AsyncMock(
+            return_value={"form_name": "CustTable", "form_context": {"AccountNum": "US-001"}}
+        )
+        release = asyncio.Event()
+
+        async def slow_update(**kwargs):
+            await release.wait()
+
+        session_manager = MagicMock()
+        session_manager.get_or_create_session = AsyncMock(return_value=MagicMock(session_id="s1"))
+        session_manager.build_mcp_kwargs = MagicMock(return_value={})
+        session_manager.update_form_context = AsyncMock(side_effect=slow_update)
+
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                            session_manager=session_manager,
+                        )
+
+                        await tool.connect()
+                        result = await tool.call_tool("open_form", {}, chat_id="chat-1")
+
+                        assert result["form_name"] == "CustTable"
+                        assert len(tool._pending_form_updates["chat-1"]) == 1
+
+                        release.set()
+                        await tool.close()
+
+                        assert not tool._pending_form_updates
+                        session_manager.update_form_context.assert_awaited_once()
+                        # The form context update reuses the call's session lookup
+                        session_manager.get_or_create_session.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_form_context_update_only_holds_up_its_own_chat(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that a pending form context update doesn't delay other chats' calls."""
+        mock_mcp_tool.call_tool = AsyncMock(
+            return_value={"form_name": "CustTable", "form_context": {"AccountNum": "US-001"}}
+        )
+        release = asyncio.Event()
+
+        async def slow_update(**kwargs):
+            if kwargs["session_id"] == "chat-1":
+                await release.wait()
+
+        session_manager = MagicMock()
+        session_manager.get_or_create_session = AsyncMock(
+            side_effect=lambda chat_id, **kwargs: MagicMock(session_id=chat_id)
+        )
+        session_manager.build_mcp_kwargs = MagicMock(return_value={})
+        session_manager.update_form_context = AsyncMock(side_effect=slow_update)
+
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                            session_manager=session_manager,
+                        )
+
+                        await tool.connect()
+                        await tool.call_tool("open_form", {}, chat_id="chat-1")
+                        await asyncio.wait_for(
+                            tool.call_tool("open_form", {}, chat_id="chat-2"), timeout=1
+                        )
+                        assert list(tool._pending_form_updates) == ["chat-1"]
+
+                        release.set()
+                        await tool.close()
+                        assert not tool._pending_form_updates
+
     @pytest.mark.asyncio
     async def test_call_tool_requires_connection(self, mock_token_provider):
         """Test that call_tool raises error when not connected."""
@@ -301,6 +672,30 @@ class TestD365MCPTool:
 
                         assert not tool.is_connected
 
+    @pytest.mark.asyncio
+    async def test_injected_token_provider_left_open(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that sessions and close() leave an injected token provider open."""
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                        )
+
+                        for _ in range(2):
+                            async with tool.session():
+                                assert tool.is_connected
+                            assert not tool.is_connected
+
+                        await tool.close()
+                        mock_token_provider.close.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_properties(self, mock_token_provider):
         """Test tool properties."""
@@ -362,6 +757,50 @@ class TestD365MCPToolRetry:
 
                         await tool.close()
 
+    @pytest.mark.asyncio
+    async def test_retries_on_gateway_status_and_httpx_errors(
+        self, mock_token_provider, mock_mcp_tool, mock_http_client
+    ):
+        """Test that 503 responses and httpx transport errors trigger retry."""
+        httpx = pytest.importorskip("httpx")
+        request = httpx.Request("POST", "https://test.operations.dynamics.com/mcp")
+        errors = [
+            httpx.HTTPStatusError(
+                "Service unavailable",
+                request=request,
+                response=httpx.Response(503, request=request),
+            ),
+            httpx.RemoteProtocolError("Server disconnected", request=request),
+        ]
+
+        async def mock_call_tool(name, args):
+            if errors:
+                raise errors.pop(0)
+            return {"success": True}
+
+        mock_mcp_tool.call_tool = mock_call_tool
+
+        with patch("src.mcp.d365_tool.MCP_AVAILABLE", True):
+            with patch("src.mcp.d365_tool.HTTPX_AVAILABLE", True):
+                with patch("src.mcp.d365_tool.MCPStreamableHTTPTool", return_value=mock_mcp_tool):
+                    with patch("src.mcp.d365_tool.AsyncClient", return_value=mock_http_client):
+                        from src.mcp.d365_tool import D365MCPTool
+
+                        tool = D365MCPTool(
+                            environment_url="https://test.operations.dynamics.com",
+                            token_provider=mock_token_provider,
+                            max_retries=3,
+                            retry_backoff_base=0.01,
+                        )
+
+                        await tool.connect()
+                        result = await tool.call_tool("test_tool", {})
+
+                        assert result["success"] is True
+                        assert tool.circuit_breaker.failure_count == 0
+
+                        await tool.close()
+
     @pytest.mark.asyncio
     async def test_gives_up_after_max_retries(
         self, mock_token_provider, mock_mcp_tool, mock_http_client
@@ -436,3 +875,89 @@ class TestD365MCPToolErrors:
                             await tool.call_tool("test_tool", {})
 
                         await tool.close()
+
+
+# ==================== Retry-After Parsing Tests ====================
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_delay_seconds(self):
+        """Test that delay-seconds values are used as-is."""
+        from src.mcp.d365_tool import _parse_retry_after
+
+        assert _parse_retry_after("7", default=5.0, maximum=30.0) == 7
+
+    def test_http_date(self):
+        """Test that HTTP-date values become seconds from now."""
+        from datetime import timezone
+        from email.utils import format_datetime
+        from src.mcp.d365_tool import _parse_retry_after
+
+        retry_at = format_datetime(
+            datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True
+        )
+
+        assert 0 < _parse_retry_after(retry_at, default=5.0, maximum=30.0) <= 10
+
+    def test_missing_or_malformed_uses_default(self):
+        """Test that missing or unparseable values fall back to the default."""
+        from src.mcp.d365_tool import _parse_retry_after
+
+        assert _parse_retry_after(None, default=5.0, maximum=30.0) == 5.0
+        assert _parse_retry_after("soon", default=5.0, maximum=30.0) == 5.0
+
+    def test_clamped_to_bounds(self):
+        """Test that waits are capped at the maximum and never negative."""
+        from src.mcp.d365_tool import _parse_retry_after
+
+        assert _parse_retry_after("86400", default=5.0, maximum=30.0) == 30.0
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", default=5.0, maximum=30.0) == 0.0
+
+
+# ==================== Bearer Auth Tests ====================
+
+class TestBearerAuth:
+    """Tests for the shared HTTP client's bearer auth flow."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_and_retries_once_on_401(self):
+        """Test that a 401 refreshes the token through a connected tool and retries."""
+        httpx = pytest.importorskip("httpx")
+        from src.mcp.d365_tool import _BearerAuth
+
+        auth = _BearerAuth("old-token")
+
+        async def refresh():
+            auth.token = "new-token"
+
+        tool = MagicMock()
+        tool.refresh_token = AsyncMock(side_effect=refresh)
+        auth.tools.add(tool)
+
+        request = httpx.Request("POST", "https://test.operations.dynamics.com/mcp")
+        flow = auth.async_auth_flow(request)
+
+        sent = await flow.__anext__()
+        assert sent.headers["Authorization"] == "Bearer old-token"
+
+        retried = await flow.asend(httpx.Response(401, request=sent))
+        assert retried.headers["Authorization"] == "Bearer new-token"
+        tool.refresh_token.assert_awaited_once()
+
+        with pytest.raises(StopAsyncIteration):
+            await flow.asend(httpx.Response(200, request=retried))
+
+    @pytest.mark.asyncio
+    async def test_passes_through_when_authorized(self):
+        """Test that a successful response is not retried."""
+        httpx = pytest.importorskip("httpx")
+        from src.mcp.d365_tool import _BearerAuth
+
+        auth = _BearerAuth("token")
+        request = httpx.Request("POST", "https://test.operations.dynamics.com/mcp")
+        flow = auth.async_auth_flow(request)
+
+        sent = await flow.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await flow.asend(httpx.Response(200, request=sent))
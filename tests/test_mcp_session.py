@@ -86,6 +86,42 @@ class TestMCPSessionState:
         assert "created_at" in data
         assert "last_accessed" in data
 
+    def test_to_dict_is_reused_until_session_changes(self):
+        """Test that to_dict() is rebuilt only when last_accessed or form_context is reassigned."""
+        from datetime import datetime, timezone
+        from src.mcp.session import MCPSessionState
+
+        session = MCPSessionState(
+            session_id="session-123",
+            chat_id="chat-456",
+            mcp_server_name="d365-erp",
+        )
+
+        data = session.to_dict()
+        assert session.to_dict() is data
+
+        session.last_accessed = datetime.now(timezone.utc)
+        touched = session.to_dict()
+        assert touched is not data
+        assert touched["last_accessed"] == session.last_accessed.isoformat()
+
+        session.form_context = {"SalesOrder": {}}
+        assert session.to_dict()["form_context"] == {"SalesOrder": {}}
+
+    def test_sessions_have_no_instance_dict(self):
+        """Test that sessions use slots, keeping per-session memory down."""
+        from src.mcp.session import MCPSessionState
+
+        session = MCPSessionState(
+            session_id="session-123",
+            chat_id="chat-456",
+            mcp_server_name="d365-erp",
+        )
+
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.unknown_field = True
+
     def test_from_dict_deserialization(self):
         """Test deserialization from dictionary."""
         from src.mcp.session import MCPSessionState
@@ -149,6 +185,20 @@ class TestMCPSessionManager:
         assert session.user_id == "user@example.com"
         assert session.session_id is not None
 
+    def test_session_ids_are_time_ordered(self):
+        """Test session IDs are UUIDv7 and sort by creation time."""
+        import uuid
+        from src.mcp import session as session_module
+
+        timestamps = [1_700_000_000_000_000_000, 1_700_000_001_000_000_000]
+        with patch.object(session_module, "_uuid7", None),                 patch.object(session_module.time, "time_ns", side_effect=timestamps):
+            first = session_module._new_session_id()
+            second = session_module._new_session_id()
+
+        assert uuid.UUID(first).version == 7
+        assert uuid.UUID(second).version == 7
+        assert first < second
+
     @pytest.mark.asyncio
     async def test_get_or_create_session_returns_cached(self, session_manager):
         """Test returning cached session on subsequent calls."""
@@ -225,6 +275,104 @@ class TestMCPSessionManager:
         # Should also warm up cache
         mock_cache.set.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_wait_for_persistence(
+        self, mock_cache, mock_persistence, session_config
+    ):
+        """Test that a Redis hit returns without waiting for the concurrent ADLS lookup."""
+        from src.mcp.session import MCPSessionManager
+
+        mock_cache.get = AsyncMock(return_value={
+            "session_id": "cached-session-123",
+            "chat_id": "chat-123",
+            "mcp_server_name": "d365-erp",
+            "created_at": "2025-01-15T10:00:00+00:00",
+            "last_accessed": "2025-01-15T11:00:00+00:00",
+        })
+        never = asyncio.Event()
+
+        async def slow_get(key):
+            await never.wait()
+
+        mock_persistence.get = AsyncMock(side_effect=slow_get)
+
+        manager = MCPSessionManager(
+            cache=mock_cache,
+            persistence=mock_persistence,
+            config=session_config,
+        )
+
+        session = await asyncio.wait_for(
+            manager.get_or_create_session(chat_id="chat-123", mcp_server_name="d365-erp"),
+            timeout=1.0,
+        )
+
+        assert session.session_id == "cached-session-123"
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_hit_is_refreshed_from_persistence(
+        self, mock_cache, mock_persistence, session_config
+    ):
+        """Test that a stale Redis session is served, then replaced by newer ADLS state."""
+        from src.mcp.session import MCPSessionManager
+
+        mock_cache.get = AsyncMock(return_value={
+            "session_id": "session-123",
+            "chat_id": "chat-123",
+            "mcp_server_name": "d365-erp",
+            "created_at": "2025-01-15T10:00:00+00:00",
+            "last_accessed": "2025-01-15T11:00:00+00:00",
+        })
+        mock_persistence.get = AsyncMock(return_value={
+            "session_id": "session-123",
+            "chat_id": "chat-123",
+            "mcp_server_name": "d365-erp",
+            "form_context": {"SalesOrder": {"quantity": 5}},
+            "created_at": "2025-01-15T10:00:00+00:00",
+            "last_accessed": "2025-01-15T12:00:00+00:00",
+        })
+
+        manager = MCPSessionManager(
+            cache=mock_cache,
+            persistence=mock_persistence,
+            config=session_config,
+        )
+
+        stale = await manager.get_or_create_session(chat_id="chat-123", mcp_server_name="d365-erp")
+        assert stale.form_context == {}
+
+        await asyncio.gather(*manager._revalidations)
+
+        refreshed = await manager.get_or_create_session(chat_id="chat-123", mcp_server_name="d365-erp")
+        assert refreshed.form_context == {"SalesOrder": {"quantity": 5}}
+        assert mock_cache.set.call_args.kwargs["ttl"] == 3600 + 300
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_hit_without_persistence_is_a_miss(self, mock_cache):
+        """Test that an expired Redis session isn't served when ADLS can't revalidate it."""
+        from src.mcp.session import MCPSessionConfig, MCPSessionManager
+
+        mock_cache.get = AsyncMock(return_value={
+            "session_id": "session-123",
+            "chat_id": "chat-123",
+            "mcp_server_name": "d365-erp",
+            "created_at": "2025-01-15T10:00:00+00:00",
+            "last_accessed": "2025-01-15T11:00:00+00:00",
+        })
+
+        manager = MCPSessionManager(
+            cache=mock_cache,
+            persistence=None,
+            config=MCPSessionConfig(enabled=True, session_ttl=3600, persist_sessions=False),
+        )
+
+        session = await manager.get_or_create_session(chat_id="chat-123", mcp_server_name="d365-erp")
+
+        assert session.session_id != "session-123"
+        assert not manager._revalidations
+        # Nothing to revalidate against, so Redis keeps sessions for session_ttl only
+        assert mock_cache.set.call_args.kwargs["ttl"] == 3600
+
     @pytest.mark.asyncio
     async def test_save_session(self, session_manager, mock_cache, mock_persistence):
         """Test saving session to cache and persistence."""
@@ -264,6 +412,59 @@ class TestMCPSessionManager:
         assert updated_session.form_context["SalesOrder"]["quantity"] == 100
         assert updated_session.form_context["_active_form"] == "SalesOrder"
 
+    @pytest.mark.asyncio
+    async def test_unchanged_form_context_is_not_saved(self, session_manager, mock_cache):
+        """Test repeating the current form state doesn't save the session again."""
+        session = await session_manager.get_or_create_session(
+            chat_id="chat-123",
+            mcp_server_name="d365-erp",
+        )
+        await session_manager.update_form_context(
+            session.session_id, "SalesOrder", {"quantity": 100, "customer": "ACME"}
+        )
+        mock_cache.set.reset_mock()
+
+        result = await session_manager.update_form_context(
+            session.session_id, "SalesOrder", {"quantity": 100}
+        )
+
+        assert result is True
+        mock_cache.set.assert_not_called()
+
+        await session_manager.update_form_context(
+            session.session_id, "SalesOrder", {"quantity": 200}
+        )
+        mock_cache.set.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_form_context_updates_are_persisted_in_batches(
+        self, mock_cache, mock_persistence
+    ):
+        """Test that form context changes within the flush interval share one ADLS write."""
+        import asyncio
+        from src.mcp.session import MCPSessionConfig, MCPSessionManager
+
+        manager = MCPSessionManager(
+            cache=mock_cache,
+            persistence=mock_persistence,
+            config=MCPSessionConfig(enabled=True, persist_flush_interval=0.01),
+        )
+        session = await manager.get_or_create_session(
+            chat_id="chat-123",
+            mcp_server_name="d365-erp",
+        )
+        mock_persistence.save.reset_mock()
+
+        await manager.update_form_context(session.session_id, "SalesOrder", {"quantity": 100})
+        await manager.update_form_context(session.session_id, "SalesOrder", {"customer": "ACME"})
+        mock_persistence.save.assert_not_called()
+
+        await asyncio.sleep(0.05)
+
+        mock_persistence.save.assert_called_once()
+        saved = mock_persistence.save.call_args[0][1]
+        assert saved["form_context"]["SalesOrder"] == {"quantity": 100, "customer": "ACME"}
+
     @pytest.mark.asyncio
     async def test_update_form_context_nonexistent_session(self, session_manager):
         """Test updating form context for non-existent session returns False."""
@@ -301,6 +502,22 @@ class TestMCPSessionManager:
         assert "SalesOrder" not in updated.form_context
         assert "PurchaseOrder" in updated.form_context
 
+    @pytest.mark.asyncio
+    async def test_clear_absent_form_context_skips_save(self, session_manager, mock_cache):
+        """Test clearing a form that isn't there doesn't save the session."""
+        session = await session_manager.get_or_create_session(
+            chat_id="chat-123",
+            mcp_server_name="d365-erp",
+        )
+        mock_cache.set.reset_mock()
+
+        result = await session_manager.clear_form_context(
+            session.session_id, form_name="SalesOrder"
+        )
+
+        assert result is True
+        mock_cache.set.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_clear_form_context_all_forms(self, session_manager):
         """Test clearing all form context."""
@@ -340,12 +557,13 @@ class TestMCPSessionManager:
         assert kwargs["chat_id"] == "chat-456"
         assert kwargs["user_id"] == "user@example.com"
         assert kwargs["form_context"]["SalesOrder"]["quantity"] == 100
+        assert session_manager.build_mcp_kwargs(session) is kwargs
 
     @pytest.mark.asyncio
     async def test_delete_session(self, session_manager, mock_cache, mock_persistence):
         """Test deleting a session from all layers."""
         # Create session first
-        await session_manager.get_or_create_session(
+        session = await session_manager.get_or_create_session(
             chat_id="chat-123",
             mcp_server_name="d365-erp",
         )
@@ -356,6 +574,7 @@ class TestMCPSessionManager:
         )
 
         assert result is True
+        assert await session_manager.get_session(session.session_id) is None
         mock_cache.delete.assert_called()
         mock_persistence.delete.assert_called()
 
@@ -381,6 +600,87 @@ class TestMCPSessionManager:
         chat1_sessions = await session_manager.list_sessions(chat_id="chat-1")
         assert len(chat1_sessions) == 2
 
+    @pytest.mark.asyncio
+    async def test_least_recently_used_sessions_are_evicted(
+        self, mock_cache, mock_persistence
+    ):
+        """Test that in-memory sessions are bounded, evicting the least recently used."""
+        from src.mcp.session import MCPSessionConfig, MCPSessionManager
+
+        manager = MCPSessionManager(
+            cache=mock_cache,
+            persistence=mock_persistence,
+            config=MCPSessionConfig(enabled=True, max_memory_sessions=2),
+        )
+
+        first = await manager.get_or_create_session(chat_id="chat-1", mcp_server_name="d365")
+        second = await manager.get_or_create_session(chat_id="chat-2", mcp_server_name="d365")
+        # Touch the first session so the second is least recently used
+        await manager.get_or_create_session(chat_id="chat-1", mcp_server_name="d365")
+        await manager.get_or_create_session(chat_id="chat-3", mcp_server_name="d365")
+
+        assert len(await manager.list_sessions()) == 2
+        assert await manager.get_session(first.session_id) is first
+        assert await manager.get_session(second.session_id) is None
+
+    @pytest.mark.asyncio
+    async def test_warm_loads_most_recent_sessions(self, mock_cache, session_config):
+        """Test warming loads recent persisted sessions into memory and Redis."""
+        from types import SimpleNamespace
+        from src.mcp.session import MCPSessionManager
+        from src.memory.persistence import ADLSPersistence, PersistenceConfig
+
+        blobs = [
+            ("threads/0000-chat-thread.json", 3),
+            ("threads/mcp_session:chat-new:d365-erp.json", 2),
+            ("threads/mcp_session:chat-old:d365-erp.json", 1),
+        ]
+
+        async def list_blobs(name_starts_with=""):
+            for name, day in sorted(blobs):
+                if name.startswith(name_starts_with):
+                    yield SimpleNamespace(
+                        name=name, size=2, last_modified=datetime(2025, 1, day, tzinfo=timezone.utc)
+                    )
+
+        persistence = ADLSPersistence(PersistenceConfig(enabled=True, account_name="test"))
+        persistence._container_client = MagicMock(list_blobs=list_blobs)
+        persistence._initialized = True
+        session_manager = MCPSessionManager(
+            cache=mock_cache, persistence=persistence, config=session_config
+        )
+
+        async def persisted(cache_key):
+            chat_id = cache_key.split(":")[1]
+            return {
+                "session_id": f"session-{chat_id}",
+                "chat_id": chat_id,
+                "mcp_server_name": "d365-erp",
+                "created_at": "2025-01-01T10:00:00+00:00",
+                "last_accessed": "2025-01-01T11:00:00+00:00",
+            }
+
+        persistence.get = AsyncMock(side_effect=persisted)
+
+        assert await session_manager.warm(limit=1) == 1
+
+        persistence.get.assert_awaited_once_with("mcp_session:chat-new:d365-erp")
+        mock_cache.set.assert_awaited_once()
+        session = await session_manager.get_session("session-chat-new")
+        assert session is not None
+        assert session.chat_id == "chat-new"
+
+    @pytest.mark.asyncio
+    async def test_warm_skips_malformed_sessions(self, session_manager, mock_cache, mock_persistence):
+        """Test a malformed persisted session is skipped rather than failing the warm."""
+        mock_persistence.list_recent_chats = AsyncMock(return_value=[
+            {"chat_id": "mcp_session:chat-bad:d365-erp", "last_modified": datetime(2025, 1, 1, tzinfo=timezone.utc)},
+        ])
+        mock_cache.get = AsyncMock(return_value={"chat_id": "chat-bad"})
+
+        assert await session_manager.warm(limit=5) == 0
+        mock_persistence.get.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_close_persists_sessions(
         self, mock_cache, mock_persistence, session_config
@@ -440,3 +740,18 @@ class TestMCPSessionConfig:
         assert config.session_ttl == 3600
         assert config.persist_sessions is True
         assert config.cache_prefix == "mcp_session:"
+
+
+class TestSessionAwareMCPTool:
+    """Tests for the session-aware tool wrapper."""
+
+    def test_rejects_non_stateful_server(self):
+        """Test that only stateful servers can be wrapped."""
+        from src.mcp.session_aware_tool import SessionAwareMCPTool
+
+        with pytest.raises(ValueError):
+            SessionAwareMCPTool(
+                mcp_tool=AsyncMock(),
+                session_manager=MagicMock(),
+                server_config={"name": "plain-mcp", "stateful": False},
+            )
@@ -8,13 +8,19 @@ import asyncio
 import pytest
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 # Import the modules we're testing
 from src.memory.cache import RedisCache, InMemoryCache, CacheConfig
 from src.memory.persistence import ADLSPersistence, PersistenceConfig
-from src.memory.manager import ChatHistoryManager, MemoryConfig, parse_memory_config
+from src.memory.manager import (
+    ChatHistoryManager,
+    MemoryConfig,
+    SESSION_LOCK_STRIPES,
+    parse_memory_config,
+)
 
 
 # =============================================================================
@@ -33,14 +39,18 @@ class MockRedisClient:
     
     async def get(self, key: str) -> Optional[str]:
         return self._store.get(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self._store.get(key) for key in keys]
     
     async def setex(self, key: str, ttl: int, value: str):
         self._store[key] = value
         self._ttls[key] = ttl
     
-    async def delete(self, key: str):
-        self._store.pop(key, None)
-        self._ttls.pop(key, None)
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._store.pop(key, None)
+            self._ttls.pop(key, None)
     
     async def ttl(self, key: str) -> int:
         return self._ttls.get(key, -2)
@@ -57,7 +67,7 @@ class MockRedisClient:
         if key in self._store:
             self._ttls[key] = ttl
     
-    def pipeline(self):
+    def pipeline(self, transaction: bool = True):
         return MockRedisPipeline(self)
     
     async def close(self):
@@ -135,6 +145,7 @@ class MockADLSContainer:
     def __init__(self):
         self._files: Dict[str, bytes] = {}
         self._metadata: Dict[str, dict] = {}
+        self._modified: Dict[str, datetime] = {}
     
     async def get_file_system_properties(self):
         return MagicMock()
@@ -145,13 +156,13 @@ class MockADLSContainer:
     def get_file_client(self, path: str):
         return MockADLSFileClient(self, path)
     
-    async def get_paths(self, path: str = ""):
-        for file_path in self._files.keys():
-            if file_path.startswith(path):
-                yield MagicMock(
+    async def list_blobs(self, name_starts_with: str = ""):
+        for file_path in sorted(self._files):
+            if file_path.startswith(name_starts_with):
+                yield SimpleNamespace(
                     name=file_path,
-                    content_length=len(self._files[file_path]),
-                    last_modified=datetime.now(timezone.utc)
+                    size=len(self._files[file_path]),
+                    last_modified=self._modified.get(file_path, datetime.now(timezone.utc))
                 )
 
 
@@ -315,6 +326,61 @@ class TestRedisCache:
         
         assert ttl == 600
 
+    @pytest.mark.asyncio
+    async def test_stdlib_fallback_stores_compact_json(self, cache_config):
+        cache = RedisCache(cache_config)
+        cache._client = MockRedisClient()
+        cache._initialized = True
+
+        with patch("src.memory.cache.orjson", None):
+            assert await cache.set("chat1", {"messages": [{"role": "user", "content": "a, b: c"}]}) is True
+            stored = cache._client._store[cache._make_key("chat1")]
+            result = await cache.get("chat1")
+            # Unsupported values fail the write, as with orjson
+            assert await cache.set("chat2", {"value": object()}) is False
+
+        assert stored == '{"messages":[{"role":"user","content":"a, b: c"}]}'
+        assert result == {"messages": [{"role": "user", "content": "a, b: c"}]}
+
+    @pytest.mark.asyncio
+    async def test_bulk_ttls_and_values(self, cache_config):
+        cache = RedisCache(cache_config)
+        cache._client = MockRedisClient()
+        cache._initialized = True
+
+        await cache.set("chat1", {"messages": ["one"]}, ttl=600)
+        await cache.set("chat2", {"messages": ["two"]}, ttl=300)
+
+        ttls = await cache.get_ttls(["chat1", "chat2", "missing"])
+        values = await cache.get_many(["chat1", "missing"])
+
+        assert ttls == {"chat1": 600, "chat2": 300, "missing": None}
+        assert values == {"chat1": {"messages": ["one"]}}
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, cache_config):
+        cache = RedisCache(cache_config)
+        cache._client = MockRedisClient()
+        cache._initialized = True
+
+        for chat_id in ("chat1", "chat2", "chat3"):
+            await cache.set(chat_id, {"messages": []})
+
+        assert await cache.delete_many(["chat1", "chat2"]) is True
+        assert await cache.list_keys() == ["chat3"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_metadata_skips_missing_chats(self, cache_config):
+        cache = RedisCache(cache_config)
+        cache._client = MockRedisClient()
+        cache._initialized = True
+
+        await cache.set("chat1", {"messages": []}, ttl=600)
+
+        metadata = await cache.get_metadata_many(["missing", "chat1"])
+
+        assert metadata == [{"chat_id": "chat1", "ttl_remaining": 600, "cached": True}]
+
 
 # =============================================================================
 # ADLSPersistence Tests (with mocks)
@@ -345,6 +411,57 @@ class TestADLSPersistence:
         assert result["messages"] == ["hello"]
         assert "_persisted_at" in result
     
+    @pytest.mark.asyncio
+    async def test_delete_many_batches_requests(self, persistence_config):
+        persistence = ADLSPersistence(persistence_config)
+        persistence._initialized = True
+        persistence._container_client = MagicMock()
+
+        async def delete_blobs(*paths, raise_on_any_failure=True):
+            async def responses():
+                for path in paths:
+                    yield MagicMock(status_code=404 if "missing" in path else 202)
+            return responses()
+
+        persistence._container_client.delete_blobs = AsyncMock(side_effect=delete_blobs)
+        chat_ids = [f"chat{i}" for i in range(300)] + ["missing"]
+
+        results = await persistence.delete_many(chat_ids)
+
+        assert persistence._container_client.delete_blobs.await_count == 2
+        first_batch = persistence._container_client.delete_blobs.await_args_list[0].args
+        assert len(first_batch) == 256
+        assert first_batch[0] == "threads/chat0.json"
+        assert results["missing"] is False
+        assert all(results[f"chat{i}"] for i in range(300))
+
+    @pytest.mark.asyncio
+    async def test_list_recent_chats_orders_by_last_modified(self, persistence_config):
+        persistence = ADLSPersistence(persistence_config)
+        container = MockADLSContainer()
+        persistence._container_client = container
+        persistence._initialized = True
+        folder = persistence_config.folder
+        for day, chat_id in [(1, "mcp_session:old:d365"), (3, "mcp_session:new:d365"), (2, "mcp_session:mid:d365"), (4, "chat-thread")]:
+            path = f"{folder}/{chat_id}.json"
+            container._files[path] = b"{}"
+            container._modified[path] = datetime(2025, 1, day, tzinfo=timezone.utc)
+
+        recent = await persistence.list_recent_chats("mcp_session:", limit=2)
+
+        assert [item["chat_id"] for item in recent] == ["mcp_session:new:d365", "mcp_session:mid:d365"]
+
+    @pytest.mark.asyncio
+    async def test_save_does_not_modify_caller_data(self, persistence_config):
+        persistence = ADLSPersistence(persistence_config)
+        persistence._container_client = MockADLSContainer()
+        persistence._initialized = True
+        
+        data = {"messages": ["hello"]}
+        await persistence.save("chat1", data)
+        
+        assert data == {"messages": ["hello"]}
+    
     @pytest.mark.asyncio
     async def test_exists(self, persistence_config):
         persistence = ADLSPersistence(persistence_config)
@@ -434,6 +551,36 @@ class TestChatHistoryManager:
         assert chat_id == "cached-session"
         assert len(thread._messages) == 1
     
+    @pytest.mark.asyncio
+    async def test_slow_lookup_does_not_block_other_chats(self, memory_config, mock_agent):
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence.config.enabled = False
+
+        release = asyncio.Event()
+        cache_get = manager._cache.get
+
+        async def get(chat_id):
+            if chat_id == "slow-chat":
+                await release.wait()
+            return await cache_get(chat_id)
+
+        manager._cache.get = get
+        slow = asyncio.create_task(manager.get_or_create_thread("slow-chat"))
+        await asyncio.sleep(0)
+
+        # A chat on another lock stripe; this would time out with one global lock
+        stripe = hash("slow-chat") % SESSION_LOCK_STRIPES
+        fast_chat = next(
+            f"chat-{i}" for i in range(1000) if hash(f"chat-{i}") % SESSION_LOCK_STRIPES != stripe
+        )
+        chat_id, _ = await asyncio.wait_for(manager.get_or_create_thread(fast_chat), timeout=1.0)
+        assert chat_id == fast_chat
+
+        release.set()
+        assert (await slow)[0] == "slow-chat"
+
     @pytest.mark.asyncio
     async def test_restore_from_adls_when_not_in_cache(self, memory_config, mock_agent):
         manager = ChatHistoryManager(memory_config)
@@ -496,6 +643,7 @@ class TestChatHistoryManager:
         assert result is True
         
         # Verify cached
+        await manager._flush_cache_writes()
         cached = await manager._cache.get("save-test")
         assert cached is not None
         assert len(cached["messages"]) == 1
@@ -577,6 +725,216 @@ class TestChatHistoryManager:
         assert "chat1" in chat_ids
         assert "chat2" in chat_ids
 
+    @pytest.mark.asyncio
+    async def test_merge_keeps_messages_missing_from_new_data(self, memory_config):
+        manager = ChatHistoryManager(memory_config)
+        existing = {"messages": [
+            {"role": "user", "content": "Hello", "timestamp": "t1"},
+            {"role": "assistant", "content": [{"text": "Hi"}], "timestamp": "t2"},
+            {"role": "user", "content": "Bye", "timestamp": "t3"},
+        ]}
+        new = {"messages": [
+            {"role": "user", "content": "Hello", "timestamp": "t1", "edited": True},
+            {"role": "user", "content": "New", "timestamp": "t4"},
+        ]}
+
+        merged = await manager._merge_thread_data(existing, new)
+
+        assert [m["content"] for m in merged["messages"]] == ["Hello", [{"text": "Hi"}], "Bye", "New"]
+        assert merged["messages"][0]["edited"] is True
+
+    @pytest.mark.asyncio
+    async def test_token_estimate_is_reused_until_thread_saved(self, memory_config, mock_agent):
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence.config.enabled = False
+
+        chat_id, thread = await manager.get_or_create_thread("tokens")
+        thread._messages.append({"role": "user", "content": "x" * 400})
+
+        with patch.object(manager, "_count_thread_tokens", wraps=manager._count_thread_tokens) as count:
+            await manager.needs_summarization(chat_id)
+            await manager.needs_summarization(chat_id)
+            assert count.call_count == 1
+
+            await manager.save_thread(chat_id, thread)
+            await manager.needs_summarization(chat_id)
+            assert count.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_token_estimate_uses_tiktoken_when_installed(self, memory_config):
+        manager = ChatHistoryManager(memory_config)
+        encoding = MagicMock()
+        encoding.encode_ordinary = MagicMock(return_value=[1, 2, 3])
+        fake_tiktoken = MagicMock()
+        fake_tiktoken.encoding_for_model = MagicMock(side_effect=KeyError("my-deployment"))
+        fake_tiktoken.get_encoding = MagicMock(return_value=encoding)
+
+        with patch("src.memory.manager.tiktoken", fake_tiktoken):
+            # Not loaded yet: the character heuristic, without touching tiktoken
+            assert manager.estimate_tokens("x" * 40) == 10
+            fake_tiktoken.get_encoding.assert_not_called()
+
+            await manager.load_tokenizer()
+            assert manager.estimate_tokens("some text to count") == 3
+            assert manager.estimate_tokens("some text to count") == 3
+
+        fake_tiktoken.get_encoding.assert_called_once_with("o200k_base")
+        encoding.encode_ordinary.assert_called_once_with("some text to count")
+
+    def test_token_estimate_falls_back_to_characters(self, memory_config):
+        manager = ChatHistoryManager(memory_config)
+
+        with patch("src.memory.manager.tiktoken", None):
+            assert manager.estimate_tokens("x" * 40) == 10
+
+    @pytest.mark.asyncio
+    async def test_summarization_folds_new_turns_into_prior_summary(self, memory_config, mock_agent):
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence.config.enabled = False
+
+        chat_id, thread = await manager.get_or_create_thread("resummarize")
+        thread._messages = [{
+            "role": "system",
+            "content": "[CONVERSATION SUMMARY]\nEarlier context\n[END SUMMARY]\n\nThe conversation continues below:",
+        }] + [{"role": "user", "content": f"turn {i}"} for i in range(7)]
+
+        manager.needs_summarization = AsyncMock(return_value=True)
+        manager._generate_summary = AsyncMock(return_value="Updated context")
+
+        assert await manager._summarize(chat_id) is True
+
+        _, new_messages, prior_summary = manager._generate_summary.await_args.args
+        assert [m["content"] for m in new_messages] == ["turn 0", "turn 1"]
+        assert prior_summary == "Earlier context"
+
+    @pytest.mark.asyncio
+    async def test_summarization_runs_in_background_once_per_chat(self, memory_config, mock_agent):
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence.config.enabled = False
+
+        chat_id, _ = await manager.get_or_create_thread("background-summary")
+        manager.needs_summarization = AsyncMock(return_value=True)
+        release = asyncio.Event()
+
+        async def summarize(chat_id, summarizer_agent):
+            await release.wait()
+            return True
+
+        manager._summarize = AsyncMock(side_effect=summarize)
+
+        assert await manager.summarize_if_needed(chat_id) is True
+        assert await manager.summarize_if_needed(chat_id) is False
+
+        release.set()
+        await manager._summary_queue.join()
+
+        manager._summarize.assert_awaited_once_with(chat_id, None)
+        assert manager._sessions[chat_id].summary_in_flight is False
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_session_is_evicted(self, memory_config, mock_agent):
+        memory_config.max_active_sessions = 2
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence.config.enabled = False
+
+        await manager.get_or_create_thread("lru-1")
+        await manager.get_or_create_thread("lru-2")
+        await manager.get_or_create_thread("lru-1")
+        await manager.get_or_create_thread("lru-3")
+
+        assert list(manager._sessions) == ["lru-1", "lru-3"]
+
+    @pytest.mark.asyncio
+    async def test_save_thread_writes_cache_in_background(self, memory_config, mock_agent):
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence.config.enabled = False
+
+        chat_id, thread = await manager.get_or_create_thread("background-cache")
+        release = asyncio.Event()
+        writes = []
+
+        async def slow_set(chat_id, thread_data):
+            await release.wait()
+            writes.append(len(thread_data["messages"]))
+            return True
+
+        manager._cache.set = AsyncMock(side_effect=slow_set)
+        for i in range(3):
+            thread._messages = thread._messages + [{"role": "user", "content": f"m{i}"}]
+            assert await manager.save_thread(chat_id, thread) is True
+
+        # Saves returned without waiting for the cache
+        assert writes == []
+
+        release.set()
+        await manager._flush_cache_writes()
+
+        # Saves made before the write ran coalesce into the latest data
+        assert writes == [3]
+
+    @pytest.mark.asyncio
+    async def test_turn_saved_to_summarized_thread_is_carried_over(self, memory_config, mock_agent):
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence.config.enabled = False
+
+        chat_id, thread = await manager.get_or_create_thread("in-flight")
+        thread._messages = [{"role": "user", "content": f"turn {i}"} for i in range(10)]
+        manager._generate_summary = AsyncMock(return_value="Earlier context")
+
+        # A request holds the thread while it is summarized, then saves its turn
+        assert await manager._summarize(chat_id) is True
+        thread._messages.append({"role": "user", "content": "NEW TURN"})
+        await manager.save_thread(chat_id, thread)
+        await manager._flush_cache_writes()
+
+        _, current = await manager.get_or_create_thread(chat_id)
+        contents = [m["content"] for m in current._messages]
+        assert contents[0].startswith("[CONVERSATION SUMMARY]")
+        assert contents[1:] == [f"turn {i}" for i in range(5, 10)] + ["NEW TURN"]
+        cached = await manager._cache.get(chat_id)
+        assert [m["content"] for m in cached["messages"]] == contents
+
+    @pytest.mark.asyncio
+    async def test_close_persists_sessions_concurrently(self, memory_config, mock_agent):
+        manager = ChatHistoryManager(memory_config)
+        manager.set_agent(mock_agent)
+        manager._cache = InMemoryCache(ttl=3600)
+        manager._persistence._container_client = MockADLSContainer()
+        manager._persistence._initialized = True
+
+        active = 0
+        peak = 0
+
+        async def persist(chat_id, thread_data):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        manager._persist_with_merge = AsyncMock(side_effect=persist)
+        for i in range(3):
+            await manager.get_or_create_thread(f"close-{i}")
+
+        await manager.close()
+
+        assert manager._persist_with_merge.await_count == 3
+        assert peak == 3
+
 
 # =============================================================================
 # Config Parsing Tests
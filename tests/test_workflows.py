@@ -162,6 +162,94 @@ class TestConditionEvaluator:
         assert evaluator.evaluate("output.data == null", output) is True
         assert evaluator.evaluate("output.value != null", output) is True
 
+    def test_evaluate_typed_entry_points(self):
+        """Test the dict and string specific evaluation entry points."""
+        from src.loaders.workflows import ConditionEvaluator
+
+        evaluator = ConditionEvaluator()
+
+        assert evaluator.evaluate_dict("output.route == 'billing'", {"route": "billing"}) is True
+        assert evaluator.evaluate_str("output.route == 'billing'", '{"route": "billing"}') is True
+        assert evaluator.evaluate_str("refund", "Customer wants a REFUND") is True
+        assert evaluator.evaluate_str("", "anything") is True
+
+    def test_compile_condition(self):
+        """Test compiled conditions are reusable and cached."""
+        from src.loaders.workflows import ConditionEvaluator
+
+        evaluator = ConditionEvaluator()
+
+        compiled = evaluator.compile("output.category == 'technical' and output.score > 0.5")
+        assert compiled({"category": "technical", "score": 0.9}) is True
+        assert compiled({"category": "technical", "score": 0.1}) is False
+        assert compiled({"category": "billing", "score": 0.9}) is False
+        assert evaluator.compile("output.category == 'technical' and output.score > 0.5") is compiled
+
+    def test_compile_pattern_two_and_fallback(self):
+        """Test compiled 'value in output.field' and substring fallback."""
+        from src.loaders.workflows import ConditionEvaluator
+
+        evaluator = ConditionEvaluator()
+
+        assert evaluator.compile("'error' in output.text")({"text": "an error occurred"}) is True
+        assert evaluator.compile("Escalate")({"text": "please escalate this"}) is True
+        assert evaluator.compile("")({}) is True
+
+    def test_prepare_output_caches_text_view(self):
+        """Test the lowercased output text is computed once per routing decision."""
+        from src.loaders.workflows import ConditionEvaluator
+
+        evaluator = ConditionEvaluator()
+
+        output = evaluator.prepare_output("Needs ESCALATION now")
+        assert output == {"text": "Needs ESCALATION now", "raw": "Needs ESCALATION now"}
+        assert evaluator.compile("escalation")(output) is True
+        assert evaluator._text_view[1] == "needs escalation now"
+
+        # A new decision discards the previous view
+        evaluator.prepare_output({"text": "other"})
+        assert evaluator._text_view is None
+
+    def test_compile_to_source_generates_function(self):
+        """Test generated condition functions walk nested fields and bind values safely."""
+        from src.loaders.workflows import ConditionEvaluator
+
+        evaluator = ConditionEvaluator()
+
+        compiled = evaluator.compile_to_source("output.user.role == 'admin' or 'vip' in output.tags")
+        assert compiled.__doc__ == "output.user.role == 'admin' or 'vip' in output.tags"
+        assert compiled({"user": {"role": "admin"}}) is True
+        assert compiled({"user": "admin", "tags": ["vip"]}) is True
+        assert compiled({"user": {"role": "guest"}, "tags": []}) is False
+
+        # Values are bound as data, never executed as code
+        injected = evaluator.compile_to_source("output.name == '__import__(\"os\")'")
+        assert injected({"name": '__import__("os")'}) is True
+
+    def test_compile_cache_is_bounded(self):
+        """Test the compiled condition cache evicts least recently used entries."""
+        from src.loaders.workflows import ConditionEvaluator
+
+        evaluator = ConditionEvaluator()
+        evaluator.CACHE_SIZE = 2
+
+        first = evaluator.compile("output.a == 1")
+        evaluator.compile("output.b == 2")
+        assert evaluator.compile("output.a == 1") is first
+        evaluator.compile("output.c == 3")
+
+        assert len(evaluator._cache) == 2
+        assert "output.b == 2" not in evaluator._cache
+        assert evaluator.compile("output.a == 1") is first
+
+    def test_evaluate_type_mismatch_returns_false(self):
+        """Test that evaluation errors are reported as a non-match."""
+        from src.loaders.workflows import ConditionEvaluator
+
+        evaluator = ConditionEvaluator()
+
+        assert evaluator.evaluate("output.score > 5", {"score": "high"}) is False
+
 
 class TestConditionalEdge:
     """Tests for ConditionalEdge."""
@@ -298,6 +386,73 @@ class TestWorkflowManager:
 
         assert result == "Default"
 
+    def test_agents_and_clients_are_shared(self):
+        """Test identical agent definitions reuse one ChatAgent and model client."""
+        from src.loaders.workflows import WorkflowManager
+
+        registry = MagicMock()
+        manager = WorkflowManager(MagicMock(), model_registry=registry)
+
+        with patch("src.loaders.workflows.ChatAgent") as mock_agent, \
+             patch("src.models.providers.ModelFactory.create_client") as mock_create:
+            mock_agent.side_effect = lambda **kwargs: MagicMock(**kwargs)
+            config = {"name": "Writer", "instructions": "Write.", "model": "gpt-4o"}
+
+            first = manager._get_or_create_agent(config, "Writer")
+            second = manager._get_or_create_agent(dict(config), "Writer")
+            other = manager._get_or_create_agent(
+                {"name": "Editor", "instructions": "Edit.", "model": "gpt-4o"}, "Editor"
+            )
+
+        assert first is second
+        assert other is not first
+        assert mock_agent.call_count == 2
+        assert mock_create.call_count == 1
+
+    def test_evaluate_next_agent_default_edge_is_fallback_only(self):
+        """Test a higher-priority unconditional edge does not shadow conditions."""
+        from src.loaders.workflows import WorkflowManager, ConditionalEdge
+
+        mock_client = MagicMock()
+        manager = WorkflowManager(mock_client)
+
+        manager._workflow_edges["test_workflow"] = [
+            ConditionalEdge("Triage", "Default", None, 5),
+            ConditionalEdge("Triage", "TechSupport", "output.category == 'technical'", 1),
+        ]
+
+        assert manager.evaluate_next_agent(
+            "test_workflow", "Triage", {"category": "technical"}
+        ) == "TechSupport"
+        assert manager.evaluate_next_agent(
+            "test_workflow", "Triage", {"category": "billing"}
+        ) == "Default"
+
+    def test_evaluate_next_agent_uses_outgoing_index(self):
+        """Test routing only considers edges from the current agent."""
+        from src.loaders.workflows import WorkflowManager, ConditionalEdge
+
+        mock_client = MagicMock()
+        manager = WorkflowManager(mock_client)
+
+        manager._workflow_edges["test_workflow"] = [
+            ConditionalEdge("A", "B", "output.go == true", 1),
+            ConditionalEdge("B", "C", None, 0),
+        ]
+
+        assert manager.evaluate_next_agent("test_workflow", "A", {"go": True}) == "B"
+        assert manager.evaluate_next_agent("test_workflow", "B", {"go": False}) == "C"
+        assert manager.evaluate_next_agent("test_workflow", "C", {}) is None
+
+        # B has a single unconditional edge and skips condition evaluation
+        _, single_successors = manager._get_outgoing_index("test_workflow")
+        assert single_successors == {"B": "C"}
+
+        # Replacing the edge list rebuilds the index
+        manager._workflow_edges["test_workflow"] = [ConditionalEdge("C", "A", None, 0)]
+        assert manager.evaluate_next_agent("test_workflow", "C", {}) == "A"
+        assert manager.evaluate_next_agent("test_workflow", "A", {"go": True}) is None
+
     def test_get_workflow_info(self):
         """Test getting workflow information."""
         from src.loaders.workflows import WorkflowManager, ConditionalEdge